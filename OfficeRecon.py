@@ -2,18 +2,17 @@ import customtkinter as ctk
 from tkinter import filedialog, messagebox, Menu
 import threading
 import sys
-import io
 import os
 import subprocess
 import platform
-import zipfile
-import tempfile
 import datetime
+import time
 from pathlib import Path
 import urllib.request
 import json
-import ctypes
-import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
 
 # --- CRITICAL FIX FOR PYINSTALLER + OLETOOLS ---
 # Olevba tries to write to stdout/stderr. In --windowed mode, these are None.
@@ -26,17 +25,31 @@ class NullWriter:
 if sys.stdout is None: sys.stdout = NullWriter()
 if sys.stderr is None: sys.stderr = NullWriter()
 
+# Analyzer output is captured per scan thread (see utils.helpers.capture_output)
+from utils.helpers import install_stdout_router, capture_output, emit_finding
+install_stdout_router()
+
 # Modular Imports
 from gui.table import ForensicTable
 from gui.report import ReportWindow
 from utils.manual import MANUAL_TEXT
 from utils.exporter import export_to_excel
-from analyzers.batch import BatchAnalyzer
+from analyzers.batch import BatchAnalyzer, scan_task
 from core.loader import DocLoader
+from core.watchdog import ScanTimeout, ANALYZER_TIMEOUT
+from core.findings import Report, FILESYSTEM
+from core.result_cache import get_cache, DEFAULT_CACHE_PATH
+from core.manifest import FolderManifest
+from core.discovery import iter_candidates
+from core.pipeline import Pipeline, Channel, StageStats, POLL_INTERVAL
+from core.hashing import safe_hash_file, safe_hash_source
+from core.nested import open_nested, load_nested, source_name, join_nested, split_nested, is_nested, MEMBER_SEP
+from core.containers import expand, provenance, is_archive, is_document, member_label
+from core.verification import verify_rows, plan_progress, hash_row_source, compare_digests, PASS, FAIL, ERROR, SKIP, VERIFY_WORKERS
 
 # Analyzers
 from analyzers.origin import OriginAnalyzer
-from analyzers.metadata import MetadataAnalyzer
+from analyzers.metadata import MetadataAnalyzer, FileSystemAnalyzer
 from analyzers.rsid import RSIDAnalyzer
 from analyzers.threats import ThreatScanner
 from analyzers.macros import MacroScanner
@@ -45,7 +58,7 @@ from analyzers.authors import AuthorAnalyzer
 from analyzers.extended import ExtendedAnalyzer
 from analyzers.embeddings import EmbeddingAnalyzer
 from analyzers.pptx_deep import PPTXDeepAnalyzer
-from analyzers.exiftool_scan import ExifToolScanner
+from analyzers.exiftool_scan import ExifToolScanner, exif_columns, EXIFTOOL_BATCH
 # New Forensic Analyzers (v1.1+)
 from analyzers.track_changes import TrackChangesAnalyzer
 from analyzers.comments import CommentAnalyzer
@@ -70,7 +83,12 @@ from analyzers.enhanced_metadata import EnhancedMetadataAnalyzer
 
 ctk.set_appearance_mode("Dark")  
 ctk.set_default_color_theme("blue")
-MAX_UNCOMPRESSED_SIZE = 250 * 1024 * 1024
+# Batch scan worker processes, and how many files may be queued on them at once
+SCAN_WORKERS = os.cpu_count() or 4
+MAX_IN_FLIGHT = SCAN_WORKERS * 4
+HASH_WORKERS = 4          # I/O threads reading and hashing ahead of the analysis workers
+RENDER_BATCH = 500        # Rows added to the table per UI tick
+RENDER_INTERVAL_MS = 150
 VERSION = "1.3.0" 
 
 class OfficeReconApp(ctk.CTk):
@@ -142,6 +160,8 @@ class OfficeReconApp(ctk.CTk):
         tools_menu = TkMenu(menubar, tearoff=0)
         menubar.add_cascade(label="Tools", menu=tools_menu)
         tools_menu.add_command(label="View Logs", command=self.show_log_window)
+        tools_menu.add_command(label="Prune Result Cache", command=self.prune_result_cache)
+        tools_menu.add_command(label="Clear Result Cache", command=self.clear_result_cache)
         
         # Help menu
         help_menu = TkMenu(menubar, tearoff=0)
@@ -154,7 +174,7 @@ class OfficeReconApp(ctk.CTk):
     def _init_sidebar(self):
         sb = ctk.CTkFrame(self, width=220, corner_radius=0)
         sb.grid(row=0, column=0, sticky="nsew")
-        sb.grid_rowconfigure(9, weight=1)
+        sb.grid_rowconfigure(12, weight=1)
 
         logo = ctk.CTkFrame(sb, fg_color="transparent")
         logo.grid(row=0, column=0, padx=20, pady=20, sticky="nw")
@@ -165,13 +185,28 @@ class OfficeReconApp(ctk.CTk):
         
         ctk.CTkButton(sb, text="LOAD FOLDER", command=self.load_batch_folder, font=ctk.CTkFont(weight="bold"), fg_color="#1F6AA5", hover_color="#144870").grid(row=2, column=0, padx=20, pady=10, sticky="ew")
         ctk.CTkButton(sb, text="Load File", command=self.load_target_file, fg_color="transparent", border_width=2, text_color=("gray10", "#DCE4EE")).grid(row=3, column=0, padx=20, pady=10, sticky="ew")
-        ctk.CTkButton(sb, text="Verify All MD5", command=self.verify_all_files, fg_color="#FF8C00", hover_color="#CC7000").grid(row=4, column=0, padx=20, pady=10, sticky="ew")
+        ctk.CTkButton(sb, text="Verify All Hashes", command=self.verify_all_files, fg_color="#FF8C00", hover_color="#CC7000").grid(row=4, column=0, padx=20, pady=10, sticky="ew")
         ctk.CTkButton(sb, text="EXPORT XLSX", command=self.export_data_wrapper, font=ctk.CTkFont(weight="bold"), fg_color="#2E7D32", hover_color="#1B5E20").grid(row=5, column=0, padx=20, pady=20, sticky="ew")
 
         ctk.CTkLabel(sb, text="SCAN SETTINGS", text_color="#777", font=ctk.CTkFont(size=11, weight="bold")).grid(row=6, column=0, padx=20, pady=(20,5), sticky="w")
         self.deep_scan_var = ctk.StringVar(value="off")
         self.switch_deep = ctk.CTkSwitch(sb, text="Auto-Deep Scan", variable=self.deep_scan_var, onvalue="on", offvalue="off", font=("Segoe UI", 12))
-        self.switch_deep.grid(row=7, column=0, padx=20, pady=(10,20), sticky="ew")
+        self.switch_deep.grid(row=7, column=0, padx=20, pady=(10,10), sticky="ew")
+        # Triage: central directory only, for ranking large corpora before deep scans
+        self.triage_var = ctk.StringVar(value="off")
+        self.switch_triage = ctk.CTkSwitch(sb, text="Fast Triage", variable=self.triage_var, onvalue="on", offvalue="off", font=("Segoe UI", 12))
+        self.switch_triage.grid(row=8, column=0, padx=20, pady=10, sticky="ew")
+        self.triage_props_var = ctk.StringVar(value="off")
+        self.switch_triage_props = ctk.CTkSwitch(sb, text="Triage: Read Properties", variable=self.triage_props_var, onvalue="on", offvalue="off", font=("Segoe UI", 12))
+        self.switch_triage_props.grid(row=9, column=0, padx=20, pady=10, sticky="ew")
+        # Reuse rows and reports of unchanged files (keyed by MD5 + analyzer version)
+        self.cache_var = ctk.StringVar(value="on")
+        self.switch_cache = ctk.CTkSwitch(sb, text="Reuse Cached Results", variable=self.cache_var, onvalue="on", offvalue="off", font=("Segoe UI", 12))
+        self.switch_cache.grid(row=10, column=0, padx=20, pady=10, sticky="ew")
+        # Folder rescans skip files whose size/mtime/inode are unchanged since the last scan
+        self.incremental_var = ctk.StringVar(value="on")
+        self.switch_incremental = ctk.CTkSwitch(sb, text="Incremental Rescan", variable=self.incremental_var, onvalue="on", offvalue="off", font=("Segoe UI", 12))
+        self.switch_incremental.grid(row=11, column=0, padx=20, pady=(10,20), sticky="ew")
 
     def _init_table_area(self):
         container = ctk.CTkFrame(self, fg_color="transparent")
@@ -194,8 +229,10 @@ class OfficeReconApp(ctk.CTk):
             {"key": "threats", "label": "Attention", "width": 300},
             {"key": "deep_output", "label": "Deep Scan Status", "width": 150}, 
             {"key": "md5", "label": "MD5 Hash", "width": 250},
+            {"key": "sha256", "label": "SHA-256", "width": 450},
             {"key": "is_duplicate", "label": "Duplicate", "width": 80}, 
             {"key": "full_path", "label": "Full Path", "width": 400},
+            {"key": "provenance", "label": "Found In", "width": 300},
             {"key": "hidden_text", "label": "Hidden", "width": 150},
             {"key": "author", "label": "Creator", "width": 150},
             {"key": "last_mod_by", "label": "Last Mod By", "width": 150},
@@ -220,6 +257,10 @@ class OfficeReconApp(ctk.CTk):
             {"key": "slides", "label": "Sld", "width": 60},
             {"key": "words", "label": "Words", "width": 80},
             {"key": "media_count", "label": "Media", "width": 60},
+            {"key": "exif_mime", "label": "MIME (ExifTool)", "width": 200},
+            {"key": "exif_app_version", "label": "App Ver (ExifTool)", "width": 120},
+            {"key": "exif_company", "label": "Company (ExifTool)", "width": 150},
+            {"key": "exif_warning", "label": "ExifTool Warning", "width": 200},
             {"key": "size", "label": "Size", "width": 80}
         ]
 
@@ -243,12 +284,6 @@ class OfficeReconApp(ctk.CTk):
     def safe_status(self, text):
         if self.running: self.after(0, lambda: self.status_var.set(text))
 
-    def safe_table_add(self, row_data):
-        if self.running: self.after(0, lambda: self.table.add_row(row_data))
-
-    def safe_table_render(self):
-        if self.running: self.after(0, lambda: self.table.filter(self.search_var.get()))
-
     def on_search_change(self, *args):
         self.table.filter(self.search_var.get())
 
@@ -261,7 +296,11 @@ class OfficeReconApp(ctk.CTk):
             self.details_box.insert("end", "=== 1. IDENTITY & THREATS ===\n\n", "header")
             self._write_kv("Filename", row.get("filename"))
             self._write_kv("Full Path", row.get("full_path"))
+            if row.get("provenance"):
+                self._write_kv("Found In", row.get("provenance"))
             self._write_kv("MD5 Hash", row.get("md5"))
+            self._write_kv("SHA-1", row.get("sha1"))
+            self._write_kv("SHA-256", row.get("sha256"))
             self._write_kv("Verdict", row.get("verdict"))
             self._write_kv("Attention", row.get("threats"))
             if row.get("is_duplicate") == "X":
@@ -274,29 +313,18 @@ class OfficeReconApp(ctk.CTk):
             self._write_kv("Modified (Meta)", row.get("meta_modified"))
             self._write_kv("Software", row.get("generator"))
             self._write_kv("OS Platform", row.get("platform"))
+            self._write_kv("Company (ExifTool)", row.get("exif_company"))
+            self._write_kv("ExifTool Warning", row.get("exif_warning"))
             
-            deep_data = row.get('deep_output_raw', '')
-            if deep_data:
+            report = row.get('deep_report')
+            if report:
                 self.details_box.insert("end", "\n" + "="*60 + "\n", "sep")
                 self.details_box.insert("end", "=== 3. DEEP FORENSIC REPORT ===\n", "header")
                 self.details_box.insert("end", "="*60 + "\n\n", "sep")
                 
-                # Color code [WARN] entries in yellow (except speaker notes section)
-                lines = deep_data.split('\n')
-                in_speaker_notes = False
-                for line in lines:
-                    # Track if we're in the speaker notes section
-                    if '[INFO] Extracted' in line and 'speaker notes' in line:
-                        in_speaker_notes = True
-                    elif line.startswith('[') and not line.startswith(' '):
-                        # New section started, exit speaker notes
-                        in_speaker_notes = False
-                    
-                    # Color [WARN] entries yellow, but not in speaker notes section
-                    if line.startswith('[WARN]') and not in_speaker_notes:
-                        self.details_box.insert("end", line + '\n', "warn")
-                    else:
-                        self.details_box.insert("end", line + '\n')
+                # Rendered from the finding records; alerts in red, warnings in yellow
+                for f in report:
+                    self.details_box.insert("end", f.render() + '\n', {'alert': "alert", 'warn': "warn"}.get(f.severity))
             else:
                 self.details_box.insert("end", "\n" + "="*60 + "\n", "sep")
                 self.details_box.insert("end", "[INFO] Deep Scan data not loaded. Double-click file or enable 'Auto-Deep Scan'.", "info")
@@ -324,9 +352,12 @@ class OfficeReconApp(ctk.CTk):
         if not path: return
         path = os.path.normpath(path)
         self.log_event("SELECT", f"Folder: {path}")
-        self.status_var.set("Indexing file system... This may take time.")
-        self.progress.grid(row=2, column=0, columnspan=2, sticky="ew"); self.progress.start()
-        threading.Thread(target=self._discover_files, args=(path,)).start()
+        # Discovery streams candidates straight into the scan; no separate indexing pass
+        candidates = iter_candidates(path, on_skip=self._log_discovery_skip, should_stop=lambda: not self.running)
+        self.run_scan(candidates, root=path)
+
+    def _log_discovery_skip(self, reason, path):
+        self.log_event("SKIP", f"{reason}: {os.path.basename(path)}")
 
     def load_target_file(self):
         path = filedialog.askopenfilename()
@@ -335,109 +366,440 @@ class OfficeReconApp(ctk.CTk):
             self.log_event("SELECT", f"File: {path}")
             self.run_scan([path])
 
-    def _is_cloud_placeholder(self, filepath):
-        """Check if file is a cloud placeholder WITHOUT triggering download."""
-        try:
-            # Windows-specific check using file attributes
-            FILE_ATTRIBUTE_RECALL_ON_DATA_ACCESS = 0x00400000
-            FILE_ATTRIBUTE_RECALL_ON_OPEN = 0x00040000
-            FILE_ATTRIBUTE_OFFLINE = 0x00001000
-            FILE_ATTRIBUTE_SPARSE_FILE = 0x00000200
-            
-            attrs = ctypes.windll.kernel32.GetFileAttributesW(filepath)
-            
-            if attrs == -1:  # INVALID_FILE_ATTRIBUTES
-                return True
-            
-            # Check for cloud placeholder attributes
-            if attrs & FILE_ATTRIBUTE_RECALL_ON_DATA_ACCESS:
-                return True
-            if attrs & FILE_ATTRIBUTE_RECALL_ON_OPEN:
-                return True
-            if attrs & FILE_ATTRIBUTE_OFFLINE:
-                return True
-                
-        except Exception:
-            pass
-        return False
-    
-    def _discover_files(self, path):
-        files = []
-        try:
-            for root, _, filenames in os.walk(path):
-                if not self.running: return 
-                for f in filenames:
-                    if f.lower().endswith(('.docx', '.odt', '.xlsx', '.pptx', '.zip', '.ods', '.odp')) and not f.startswith('~$'):
-                        full_path = os.path.join(root, f)
-                        
-                        # FIRST: Check if it's a cloud placeholder using Windows API
-                        if self._is_cloud_placeholder(full_path):
-                            self.log_event("SKIP", f"Skipped cloud placeholder: {f}")
-                            continue
-                        
-                        # Skip symbolic links and inaccessible files
-                        try:
-                            if os.path.islink(full_path):
-                                self.log_event("SKIP", f"Skipped symbolic link: {f}")
-                                continue
-                            
-                            files.append(os.path.normpath(full_path))
-                        except (OSError, PermissionError) as e:
-                            self.log_event("SKIP", f"Cannot access {f}: {e}")
-                            continue
-            self.log_event("INDEX", f"Found {len(files)} potential targets.")
-            self.after(0, lambda: self.run_scan(files))
-        except Exception as e:
-            self.log_event("ERROR", f"File discovery failed: {e}")
-            self.safe_status(f"Index Error: {e}")
-
-    def run_scan(self, files):
+    def run_scan(self, files, root=None):
+        """
+        Scan `files`: a list of paths, or a stream of (path, stat_key) from
+        discovery. `root` is the evidence folder (enables incremental rescans).
+        """
         self.table.clear()
         self.progress.stop(); self.progress.grid_forget()
-        self.status_var.set(f"Scanning {len(files)} files...")
-        self.log_event("SCAN", f"Starting batch analysis on {len(files)} items.")
-        threading.Thread(target=self._scan_thread, args=(files,), daemon=True).start()
-
-    def _scan_thread(self, files):
-        scanner = BatchAnalyzer()
-        seen_hashes = set()
+        if root:
+            self.status_var.set(f"Scanning {root} (indexing as we go)...")
+            self.log_event("SCAN", f"Starting batch analysis of folder: {root}")
+        else:
+            self.status_var.set(f"Scanning {len(files)} files...")
+            self.log_event("SCAN", f"Starting batch analysis on {len(files)} items.")
+        threading.Thread(target=self._scan_thread, args=(files, root), daemon=True).start()
+
+    def _scan_thread(self, files, root=None):
+        triage_mode = self.triage_var.get() == "on"
+        task_options = {'triage': triage_mode, 'triage_props': self.triage_props_var.get() == "on",
+                        'cache_path': self._cache_path()}
         hash_registry = {} 
         self.skipped_count = 0 
         self.indexed_count = 0
-        deep_mode = self.deep_scan_var.get() == "on"
-        
-        for i, f in enumerate(files):
-            if not self.running: break 
-            self.safe_status(f"Processing {i+1}/{len(files)}: {os.path.basename(f)}")
-            ext = os.path.splitext(f)[1].lower()
-            if ext == ".zip": 
-                added = self._process_zip(f, scanner, seen_hashes, hash_registry, deep_mode)
-                if added == 0: self.skipped_count += 1
-                else: self.indexed_count += added
-            else: 
-                if self._process_file(f, scanner, seen_hashes, hash_registry, deep_mode): self.indexed_count += 1
-                else: self.skipped_count += 1
-            if i % 10 == 0: self.safe_table_render()
-
-        self.safe_table_render()
+        self._count_lock = threading.Lock()
+        self._scan_rows = {}  # source path -> rows it produced this run
+        # Identical content is analyzed (and deep-scanned) once per run: the hash
+        # stage claims each MD5 for the first file that has it, later copies wait
+        # for that row and get its findings (see _fan_out_copies)
+        self._claimed_md5 = set()
+        self._claim_lock = threading.Lock()
+        self._deep_reports = {}  # md5 -> content findings of this run's deep scans
+        # Triage is a first pass; deep scans run later on the rows that matter
+        deep_mode = self.deep_scan_var.get() == "on" and not triage_mode
+        if triage_mode: self.log_event("SCAN", "Fast triage: central directory only, no hashing.")
+
+        # Staged pipeline: discover -> hash -> analyze -> (deep) -> exiftool -> render, with
+        # bounded channels in between so a slow stage throttles the ones feeding it
+        pipe = Pipeline(lambda: not self.running)
+        discover_stats = pipe.stage("Discover")
+        hash_stats = pipe.stage("Hash", show_bytes=True) if not triage_mode else StageStats("Hash")
+        analyze_stats = pipe.stage("Analyze")
+        deep_stats = pipe.stage("Deep") if deep_mode else None
+        exif_stats = pipe.stage("ExifTool") if not triage_mode else None
+        render_stats = pipe.stage("Render")
+        to_hash = pipe.channel()
+        to_analyze = pipe.channel(producers=HASH_WORKERS)
+        # Finished rows come from the analysis workers, from result-cache hits in
+        # the hash stage and, on incremental rescans, straight from discovery
+        analyzed = pipe.channel(producers=HASH_WORKERS + 2)
+        to_render = pipe.channel()
+        to_exif = pipe.channel() if exif_stats else to_render
+        rendered = threading.Event()
+
+        items = ((f, None) if isinstance(f, str) else f for f in files)
+
+        # Incremental rescan: only new or modified files (by size/mtime/inode) are analyzed
+        manifest = None
+        if root and self.incremental_var.get() == "on" and not triage_mode:
+            manifest = FolderManifest(root)
+            changes = manifest.begin()
+            items = self._incremental_filter(items, manifest, changes, analyzed)
+
+        pipe.spawn(self._discover_stage, items, to_hash, analyzed, discover_stats, name="scan-discover")
+        for i in range(HASH_WORKERS):
+            pipe.spawn(self._hash_stage, to_hash, to_analyze, analyzed, hash_stats, task_options, name=f"scan-hash-{i}")
+        pipe.spawn(self._analyze_stage, to_analyze, analyzed, analyze_stats, task_options, name="scan-analyze")
+        if exif_stats: pipe.spawn(self._exiftool_stage, to_exif, to_render, exif_stats, name="scan-exiftool")
+        self.after(0, self._render_stage, pipe, to_render, render_stats, rendered)
+
+        # This thread finishes rows in arrival order: duplicate flags and deep scans.
+        # Duplicate flags are symmetric (every copy gets "X"), so the result
+        # does not depend on which worker finishes first.
+        for kind, path, member, d in self._fan_out_copies(analyzed):
+            if kind == 'restored':
+                self._restore_row(d, hash_registry, deep_mode)
+            else:
+                self._finish_row(d, path, member, hash_registry, deep_mode)
+                if kind == 'copy': self.log_event("INDEXED", f"{'Extracted' if member else 'File'}: {member or os.path.basename(path)} (same content as an analyzed file, MD5 {d['md5']})")
+                elif member: self.log_event("INDEXED", f"Extracted: {member} (Source: {os.path.basename(path)})")
+                else: self.log_event("INDEXED", f"File: {os.path.basename(path)}")
+            if deep_stats: deep_stats.add()
+            self.indexed_count += 1
+            if not to_exif.put(d): break
+        to_exif.close()
+        pipe.join()
+        # Completion is reported once the UI has taken the last batch
+        while self.running and not rendered.wait(POLL_INTERVAL): pass
+
+        if manifest is not None:
+            # A cancelled run leaves the manifest as it was, so nothing is skipped wrongly
+            if self.running:
+                manifest.finish(changes)
+                self._log_changes(root, changes)
+                manifest.forget(changes.removed)
+                manifest.record({p: (changes.keys.get(p), rows) for p, rows in self._scan_rows.items()})
+            manifest.close()
+        if not self.running: return
+
         final_msg = f"Scan Complete. {self.indexed_count} indexed. {self.skipped_count} skipped/empty."
+        if manifest is not None: final_msg += f" Changes: {changes.summary()}."
+        self.log_event("PIPELINE", pipe.status())
         self.safe_status(final_msg)
         self.log_event("COMPLETE", final_msg)
 
-    def _process_file(self, f, scanner, seen_hashes, hash_registry, deep_mode):
+    def _log_changes(self, root, changes):
+        """Change summary of an incremental rescan (per-file detail goes to the activity log)."""
+        for label, paths in (("ADDED", changes.added), ("MODIFIED", changes.modified), ("REMOVED", changes.removed)):
+            for p in paths: self.log_event(label, p)
+        msg = f"Rescan of {os.path.basename(root) or root}: {changes.summary()}."
+        self.log_event("RESCAN", msg)
+        self.safe_status(msg)
+
+    def _incremental_filter(self, items, manifest, changes, analyzed):
+        """Pass on new/modified files; unchanged ones get their previous rows back without being read."""
+        for path, key in items:
+            if manifest.classify(changes, path, key) != 'unchanged':
+                yield (path, key)
+                continue
+            for d in manifest.rows(path):
+                if not analyzed.put(('restored', path, None, d)): return
+
+    def _fan_out_copies(self, analyzed):
+        """
+        Items of the analyzed channel, with each 'duplicate' (a file or nested
+        member whose MD5 was claimed by another, carrying only its digests)
+        turned into a 'copy' row once the row of the first one with that
+        content is in.
+        """
+        scanner = BatchAnalyzer()
+        unique = {}   # md5 -> worker row (threats still a list), the template for copies
+        waiting = {}  # md5 -> [(path, member, digests)] of copies that arrived before it
+        for kind, path, member, d in analyzed:
+            if kind == 'failed':
+                for copy_path, copy_member, _ in waiting.pop(d, []):
+                    self.log_event("SKIP", f"{copy_member or os.path.basename(copy_path)}: Same content as {member or os.path.basename(path)}, which could not be analyzed")
+                    self._count_skip()
+                continue
+            if kind == 'duplicate':
+                md5 = d['md5']
+                if md5 in unique:
+                    copy = self._copy_row(scanner, unique[md5], path, member, d)
+                    if copy is not None: yield ('copy', path, member, copy)
+                else:
+                    waiting.setdefault(md5, []).append((path, member, d))
+                continue
+            md5 = d.get('md5')
+            if kind == 'scanned' and md5 in self._claimed_md5:
+                unique[md5] = dict(d, threats=list(d.get('threats', [])))
+            yield (kind, path, member, d)
+            if md5 in unique:
+                for copy_path, copy_member, digests in waiting.pop(md5, []):
+                    copy = self._copy_row(scanner, unique[md5], copy_path, copy_member, digests)
+                    if copy is not None: yield ('copy', copy_path, copy_member, copy)
+        if self.running:
+            for copies in waiting.values():
+                for copy_path, copy_member, _ in copies:
+                    self.log_event("SKIP", f"{copy_member or os.path.basename(copy_path)}: Same content as a file that could not be analyzed")
+                    self._count_skip()
+
+    def _copy_row(self, scanner, row, path, member, digests):
+        """Row of a copy from the row of the first file with its content (None if the copy is unreadable)."""
+        if member is None:
+            return scanner.copy_row(row, path, digests)
         try:
-            # Additional safety check for symbolic links and inaccessible files
-            if os.path.islink(f):
-                self.log_event("SKIP", f"Symbolic link skipped: {os.path.basename(f)}")
-                return False
-            
-            if not os.path.exists(f) or not os.access(f, os.R_OK):
-                self.log_event("SKIP", f"Inaccessible file: {os.path.basename(f)}")
-                return False
+            # Size comes from the member itself, so it is opened (not re-analyzed)
+            with open_nested(join_nested(path, member), limit=0) as source:
+                d = scanner.copy_row(row, source, digests, name=member_label(member))
+        except Exception as e:
+            self.log_event("SKIP", f"{member}: {e}")
+            self._count_skip()
+            return None
+        d['filename'] = member_label(member)
+        return d
+
+    def _claim_md5(self, digests):
+        """True for the first file of the run with this content; later copies are not analyzed again."""
+        md5 = digests['md5']
+        if md5 == "Error": return True
+        with self._claim_lock:
+            if md5 in self._claimed_md5: return False
+            self._claimed_md5.add(md5)
+            return True
+
+    def _count_skip(self):
+        with self._count_lock:
+            self.skipped_count += 1
+
+    # --- SCAN PIPELINE STAGES ---
+    def _discover_stage(self, items, outbox, analyzed, stats):
+        """Stage 1: walk the sources; containers are only opened by the hash stage."""
+        try:
+            for path in self._iter_scan_files(items):
+                stats.add()
+                if not outbox.put(path): break
+        except Exception as e:
+            self.log_event("FAIL", f"Discovery stopped: {e}")
+        finally:
+            outbox.close()
+            analyzed.close()
+
+    def _hash_stage(self, inbox, outbox, analyzed, stats, task_options):
+        """
+        Stage 2 (I/O): expand each file into its scan tasks and hash each file
+        and nested member; copies of content already claimed this run and rows
+        already in the result cache skip analysis.
+        """
+        scanner = BatchAnalyzer(cache_path=task_options['cache_path'])
+        # Triage reads the central directory only, so it skips embedded documents
+        embedded = not task_options['triage']
+        try:
+            for path in inbox:
+                for member in self._scan_members(path, embedded):
+                    if not self._hash_task(scanner, path, member, outbox, analyzed, stats, task_options): return
+        finally:
+            outbox.close()
+            analyzed.close()
+
+    def _hash_task(self, scanner, path, member, outbox, analyzed, stats, task_options):
+        """Route one (path, member) task: duplicate, cached row or analysis. False once the run is cancelled."""
+        digests, cached = None, None
+        # Triage never hashes. One read feeds MD5, SHA-1 and SHA-256; the worker reuses them
+        if not task_options['triage']:
+            if member is None:
+                digests = safe_hash_file(path)
+                claimed = self._claim_md5(digests)
+                if claimed: cached = self._cached_row(scanner, path, digests)
+            else:
+                # Members are streamed out of their container (at any depth)
+                digests, claimed, cached = self._hash_member(scanner, path, member)
+            if digests is not None:
+                stats.add(nbytes=digests['size'] or 0)
+                if not claimed:
+                    return analyzed.put(('duplicate', path, member, digests))
+            if cached is not None:
+                return analyzed.put(('scanned', path, member, cached))
+        return outbox.put((path, member, digests))
+
+    def _cached_row(self, scanner, source, digests, name=None):
+        try:
+            return scanner.cached_row(source, digests, name)
+        except OSError:
+            return None  # Let the worker hit (and report) the error
+
+    def _hash_member(self, scanner, path, member):
+        """(digests, claimed, cached row) of a nested member; (None, True, None) if it cannot be read here."""
+        try:
+            with open_nested(join_nested(path, member), limit=0) as source:
+                digests = safe_hash_source(source)
+                claimed = self._claim_md5(digests)
+                cached = None
+                if claimed:
+                    cached = self._cached_row(scanner, source, digests, member_label(member))
+                    if cached is not None: cached['filename'] = member_label(member)
+                return digests, claimed, cached
+        except Exception:
+            return None, True, None  # The worker extracts it again and reports the error
+
+    def _analyze_stage(self, inbox, outbox, stats, task_options):
+        """
+        Stage 3 (CPU): parse and analyze in worker processes; rows come back in
+        completion order. A worker that crashes (hostile document) breaks the
+        pool: its in-flight items fail as scan errors and a fresh pool takes
+        the rest, so the channel is always drained and the pipeline finishes.
+        """
+        executor = ProcessPoolExecutor(max_workers=SCAN_WORKERS)
+        pending = {}  # future -> (path, member or None, digests or None)
+        try:
+            while self.running:
+                if len(pending) >= MAX_IN_FLIGHT:
+                    if not self._collect_results(pending, outbox, stats):
+                        executor = self._restart_pool(executor, pending, outbox)
+                    continue
+                item = inbox.get(timeout=0.05 if pending else POLL_INTERVAL)
+                if item is Channel.CLOSED: break
+                if item is not Channel.EMPTY:
+                    path, member, digests = item
+                    try:
+                        future = executor.submit(scan_task, path, member, digests=digests, **task_options)
+                    except BrokenProcessPool:
+                        executor = self._restart_pool(executor, pending, outbox)
+                        future = executor.submit(scan_task, path, member, digests=digests, **task_options)
+                    pending[future] = item
+                if pending and not self._collect_results(pending, outbox, stats, timeout=0):
+                    executor = self._restart_pool(executor, pending, outbox)
+            while pending and self.running:
+                if not self._collect_results(pending, outbox, stats):
+                    executor = self._restart_pool(executor, pending, outbox)
+        except Exception as e:
+            # Never leave the hash workers blocked on a channel nobody reads
+            self.log_event("FAIL", f"Analysis stopped: {e}")
+            for future, item in list(pending.items()):
+                self._fail_item(item, outbox, "SCAN_ERR", f"not analyzed ({e})")
+            pending.clear()
+            for item in inbox:
+                self._fail_item(item, outbox, "SCAN_ERR", f"not analyzed ({e})")
+        finally:
+            # Window closed: drop queued work instead of waiting for it
+            executor.shutdown(wait=self.running, cancel_futures=not self.running)
+            outbox.close()
+
+    def _restart_pool(self, executor, pending, outbox):
+        """Replace a broken worker pool; whatever was in flight on it fails as a scan error."""
+        for item in pending.values():
+            self._fail_item(item, outbox, "SCAN_ERR", "worker process crashed while analyzing")
+        pending.clear()
+        executor.shutdown(wait=False, cancel_futures=True)
+        self.log_event("WARN", "Analysis worker crashed; restarted the worker pool.")
+        return ProcessPoolExecutor(max_workers=SCAN_WORKERS)
+
+    def _fail_item(self, item, outbox, label, message):
+        path, member, digests = item
+        self.log_event(label, f"{member or os.path.basename(path)}: {message}")
+        self._count_skip()
+        # Copies of this content were waiting on its row
+        if digests: outbox.put(('failed', path, member, digests['md5']))
+
+    def _collect_results(self, pending, outbox, stats, timeout=0.5):
+        """
+        Pass finished workers' rows on (short timeout keeps cancel responsive).
+        Returns False if the pool is broken; the broken items stay in `pending`.
+        """
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        healthy = True
+        for future in done:
+            try:
+                d = future.result()
+            except BrokenProcessPool:
+                healthy = False
+                continue
+            except Exception as e:
+                item = pending.pop(future)
+                if isinstance(e, (OSError, PermissionError)):
+                    self._fail_item(item, outbox, "SKIP", f"Permission/access error - {e}")
+                else:
+                    self._fail_item(item, outbox, "FAIL", str(e))
+                continue
+            path, member, _ = pending.pop(future)
+            stats.add()
+            outbox.put(('scanned', path, member, d))
+        return healthy
+
+    def _exiftool_stage(self, inbox, outbox, stats):
+        """Stage 5 (I/O): ExifTool columns for rows on disk, one -json request per batch of rows."""
+        enabled = True
+        try:
+            while True:
+                item = inbox.get()
+                if item is Channel.CLOSED: break
+                if item is Channel.EMPTY: continue
+                rows, closed = inbox.drain(EXIFTOOL_BATCH - 1)
+                rows.insert(0, item)
+                # Restored rows keep their tags; nested members have no path ExifTool can open
+                todo = [r for r in rows if 'exif_tags' not in r and not is_nested(r.get('full_path', ''))]
+                if enabled and todo:
+                    try:
+                        tags = ExifToolScanner([r['full_path'] for r in todo]).read_tags()
+                    except FileNotFoundError:
+                        self.log_event("WARN", "ExifTool not found; batch ExifTool columns disabled.")
+                        enabled, tags = False, {}
+                    except Exception as e:
+                        self.log_event("WARN", f"ExifTool batch of {len(todo)} files failed: {e}")
+                        tags = {}
+                    for r in todo:
+                        r['exif_tags'] = tags.get(r['full_path'], {})
+                        r.update(exif_columns(r['exif_tags']))
+                stats.add(len(rows))
+                for r in rows:
+                    if not outbox.put(r): return
+                if closed: break
+        finally:
+            outbox.close()
+
+    def _render_stage(self, pipe, inbox, stats, done):
+        """Stage 6 (Tk thread): add finished rows to the table in batches and show stage throughput."""
+        if not self.running: return
+        rows, closed = inbox.drain(RENDER_BATCH)
+        for row in rows: self.table.add_row(row)
+        if rows:
+            stats.add(len(rows))
+            self.table.filter(self.search_var.get())
+        if closed:
+            done.set()
+            return
+        self.status_var.set(pipe.status())
+        self.after(RENDER_INTERVAL_MS, self._render_stage, pipe, inbox, stats, done)
+
+    def _iter_scan_files(self, items):
+        """Paths worth scanning from (path, stat_key) items; archives pass unopened."""
+        for f, key in items:
+            if not self.running: return
+            if is_archive(f) or self._precheck_file(f, key):
+                yield f
+            else:
+                self._count_skip()
+
+    def _scan_members(self, path, embedded=True):
+        """
+        Yield the members to scan of a discovered file: None for the file
+        itself, otherwise the chain of a document nested in it (see
+        core.containers): documents in ZIPs at any depth and, if `embedded`,
+        documents embedded in Office files.
+        """
+        if is_archive(path):
+            found = False
+            for member in self._nested_members(path):
+                found = True
+                yield member
+            if not found:
+                self.log_event("ZIP_SKIP", f"{os.path.basename(path)}: No indexable Office documents found.")
+                self._count_skip()
+            return
+        yield None
+        if embedded and is_document(path):
+            yield from self._nested_members(path)
+
+    def _precheck_file(self, f, key=None):
+        """
+        Cheap checks before a file is handed to a worker. Files from discovery
+        arrive with their stat key (symlinks and placeholders already filtered),
+        so only hand-picked files need the extra syscalls.
+        """
+        try:
+            if key is None:
+                # Additional safety check for symbolic links and inaccessible files
+                if os.path.islink(f):
+                    self.log_event("SKIP", f"Symbolic link skipped: {os.path.basename(f)}")
+                    return False
+                
+                if not os.path.exists(f) or not os.access(f, os.R_OK):
+                    self.log_event("SKIP", f"Inaccessible file: {os.path.basename(f)}")
+                    return False
             
             # Check for cloud placeholder files BEFORE trying to open them
             try:
-                size = os.path.getsize(f)
+                size = key[0] if key else os.path.getsize(f)
                 if size == 0:
                     self.log_event("SKIP", f"Cloud placeholder (0 bytes): {os.path.basename(f)}")
                     return False
@@ -445,125 +807,182 @@ class OfficeReconApp(ctk.CTk):
                     self.log_event("WARN", f"Suspiciously small file ({size} bytes): {os.path.basename(f)}")
             except:
                 pass
-            
-            d = scanner.analyze(f)
-            d['full_path'] = f
-            d['threats'] = ", ".join(d.get('threats', []))
-            self._handle_duplication(d, hash_registry)
-            if deep_mode:
-                report_text = self._run_deep_logic_on_file(f, d)
-                d['deep_output_raw'] = report_text 
-                d['deep_output'] = report_text
-            else:
-                d['deep_output_raw'] = ""
-                d['deep_output'] = ""
-            self.safe_table_add(d)
-            self.log_event("INDEXED", f"File: {os.path.basename(f)}")
             return True
         except (OSError, PermissionError) as e:
             self.log_event("SKIP", f"{os.path.basename(f)}: Permission/access error - {e}")
             return False
-        except Exception as e: 
-            self.log_event("FAIL", f"{os.path.basename(f)}: {e}")
-            return False
 
-    def _process_zip(self, zip_path, scanner, seen_hashes, hash_registry, deep_mode):
-        added_count = 0
-        zip_name = os.path.basename(zip_path)
+    def _nested_members(self, path):
+        """Member chains of the documents nested in an archive or document, budgets logged as ZIP_SKIP."""
+        name = os.path.basename(path)
+        on_skip = lambda reason, where: self.log_event("ZIP_SKIP", f"{reason}: {provenance(where)}")
         try:
-            with zipfile.ZipFile(zip_path, 'r') as z:
-                all_infos = z.infolist()
-                if not all_infos:
-                    self.log_event("ZIP_SKIP", f"{zip_name}: Archive is empty.")
-                    return 0
-                valid_found = False
-                for file_info in all_infos:
-                    if not self.running: return 0
-                    inner_name = file_info.filename
-                    if os.path.splitext(inner_name)[1].lower() in ['.docx', '.xlsx', '.pptx', '.docm', '.odt', '.ods', '.odp', '.xlsm']:
-                        valid_found = True
-                        if file_info.file_size > MAX_UNCOMPRESSED_SIZE: 
-                            self.log_event("ZIP_SKIP", f"Skipped huge file {inner_name}")
-                            continue
-                        try:
-                            with tempfile.TemporaryDirectory() as tmp:
-                                extracted = z.extract(file_info, path=tmp)
-                                d = scanner.analyze(extracted)
-                                d['filename'] = inner_name
-                                d['full_path'] = f"{zip_path} [>>] {inner_name}"
-                                d['threats'] = ", ".join(d.get('threats', []))
-                                self._handle_duplication(d, hash_registry)
-                                if deep_mode:
-                                    report_text = self._run_deep_logic_on_file(extracted, d)
-                                    d['deep_output_raw'] = report_text
-                                    d['deep_output'] = report_text
-                                else:
-                                    d['deep_output_raw'] = ""
-                                    d['deep_output'] = ""
-                                self.safe_table_add(d)
-                                added_count += 1
-                                self.log_event("INDEXED", f"Extracted: {inner_name} (Source: {zip_name})")
-                        except Exception as e:
-                            self.log_event("ZIP_ERR", f"Failed extract {inner_name}: {e}")
-                if not valid_found: self.log_event("ZIP_SKIP", f"{zip_name}: No indexable Office documents found.")
-            return added_count
-        except Exception as e: 
-            self.log_event("ZIP_FAIL", f"Could not read {zip_name}: {e}")
-            return 0
+            for chain in expand(path, on_skip=on_skip):
+                if not self.running: return
+                yield MEMBER_SEP.join(chain)
+        except Exception as e:
+            if is_archive(path): self.log_event("ZIP_FAIL", f"Could not read {name}: {e}")
+
+    def _finish_row(self, d, path, member, hash_registry, deep_mode):
+        """Fill in the GUI-side fields of a worker's row (and its deep report)."""
+        d['full_path'] = join_nested(path, member)
+        d['provenance'] = provenance(d['full_path']) if member else ""
+        d['threats'] = ", ".join(d.get('threats', []))
+        self._handle_duplication(d, hash_registry)
+        self._set_deep_report(d, self._deep_row_report(d) if deep_mode else None)
+        self._scan_rows.setdefault(path, []).append(d)
+
+    def _deep_row_report(self, d):
+        """Deep report of a row; a file that cannot be reopened gets a scan_error report instead."""
+        md5 = d.get('md5', '')
+        try:
+            # Members are deep-scanned straight from the container
+            with open_nested(d['full_path']) as source:
+                # Copies share the content findings; each gets its own file system section
+                content = self._deep_reports.get(md5)
+                if content is None:
+                    content = self._deep_content(source, md5, d['full_path'])
+                    if md5 and md5 != "Error": self._deep_reports[md5] = content
+                return self._path_report(content, source, self._deep_header(d['full_path']))
+        except Exception as e:
+            self.log_event("SCAN_ERR", f"Deep scan of {provenance(d['full_path'])} failed: {e}")
+            failed = Report()
+            failed.add('alert', f"Error running Deep Scan: {e}", category='scan_error')
+            return failed
+
+    def _restore_row(self, d, hash_registry, deep_mode):
+        """Row of an unchanged file from the previous scan; the deep report comes from the cache, else a fresh run."""
+        self._handle_duplication(d, hash_registry)
+        self._set_deep_report(d, self._deep_row_report(d) if deep_mode else None)
+
+    def _set_deep_report(self, row, report):
+        """Attach a deep-scan Report; the status column only holds its summary."""
+        row['deep_report'] = report
+        row['deep_output'] = report.summary() if report is not None else ""
+
+    def _run_deep_logic_on_file(self, source, row_data, name=None):
+        """
+        Deep scan report for a file (a path, or an in-memory nested member
+        labelled `name`). The content findings are reused from the result
+        cache if the content is unchanged; the file system section is always
+        this path's own.
+        """
+        name = name or source
+        content = self._deep_content(source, row_data.get('md5', ''), name)
+        return self._path_report(content, source, self._deep_header(name))
+
+    def _deep_content(self, source, md5, name):
+        """Content findings of a deep scan: from the result cache, or a fresh run (then cached)."""
+        cached = self._cached_reports(md5, 'deep')
+        if cached is not None:
+            return cached[0]
+        content = self._run_deep_analyzers(source, name)
+        self._store_reports(md5, deep=content)
+        return content
+
+    def _deep_header(self, filepath):
+        return "\n" + "="*60 + f"\nDEBUG: Deep scan starting for file: {filepath}\n" + "="*60 + "\n"
+
+    def _path_report(self, content, source, header):
+        """
+        `content` (a fresh, cached or shared Report) behind this path's own
+        header and FILESYSTEM section, which are recomputed for every path.
+        """
+        head = Report()
+        head.category = FILESYSTEM
+        with capture_output(head):
+            print(header)
+            try:
+                FileSystemAnalyzer(source).run()
+            except Exception as e:
+                print(f"\n[DEBUG] FileSystemAnalyzer failed: {e}")
+        return Report(list(head) + list(content.content()))
 
-    def _run_deep_logic_on_file(self, filepath, row_data):
+    def _run_deep_analyzers(self, source, filepath):
         try:
-            cap = io.StringIO(); old_stdout = sys.stdout; sys.stdout = cap
-            print("\n" + "="*60)
-            print("DEBUG: Deep scan starting for file:", filepath)
-            print("="*60 + "\n")
-            l = DocLoader(filepath)
-            if l.load():
-                def safe(cls): 
-                    try: 
-                        cls(l).run()
-                    except Exception as e:
-                        print(f"\n[DEBUG] {cls.__name__} failed: {e}")
+            # Output goes to this scan's own sink, so concurrent scans stay isolated
+            with capture_output() as cap:
+                l = DocLoader(source, name=filepath)
+                if l.load():
+                    def safe(cls): 
+                        try: 
+                            with l.time_budget(ANALYZER_TIMEOUT, cls.__name__):
+                                cls(l).run()
+                        except ScanTimeout as e:
+                            emit_finding('alert', f"[TIMEOUT] {e}", category='timeout')
+                            self.log_event("TIMEOUT", f"{os.path.basename(filepath)}: {e}")
+                        except Exception as e:
+                            print(f"\n[DEBUG] {cls.__name__} failed: {e}")
                 
-                # Core analyzers (media, macros, embeddings - not metadata)
-                safe(MediaAnalyzer); safe(MacroScanner); safe(ExtendedAnalyzer); safe(EmbeddingAnalyzer)
+                    # Core analyzers (media, macros, embeddings - not metadata)
+                    safe(MediaAnalyzer); safe(MacroScanner); safe(ExtendedAnalyzer); safe(EmbeddingAnalyzer)
                 
-                print(f"\n[DEBUG] File type detected: {l.file_type}")
+                    print(f"\n[DEBUG] File type detected: {l.file_type}")
                 
-                # DOCX-specific analyzers
-                if l.file_type == 'docx':
-                    # Metadata first
-                    safe(MetadataAnalyzer)
-                    # Original analyzers (RSIDAnalyzer and AuthorAnalyzer moved to Authors & Timeline tab)
-                    safe(OriginAnalyzer); safe(ThreatScanner)
-                    # New forensic analyzers (v1.1+)
-                    safe(TrackChangesAnalyzer); safe(CommentAnalyzer); safe(FieldAnalyzer)
-                    safe(DeletedContentAnalyzer); safe(ProtectionAnalyzer); safe(PrinterAnalyzer)
-                    safe(HyperlinkAnalyzer); safe(SmartTagAnalyzer); safe(FootnoteAnalyzer)
-                    safe(DictionaryAnalyzer); safe(FontAnalyzer); safe(TableAnalyzer)
-                    safe(SectionAnalyzer); safe(ContentTypesAnalyzer)
+                    # DOCX-specific analyzers
+                    if l.file_type == 'docx':
+                        # Metadata first
+                        safe(MetadataAnalyzer)
+                        # Original analyzers (RSIDAnalyzer and AuthorAnalyzer moved to Authors & Timeline tab)
+                        safe(OriginAnalyzer); safe(ThreatScanner)
+                        # New forensic analyzers (v1.1+)
+                        safe(TrackChangesAnalyzer); safe(CommentAnalyzer); safe(FieldAnalyzer)
+                        safe(DeletedContentAnalyzer); safe(ProtectionAnalyzer); safe(PrinterAnalyzer)
+                        safe(HyperlinkAnalyzer); safe(SmartTagAnalyzer); safe(FootnoteAnalyzer)
+                        safe(DictionaryAnalyzer); safe(FontAnalyzer); safe(TableAnalyzer)
+                        safe(SectionAnalyzer); safe(ContentTypesAnalyzer)
                 
-                # XLSX-specific analyzers (v1.2+) - XLSXDeepAnalyzer includes metadata
-                elif l.file_type == 'xlsx': 
-                    safe(XLSXDeepAnalyzer)  # Comprehensive analysis including metadata
+                    # XLSX-specific analyzers (v1.2+) - XLSXDeepAnalyzer includes metadata
+                    elif l.file_type == 'xlsx': 
+                        safe(XLSXDeepAnalyzer)  # Comprehensive analysis including metadata
                 
-                # PPTX-specific analyzers - PPTXDeepAnalyzer includes metadata
-                elif l.file_type == 'pptx': 
-                    safe(PPTXDeepAnalyzer)  # Comprehensive analysis including metadata
+                    # PPTX-specific analyzers - PPTXDeepAnalyzer includes metadata
+                    elif l.file_type == 'pptx': 
+                        safe(PPTXDeepAnalyzer)  # Comprehensive analysis including metadata
                 
-                # OpenDocument formats (v1.2+) - OpenDocumentAnalyzer includes metadata
-                elif l.file_type in ['odt', 'ods', 'odp']:
-                    safe(OpenDocumentAnalyzer)  # Comprehensive analysis including metadata
+                    # OpenDocument formats (v1.2+) - OpenDocumentAnalyzer includes metadata
+                    elif l.file_type in ['odt', 'ods', 'odp']:
+                        safe(OpenDocumentAnalyzer)  # Comprehensive analysis including metadata
                 
-                # ExifTool (all file types)
-                try: ExifToolScanner(filepath).run()
-                except: pass
+                    # ExifTool (all file types); nested members are piped in from memory
+                    try: ExifToolScanner(source).run()
+                    except: pass
                 
-                l.close()
-            sys.stdout = old_stdout
-            return cap.getvalue()
-        except: return "[Error running Deep Scan]"
-        finally: sys.stdout = sys.__stdout__
+                    self._log_cache_stats(l)
+                    l.close()
+            return cap
+        except:
+            failed = Report()
+            failed.add('alert', "Error running Deep Scan", category='scan_error')
+            return failed
+
+    def _cache_path(self):
+        return DEFAULT_CACHE_PATH if self.cache_var.get() == "on" else None
+
+    def _cached_reports(self, md5, *kinds):
+        """Cached Reports for all `kinds`, or None if caching is off or any is missing."""
+        path = self._cache_path()
+        if not path: return None
+        cache = get_cache(path)
+        payloads = [cache.get(md5, kind) for kind in kinds]
+        if any(p is None for p in payloads): return None
+        self.log_event("CACHE", f"Reused cached {'/'.join(kinds)} report for MD5 {md5}")
+        return [Report.from_list(p) for p in payloads]
+
+    def _store_reports(self, md5, **reports):
+        path = self._cache_path()
+        if not path: return
+        # Timed-out or failed scans are incomplete; never pin them in the cache
+        for report in reports.values():
+            if report.filter(category='timeout') or report.filter(category='scan_error'): return
+        cache = get_cache(path)
+        for kind, report in reports.items():
+            # Only content findings: the file system section belongs to one path
+            cache.put(md5, kind, report.content().to_list())
+
+    def _log_cache_stats(self, loader):
+        stats = loader.cache_stats()
+        self.log_event("CACHE", f"{os.path.basename(str(loader.filepath))}: XML parts {stats['hits']} hits / {stats['misses']} misses ({stats['bytes']/1048576:.1f} MB cached)")
 
     def _handle_duplication(self, d, hash_registry):
         md5 = d.get('md5', "")
@@ -577,6 +996,22 @@ class OfficeReconApp(ctk.CTk):
                 hash_registry[md5] = [d]
         else: d['is_duplicate'] = ""
 
+    def prune_result_cache(self):
+        if not messagebox.askyesno("Prune Result Cache", "Discard cached results of other OfficeRecon versions?\nResults of this version are kept."): return
+        try:
+            removed = get_cache(DEFAULT_CACHE_PATH).prune()
+            self.log_event("CACHE", f"Result cache pruned: {removed} stale entries removed.")
+        except Exception as e:
+            messagebox.showerror("Prune Result Cache", f"Failed to prune cache:\n{e}")
+
+    def clear_result_cache(self):
+        if not messagebox.askyesno("Clear Result Cache", "Discard all cached scan results?\nFiles will be fully re-analyzed on the next scan."): return
+        try:
+            get_cache(DEFAULT_CACHE_PATH).clear()
+            self.log_event("CACHE", "Result cache cleared.")
+        except Exception as e:
+            messagebox.showerror("Clear Result Cache", f"Failed to clear cache:\n{e}")
+
     def show_log_window(self):
         win = ctk.CTkToplevel(self); win.title("Activity Log"); win.geometry("800x600"); win.attributes("-topmost", True)
         txt = ctk.CTkTextbox(win, font=("Consolas", 12), text_color="#dcdcdc", fg_color="#1e1e1e"); txt.pack(fill="both", expand=True, padx=10, pady=10)
@@ -594,33 +1029,31 @@ class OfficeReconApp(ctk.CTk):
 
     def on_double_click(self, row):
         path = row['full_path']
-        if " [>>] " in path: self._show_loading_zip(row['filename'], path, row)
-        else: self._show_loading(row['filename'], path, row)
+        self._show_loading(row['filename'], path, row)
 
     def on_right_click(self, event, row, idx):
         m = Menu(self, tearoff=0)
         m.add_command(label="Deep Scan", command=lambda: self.on_double_click(row))
-        m.add_command(label="Verify MD5 Hash", command=lambda: self.verify_file(row))
+        m.add_command(label="Verify Hashes", command=lambda: self.verify_file(row))
         m.add_command(label="Open Location", command=lambda: self.open_loc(row['full_path']))
         m.tk_popup(event.x_root, event.y_root)
 
     def open_loc(self, path):
-        if " [>>] " in path: path = path.split(" [>>] ")[0]
+        path = split_nested(path)[0]
         if os.path.exists(path):
             if platform.system() == "Windows": subprocess.Popen(f'explorer /select,"{os.path.normpath(path)}"')
 
 
 
     def verify_file(self, row):
-        """Verify file by recalculating MD5 hash and comparing with stored value."""
+        """Verify file by recalculating its hashes (MD5, SHA-1, SHA-256) and comparing with stored values."""
         path = row['full_path']
         filename = row['filename']
-        stored_md5 = row.get('md5', '')
         
         # Show verification window
         verify_win = ctk.CTkToplevel(self)
-        verify_win.title(f"MD5 Verification: {filename}")
-        verify_win.geometry("600x250")
+        verify_win.title(f"Hash Verification: {filename}")
+        verify_win.geometry("700x300")
         verify_win.attributes("-topmost", True)
         
         result_text = ctk.CTkTextbox(verify_win, font=("Consolas", 11), fg_color="#1e1e1e", text_color="#dcdcdc")
@@ -628,48 +1061,31 @@ class OfficeReconApp(ctk.CTk):
         
         def verify_thread():
             try:
-                result_text.insert("end", f"=== MD5 HASH VERIFICATION ===\n\n")
+                result_text.insert("end", f"=== HASH VERIFICATION ===\n\n")
                 result_text.insert("end", f"File: {filename}\n")
                 result_text.insert("end", f"Path: {path}\n\n")
-                result_text.insert("end", f"Stored MD5:  {stored_md5}\n")
                 result_text.insert("end", f"Status: Calculating...\n")
                 
-                # Handle ZIP extraction
-                actual_path = path
-                temp_dir = None
-                if " [>>] " in path:
-                    parts = path.split(" [>>] ")
-                    result_text.insert("end", f"\n[INFO] Extracting from archive...\n")
-                    temp_dir = tempfile.mkdtemp()
-                    with zipfile.ZipFile(parts[0], 'r') as z:
-                        actual_path = z.extract(parts[1], path=temp_dir)
-                
-                # Recalculate MD5
-                result_text.insert("end", f"\n[INFO] Recalculating MD5 hash...\n")
-                hash_md5 = hashlib.md5()
-                with open(actual_path, "rb") as f:
-                    for chunk in iter(lambda: f.read(4096), b""):
-                        hash_md5.update(chunk)
-                current_md5 = hash_md5.hexdigest()
-                
-                # Clean up temp directory
-                if temp_dir:
-                    import shutil
-                    shutil.rmtree(temp_dir, ignore_errors=True)
+                # One read of the file (or archive member) yields every digest
+                results = compare_digests(row, hash_row_source(path))
                 
-                # Update display with current MD5
+                # Update display with current digests
                 result_text.delete("1.0", "end")
-                result_text.insert("end", f"=== MD5 HASH VERIFICATION ===\n\n")
+                result_text.insert("end", f"=== HASH VERIFICATION ===\n\n")
                 result_text.insert("end", f"File: {filename}\n")
                 result_text.insert("end", f"Path: {path}\n\n")
-                result_text.insert("end", f"Stored MD5:  {stored_md5}\n")
-                result_text.insert("end", f"Current MD5: {current_md5}\n\n")
+                for alg, stored, current, _ in results:
+                    result_text.insert("end", f"Stored {alg.upper():<7} {stored}\n")
+                    result_text.insert("end", f"Current {alg.upper():<6} {current}\n\n")
                 
                 # Compare
-                if stored_md5.lower() == current_md5.lower():
-                    result_text.insert("end", "[PASS] MD5 HASH MATCH - File is unchanged\n")
+                if not results:
+                    result_text.insert("end", "[SKIPPED] Not hashed at scan time (triage row) - run a full scan first\n")
+                elif all(match for *_, match in results):
+                    result_text.insert("end", "[PASS] HASH MATCH - File is unchanged\n")
                 else:
-                    result_text.insert("end", "[FAIL] MD5 HASH MISMATCH - File has been modified!\n")
+                    failed = ", ".join(alg.upper() for alg, *_, match in results if not match)
+                    result_text.insert("end", f"[FAIL] HASH MISMATCH ({failed}) - File has been modified!\n")
                 
                 result_text.insert("end", f"\n=== VERIFICATION COMPLETE ===\n")
                 
@@ -679,127 +1095,101 @@ class OfficeReconApp(ctk.CTk):
         threading.Thread(target=verify_thread, daemon=True).start()
 
     def verify_all_files(self):
-        """Verify MD5 hash for all files in the table."""
+        """Verify the stored hashes (MD5, SHA-1, SHA-256) of all files in the table."""
         if not self.table.table_data:
             messagebox.showinfo("No Files", "No files loaded to verify.")
             return
         
         # Create verification results window
         verify_win = ctk.CTkToplevel(self)
-        verify_win.title("MD5 Verification - All Files")
+        verify_win.title("Hash Verification - All Files")
         verify_win.geometry("900x600")
         verify_win.attributes("-topmost", True)
         
         # Header
         header_frame = ctk.CTkFrame(verify_win)
         header_frame.pack(fill="x", padx=10, pady=10)
-        ctk.CTkLabel(header_frame, text="MD5 Hash Verification Results", 
+        ctk.CTkLabel(header_frame, text="Hash Verification Results", 
                     font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
         
         # Results table
         result_text = ctk.CTkTextbox(verify_win, font=("Consolas", 10), fg_color="#1e1e1e", text_color="#dcdcdc")
         result_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        result_text._textbox.tag_config("pass", foreground="#4CAF50")
+        result_text._textbox.tag_config("fail", foreground="#ff5252")
+        result_text._textbox.tag_config("error", foreground="#FFA726")
+        result_text._textbox.tag_config("skip", foreground="#888888")
         
         # Status label
         status_label = ctk.CTkLabel(verify_win, text="Preparing verification...", font=("Segoe UI", 11))
         status_label.pack(pady=5)
         
+        # Closing the window abandons the run
+        cancelled = threading.Event()
+        def on_close():
+            cancelled.set()
+            verify_win.destroy()
+        verify_win.protocol("WM_DELETE_WINDOW", on_close)
+        
+        rows = list(self.table.table_data)
+        progress = plan_progress(rows)
+        marks = {PASS: "✓ PASS ", FAIL: "✗ FAIL ", ERROR: "⚠ ERROR", SKIP: "- SKIP "}
+        
+        def flush(lines):
+            # Tk thread: one insert per tagged line, batched per tick
+            if cancelled.is_set(): return
+            for text, tag in lines: result_text.insert("end", text, tag)
+            status_label.configure(text=f"Verifying: {progress.describe()}")
+        
         def verify_all_thread():
             try:
-                total_files = len(self.table.table_data)
-                passed = 0
-                failed = 0
-                errors = 0
+                counts = {PASS: 0, FAIL: 0, ERROR: 0, SKIP: 0}
+                header = f"{'=' * 90}\nHASH VERIFICATION - {len(rows)} FILES ({VERIFY_WORKERS} parallel workers)\n{'=' * 90}\n\n"
+                self.after(0, flush, [(header, None)])
                 
-                result_text.insert("end", f"{'=' * 90}\n")
-                result_text.insert("end", f"MD5 HASH VERIFICATION - {total_files} FILES\n")
-                result_text.insert("end", f"{'=' * 90}\n\n")
-                
-                for idx, row in enumerate(self.table.table_data, 1):
-                    filename = row['filename']
-                    path = row['full_path']
-                    stored_md5 = row.get('md5', '')
-                    
-                    status_label.configure(text=f"Verifying {idx}/{total_files}: {filename}")
-                    
-                    try:
-                        # Handle ZIP extraction
-                        actual_path = path
-                        temp_dir = None
-                        if " [>>] " in path:
-                            parts = path.split(" [>>] ")
-                            temp_dir = tempfile.mkdtemp()
-                            with zipfile.ZipFile(parts[0], 'r') as z:
-                                actual_path = z.extract(parts[1], path=temp_dir)
-                        
-                        # Recalculate MD5
-                        hash_md5 = hashlib.md5()
-                        with open(actual_path, "rb") as f:
-                            for chunk in iter(lambda: f.read(4096), b""):
-                                hash_md5.update(chunk)
-                        current_md5 = hash_md5.hexdigest()
-                        
-                        # Clean up temp directory
-                        if temp_dir:
-                            import shutil
-                            shutil.rmtree(temp_dir, ignore_errors=True)
-                        
-                        # Compare
-                        if stored_md5.lower() == current_md5.lower():
-                            result_text.insert("end", f"[{idx:3d}] ✓ PASS  {filename[:50]:<50}\n")
-                            passed += 1
-                        else:
-                            result_text.insert("end", f"[{idx:3d}] ✗ FAIL  {filename[:50]:<50}\n")
-                            failed += 1
-                    
-                    except Exception as e:
-                        result_text.insert("end", f"[{idx:3d}] ⚠ ERROR {filename[:50]:<50}  {str(e)[:30]}\n")
-                        errors += 1
+                # Containers are opened once and verified alongside plain files
+                pending, last_flush = [], time.monotonic()
+                for idx, row, status, detail in verify_rows(rows, progress=progress, should_stop=cancelled.is_set):
+                    counts[status] += 1
+                    line = f"[{idx:3d}] {marks[status]} {row['filename'][:50]:<50}"
+                    if detail: line += f"  {detail[:40]}"
+                    pending.append((line + "\n", status))
+                    if time.monotonic() - last_flush > 0.25:
+                        self.after(0, flush, pending)
+                        pending, last_flush = [], time.monotonic()
+                if cancelled.is_set(): return
                 
+                passed, failed, errors, skipped = counts[PASS], counts[FAIL], counts[ERROR], counts[SKIP]
+                elapsed = time.monotonic() - progress.started
                 # Summary
-                result_text.insert("end", f"\n{'=' * 90}\n")
-                result_text.insert("end", f"VERIFICATION SUMMARY\n")
-                result_text.insert("end", f"{'=' * 90}\n")
-                result_text.insert("end", f"Total Files:    {total_files}\n")
-                result_text.insert("end", f"Passed:         {passed}\n")
-                result_text.insert("end", f"Failed:         {failed}\n")
-                result_text.insert("end", f"Errors:         {errors}\n")
-                result_text.insert("end", f"{'=' * 90}\n")
-                
-                # Color code results
-                content = result_text.get("1.0", "end")
-                lines = content.split('\n')
-                result_text.delete("1.0", "end")
-                
-                for line in lines:
-                    if "✓ PASS" in line:
-                        result_text.insert("end", line + "\n")
-                        line_idx = str(int(result_text.index("end-1c").split('.')[0]))
-                        result_text._textbox.tag_add("pass", f"{line_idx}.0", f"{line_idx}.end")
-                        result_text._textbox.tag_config("pass", foreground="#4CAF50")
-                    elif "✗ FAIL" in line or "HASH MISMATCH" in line:
-                        result_text.insert("end", line + "\n")
-                        line_idx = str(int(result_text.index("end-1c").split('.')[0]))
-                        result_text._textbox.tag_add("fail", f"{line_idx}.0", f"{line_idx}.end")
-                        result_text._textbox.tag_config("fail", foreground="#ff5252")
-                    elif "⚠ ERROR" in line:
-                        result_text.insert("end", line + "\n")
-                        line_idx = str(int(result_text.index("end-1c").split('.')[0]))
-                        result_text._textbox.tag_add("error", f"{line_idx}.0", f"{line_idx}.end")
-                        result_text._textbox.tag_config("error", foreground="#FFA726")
-                    else:
-                        result_text.insert("end", line + "\n")
+                pending.append((f"\n{'=' * 90}\n"
+                                f"VERIFICATION SUMMARY\n"
+                                f"{'=' * 90}\n"
+                                f"Total Files:    {len(rows)}\n"
+                                f"Passed:         {passed}\n"
+                                f"Failed:         {failed}\n"
+                                f"Errors:         {errors}\n"
+                                f"Skipped:        {skipped} (triage rows, not hashed)\n"
+                                f"Data Hashed:    {progress.bytes / (1024 * 1024):.1f} MB in {elapsed:.1f}s "
+                                f"({progress.rate() / (1024 * 1024):.1f} MB/s)\n"
+                                f"{'=' * 90}\n", None))
                 
                 if failed > 0:
-                    status_label.configure(text=f"⚠ Verification Complete: {failed} file(s) failed!", text_color="#ff5252")
+                    final = (f"⚠ Verification Complete: {failed} file(s) failed!", "#ff5252")
                 elif errors > 0:
-                    status_label.configure(text=f"⚠ Verification Complete: {errors} error(s) encountered", text_color="#FFA726")
+                    final = (f"⚠ Verification Complete: {errors} error(s) encountered", "#FFA726")
                 else:
-                    status_label.configure(text=f"✓ All {passed} files verified successfully!", text_color="#4CAF50")
+                    final = (f"✓ All {passed} files verified successfully!"
+                             + (f" ({skipped} triage rows skipped)" if skipped else ""), "#4CAF50")
+                def finish(lines=pending):
+                    flush(lines)
+                    if not cancelled.is_set(): status_label.configure(text=final[0], text_color=final[1])
+                self.after(0, finish)
+                self.log_event("VERIFY", f"{passed} passed, {failed} failed, {errors} errors ({progress.describe()})")
                 
             except Exception as e:
-                result_text.insert("end", f"\n[CRITICAL ERROR] Verification process failed: {e}\n")
-                status_label.configure(text="Verification failed!", text_color="#ff5252")
+                self.after(0, flush, [(f"\n[CRITICAL ERROR] Verification process failed: {e}\n", "fail")])
+                self.after(0, lambda: status_label.configure(text="Verification failed!", text_color="#ff5252"))
         
         threading.Thread(target=verify_all_thread, daemon=True).start()
 
@@ -808,78 +1198,89 @@ class OfficeReconApp(ctk.CTk):
         ctk.CTkLabel(win, text="Scanning...", font=("Segoe UI", 16)).pack(pady=40)
         threading.Thread(target=self._deep_scan_thread, args=(win, title, path, row)).start()
 
-    def _show_loading_zip(self, title, complex_path, row=None):
-        win = ctk.CTkToplevel(self); win.geometry("400x150"); win.title("Extracting"); win.attributes("-topmost", True)
-        ctk.CTkLabel(win, text="Extracting...", font=("Segoe UI", 16)).pack(pady=40)
-        parts = complex_path.split(" [>>] ")
-        def extract():
-            with tempfile.TemporaryDirectory() as tmp:
-                with zipfile.ZipFile(parts[0], 'r') as z:
-                    extracted = z.extract(parts[1], path=tmp)
-                    self._deep_scan_thread(win, title, extracted, row)
-        threading.Thread(target=extract).start()
-
     def _deep_scan_thread(self, popup, title, filepath, row=None):
-        cap_main = io.StringIO(); cap_auth = io.StringIO(); original = sys.stdout
+        cap_main = Report(); cap_auth = Report()
         updated_row_data = None
         deep_scan_output = None
+        source = filepath
         try:
-            sys.stdout = cap_main
-            d = BatchAnalyzer().analyze(filepath)
-            updated_row_data = d  # Save for table update
-            print(f"=== DOSSIER: {d['filename']} ===\nRemarks: {d['verdict']} | Attention: {', '.join(d['threats'])}\nMD5: {d['md5']}\n{'='*60}\n")
-            try: ExifToolScanner(filepath).run()
-            except: pass
-            l = DocLoader(filepath)
-            if l.load():
-                def safe(c):
-                    try:
-                        c(l).run()
-                    except Exception as e:
-                        print(f"\n[ERROR] {c.__name__} failed: {e}")
-                        import traceback
-                        traceback.print_exc()
-                
-                # Core analyzers (all file types)
-                safe(MediaAnalyzer); safe(MetadataAnalyzer); safe(MacroScanner); safe(ExtendedAnalyzer); safe(EmbeddingAnalyzer)
-                # Advanced forensic analyzers (v1.3+)
-                safe(ForensicTextAnalyzer); safe(EnhancedMetadataAnalyzer)
-                # DOCX-specific analyzers
-                if l.file_type == 'docx':
-                    # Forensic analyzers (RSIDAnalyzer and AuthorAnalyzer moved to Authors & Timeline tab)
-                    safe(OriginAnalyzer)
-                    safe(ThreatScanner)
-                    
-                    # New forensic analyzers (v1.1+)
-                    safe(TrackChangesAnalyzer); safe(CommentAnalyzer); safe(FieldAnalyzer)
-                    safe(DeletedContentAnalyzer); safe(ProtectionAnalyzer); safe(PrinterAnalyzer)
-                    safe(HyperlinkAnalyzer); safe(SmartTagAnalyzer); safe(FootnoteAnalyzer)
-                    safe(DictionaryAnalyzer); safe(FontAnalyzer); safe(TableAnalyzer)
-                    safe(SectionAnalyzer); safe(ContentTypesAnalyzer)
-                elif l.file_type == 'pptx':
-                    safe(PPTXDeepAnalyzer)
-            
-            # Attribution analysis goes to separate buffer for GUI display
-            if l.zip_ref and l.file_type == 'docx':
-                sys.stdout = cap_auth
-                safe(RSIDAnalyzer)  # RSID stats and timeline
-                safe(AuthorAnalyzer)  # Author attribution analysis
-            l.close()
+            # Nested members are read from their container into memory (no temp files)
+            source = load_nested(filepath)
+            # Per-thread sinks: a batch deep scan running alongside cannot bleed in
+            with capture_output(cap_main):
+                d = BatchAnalyzer(cache_path=self._cache_path()).analyze(source, name=source_name(filepath))
+                updated_row_data = d  # Save for table update
+                cached = self._cached_reports(d['md5'], 'dossier', 'authors')
+                if cached is None:
+                    self._run_dossier_analyzers(source, filepath, d, cap_auth)
+            if cached is not None:
+                cap_main, cap_auth = cached
+            else:
+                self._store_reports(d['md5'], dossier=cap_main, authors=cap_auth)
+            # Header and file system section are this path's own, never cached
+            cap_main = self._path_report(cap_main, source, self._dossier_header(d))
             
             # Capture the deep scan output
-            deep_scan_output = cap_main.getvalue()
+            deep_scan_output = cap_main
         except: pass
-        finally: sys.stdout = sys.__stdout__
         
         # Update table row with new scan results
         def update_and_show():
             popup.destroy()
             if updated_row_data and row:
                 self._update_table_row(row, updated_row_data, deep_scan_output)
-            ReportWindow(self, title, cap_main.getvalue(), cap_auth.getvalue(), filepath)
+            ReportWindow(self, title, cap_main, cap_auth, source)
         
         self.after(0, update_and_show)
 
+    def _run_dossier_analyzers(self, source, filepath, d, cap_auth):
+        """Full double-click analysis of `source` (labelled `filepath`); prints to the current sink, attribution to cap_auth."""
+        try: ExifToolScanner(source).run()
+        except: pass
+        l = DocLoader(source, name=filepath)
+        if l.load():
+            def safe(c):
+                try:
+                    with l.time_budget(ANALYZER_TIMEOUT, c.__name__):
+                        c(l).run()
+                except ScanTimeout as e:
+                    emit_finding('alert', f"[TIMEOUT] {e}", category='timeout')
+                    self.log_event("TIMEOUT", f"{os.path.basename(filepath)}: {e}")
+                except Exception as e:
+                    print(f"\n[ERROR] {c.__name__} failed: {e}")
+                    import traceback
+                    traceback.print_exc()
+                
+            # Core analyzers (all file types)
+            safe(MediaAnalyzer); safe(MetadataAnalyzer); safe(MacroScanner); safe(ExtendedAnalyzer); safe(EmbeddingAnalyzer)
+            # Advanced forensic analyzers (v1.3+)
+            safe(ForensicTextAnalyzer); safe(EnhancedMetadataAnalyzer)
+            # DOCX-specific analyzers
+            if l.file_type == 'docx':
+                # Forensic analyzers (RSIDAnalyzer and AuthorAnalyzer moved to Authors & Timeline tab)
+                safe(OriginAnalyzer)
+                safe(ThreatScanner)
+                    
+                # New forensic analyzers (v1.1+)
+                safe(TrackChangesAnalyzer); safe(CommentAnalyzer); safe(FieldAnalyzer)
+                safe(DeletedContentAnalyzer); safe(ProtectionAnalyzer); safe(PrinterAnalyzer)
+                safe(HyperlinkAnalyzer); safe(SmartTagAnalyzer); safe(FootnoteAnalyzer)
+                safe(DictionaryAnalyzer); safe(FontAnalyzer); safe(TableAnalyzer)
+                safe(SectionAnalyzer); safe(ContentTypesAnalyzer)
+            elif l.file_type == 'pptx':
+                safe(PPTXDeepAnalyzer)
+            
+        # Attribution analysis goes to separate buffer for GUI display
+        if l.zip_ref and l.file_type == 'docx':
+            with capture_output(cap_auth):
+                safe(RSIDAnalyzer)  # RSID stats and timeline
+                safe(AuthorAnalyzer)  # Author attribution analysis
+        self._log_cache_stats(l)
+        l.close()
+
+    def _dossier_header(self, d):
+        return f"=== DOSSIER: {d['filename']} ===\nRemarks: {d['verdict']} | Attention: {', '.join(d['threats'])}\nMD5: {d['md5']}\n{'='*60}\n"
+
     def _update_table_row(self, row, updated_data, deep_output=None):
         """Update table row with fresh batch analyzer results after deep scan."""
         try:
@@ -890,9 +1291,8 @@ class OfficeReconApp(ctk.CTk):
                 row['threats'] = updated_data['threats']
             
             # Store the deep scan output so it shows in the evidence viewer
-            if deep_output:
-                row['deep_output_raw'] = deep_output
-                row['deep_output'] = deep_output
+            if deep_output is not None:
+                self._set_deep_report(row, deep_output)
             
             # Refresh the table display
             self.table.refresh_display()
@@ -908,7 +1308,7 @@ class OfficeReconApp(ctk.CTk):
             self.log_event("WARNING", f"Failed to update table row: {e}")
 
     def export_data_wrapper(self):
-        missing_count = sum(1 for r in self.table.table_data if not r.get('deep_output_raw'))
+        missing_count = sum(1 for r in self.table.table_data if r.get('deep_report') is None)
         if missing_count > 0:
             if messagebox.askyesno("Incomplete Data", f"{missing_count} files have not been Deep Scanned.\nScan now for full report?"):
                 self._run_missing_deep_scans()
@@ -924,19 +1324,13 @@ class OfficeReconApp(ctk.CTk):
         total = len(self.table.table_data)
         for i, row in enumerate(self.table.table_data):
             if not self.running: break
-            if row.get('deep_output_raw'): continue
+            if row.get('deep_report') is not None: continue
             self.safe_status(f"Deep Scanning for Export: {i+1}/{total} - {row['filename']}")
             try:
                 path = row['full_path']
-                if " [>>] " in path:
-                    parts = path.split(" [>>] ")
-                    with tempfile.TemporaryDirectory() as tmp:
-                        with zipfile.ZipFile(parts[0], 'r') as z:
-                            extracted = z.extract(parts[1], path=tmp)
-                            report_text = self._run_deep_logic_on_file(extracted, row)
-                else:
-                    report_text = self._run_deep_logic_on_file(path, row)
-                row['deep_output_raw'] = report_text; row['deep_output'] = report_text
+                with open_nested(path) as source:
+                    report = self._run_deep_logic_on_file(source, row, path)
+                self._set_deep_report(row, report)
             except Exception as e: row['deep_output'] = f"[Scan Failed: {e}]"
         self.after(0, lambda: [self.progress.stop(), self.progress.grid_forget(), self.status_var.set("Ready."), export_to_excel(self.table.table_data, self.table.columns)])
 
@@ -1096,5 +1490,7 @@ GitHub: https://github.com/Rasmus-Riis/OfficeRecon
         t.configure(state="disabled")
 
 if __name__ == "__main__":
+    # Required for the scan worker processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     app = OfficeReconApp()
     app.mainloop()
\ No newline at end of file
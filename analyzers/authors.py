@@ -1,4 +1,4 @@
-from utils.helpers import NS, log_info, log_success, log_warning
+from utils.helpers import NS, log_info, log_success, log_warning, emit_finding
 
 class AuthorAnalyzer:
     def __init__(self, loader):
@@ -24,10 +24,9 @@ class AuthorAnalyzer:
             if val: self.ordered_rsids.append(val)
 
     def _scan_track_changes(self):
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree: return
-        changes = tree.xpath('//w:ins | //w:del', namespaces=NS)
-        for node in changes:
+        model = self.loader.get_document_model()
+        if not model: return
+        for node in model.tracked_changes:
             author = node.get(f"{{{NS['w']}}}author")
             rsid = node.get(f"{{{NS['w']}}}rsidR")
             if author and rsid and rsid not in self.rsid_to_user:
@@ -80,16 +79,12 @@ class AuthorAnalyzer:
 
     def _visualize_authorship(self):
         print("\n[Content Attribution - Who wrote what?]")
-        # Marker line for the GUI parser to find
-        print(">>>START_SCRIPT_VIEW<<<") 
         
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree: return
+        model = self.loader.get_document_model()
+        if not model: return
 
-        paragraphs = tree.xpath('//w:p', namespaces=NS)
-        
-        for p in paragraphs:
-            rsid = p.get(f"{{{NS['w']}}}rsidR")
+        for para in model.paragraphs:
+            rsid = para['rsid']
             if not rsid: continue
 
             if rsid in self.rsid_to_user:
@@ -97,9 +92,8 @@ class AuthorAnalyzer:
             else:
                 owner = f"Unknown [{rsid}]"
             
-            text_nodes = p.xpath('.//w:t', namespaces=NS)
-            full_text = "".join([t.text for t in text_nodes if t.text])
+            full_text = model.paragraph_text(para['element'])
             
             if full_text.strip():
-                # We print a specific delimiter "|||" so the GUI can split it easily
-                print(f"{owner}|||{full_text}")
\ No newline at end of file
+                # One record per paragraph: the author tab renders these as a script
+                emit_finding('text', owner, full_text, category='attribution')
\ No newline at end of file
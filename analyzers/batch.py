@@ -2,41 +2,88 @@ import os
 import zipfile
 import re
 import datetime
-import hashlib
 from core.loader import DocLoader
+from core.watchdog import Deadline, ScanTimeout
+from core.result_cache import get_cache, PATH_FIELDS
+from core.hashing import safe_hash_source, ALGORITHMS
+from core.nested import open_nested, join_nested, source_size, read_head
+from core.containers import member_label
+from core.document_model import W
 from utils.helpers import NS
 
+# Time budget for the quick batch scan of a single file (seconds)
+BATCH_FILE_TIMEOUT = 60
+
+
+def scan_task(filepath, member=None, triage=False, triage_props=False, cache_path=None, digests=None):
+    """
+    Process-pool entry point (must stay a top-level function so it pickles).
+    Scans a file, or the document nested in `filepath` at `member` (a
+    provenance chain from core.containers, e.g. "inner.zip [>>] a.docx"), and returns
+    the row dict with threats still as a list. `digests` is passed when the
+    hash stage already read the file (or member). Members are scanned straight
+    from the container (see core.nested), never extracted.
+    """
+    scanner = BatchAnalyzer(triage=triage, triage_props=triage_props, cache_path=cache_path)
+    if member is None:
+        return scanner.analyze(filepath, digests)
+    with open_nested(join_nested(filepath, member)) as source:
+        d = scanner.analyze(source, digests, name=member_label(member))
+    d['filename'] = member_label(member)
+    return d
+
 class BatchAnalyzer:
-    def analyze(self, filepath):
-        md5_val = self._get_md5(filepath)
+    def __init__(self, triage=False, triage_props=False, cache_path=None):
+        # Triage: rank a corpus from the ZIP central directory alone (no hashing,
+        # no inflation); triage_props also reads docProps core/app (or meta.xml)
+        self.triage = triage
+        self.triage_props = triage_props
+        # Full-scan rows are reused from the result cache by content MD5
+        self.cache = get_cache(cache_path) if cache_path else None
 
-        data = {
-            "filename": os.path.basename(filepath),
-            "md5": md5_val,
-            "title": "", "type": "ERR",
-            "size": f"{os.path.getsize(filepath)/1024:.1f} KB",
-            "verdict": "Unknown", "generator": "",
-            "fs_created": "", "fs_modified": "", "fs_accessed": "",
-            "zip_modified": "", "meta_created": "", "meta_modified": "",
-            "author": "", "last_mod_by": "", "printed": "", 
-            "status": "", "category": "", "template": "", 
-            "rev_count": "0", "edit_time": "0",
-            "pages": "0", "words": "0", "paragraphs": "0", "slides": "0", 
-            "rsid_count": "0", "platform": "Unknown", 
-            "threats": [], "media_count": "0", "exif": "No",
-            "leaked_user": "", "hidden_text": "",
-            "ppt_rev_dates": "",
-            "forensic_artifacts": [] 
-        }
+    def analyze(self, source, digests=None, name=None):
+        """
+        Row for `source`: a path, or an in-memory document (bytes or a
+        seekable stream, see core.nested) labelled `name`.
+        """
+        name = name or source
+        if self.triage:
+            return self._triage(source, name)
 
-        try:
-            stat = os.stat(filepath)
-            data["fs_created"] = self._fmt_fs(stat.st_ctime)
-            data["fs_modified"] = self._fmt_fs(stat.st_mtime)
-            data["fs_accessed"] = self._fmt_fs(stat.st_atime)
-        except: pass
+        digests = digests or safe_hash_source(source)
+        data = self.cached_row(source, digests, name)
+        if data is not None:
+            return data
+
+        data = self._new_row(source, digests, name)
+        self._scan(source, data, name)
+        # Timed-out or unopenable scans may be transient; let the next run try again
+        if self.cache is not None and "TIMEOUT" not in data["threats"] and data["type"] != "ERR":
+            self.cache.put_row(data["md5"], data)
+        return data
+
+    def cached_row(self, source, digests, name=None):
+        """Row for `source` from the result cache, or None on a miss (or with no cache)."""
+        if self.cache is None:
+            return None
+        cached = self.cache.get_row(digests['md5'])
+        if cached is None:
+            return None
+        return self.copy_row(cached, source, digests, name)
+
+    def copy_row(self, row, source, digests, name=None):
+        """
+        Row for `source` from the row of another file with the same content:
+        the findings are shared, path fields (name, size, filesystem times)
+        are `source`'s own.
+        """
+        data = self._new_row(source, digests, name)
+        data.update({k: v for k, v in row.items() if k not in PATH_FIELDS})
+        return data
 
-        if self._is_encrypted(filepath):
+    def _scan(self, source, data, name):
+        """Full quick scan of one file into `data` (forensic_artifacts ends up joined)."""
+        if self._is_encrypted(source, name):
             data["verdict"] = "LOCKED"
             data["threats"].append("PASSWORD PROTECTED")
             data["forensic_artifacts"] = "File is Encrypted (OLE Container)"
@@ -44,17 +91,13 @@ class BatchAnalyzer:
             return data 
 
         try:
-            loader = DocLoader(filepath)
+            loader = DocLoader(source, name=name, deadline=Deadline(BATCH_FILE_TIMEOUT, os.path.basename(name)))
             if not loader.load(): 
                 data["forensic_artifacts"] = ""
                 return data
             
             data["type"] = loader.file_type.upper()
-            try:
-                latest = max(loader.zip_ref.infolist(), key=lambda x: x.date_time)
-                dt = datetime.datetime(*latest.date_time)
-                data["zip_modified"] = dt.strftime("%d/%m/%Y %H:%M:%S")
-            except: pass
+            self._zip_modified(loader, data)
 
             if loader.file_type in ['docx', 'xlsx', 'pptx']: self._analyze_ooxml_core(loader, data)
             if loader.file_type == 'docx': self._analyze_word_specifics(loader, data)
@@ -63,28 +106,112 @@ class BatchAnalyzer:
 
             self._check_universal(loader, data)
             self._scan_embeddings(loader, data)
+            if loader.refused_members:
+                data["threats"].append("ZIP BOMB")
+                for member, reason in loader.refused_members.items():
+                    data["forensic_artifacts"].append(f"Refused {member}: {reason}")
+            loader.close()
+        except ScanTimeout as e:
             loader.close()
-        except: pass
+            data["threats"].append("TIMEOUT")
+            data["forensic_artifacts"].append(str(e))
+        except Exception: pass
         
         data["forensic_artifacts"] = " | ".join(data["forensic_artifacts"])
         return data
 
-    def _get_md5(self, filepath):
+    def _triage(self, source, name):
+        """
+        Central-directory-only pass: type, ZIP timestamps and member-name
+        indicators (macros, thumbnail, media, embeddings) without reading any
+        part bodies. Verdict stays TRIAGE until the file gets a full scan.
+        """
+        data = self._new_row(source, name=name)
+        data["verdict"] = "TRIAGE"
+
+        if self._is_encrypted(source, name):
+            data["verdict"] = "LOCKED"
+            data["threats"].append("PASSWORD PROTECTED")
+            data["forensic_artifacts"] = "File is Encrypted (OLE Container)"
+            data["type"] = "OLE/ENC"
+            return data
+
+        loader = DocLoader(source, name=name, buffered=False, deadline=Deadline(BATCH_FILE_TIMEOUT, os.path.basename(name)))
         try:
-            hash_md5 = hashlib.md5()
-            with open(filepath, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""): hash_md5.update(chunk)
-            return hash_md5.hexdigest()
-        except: return "Error"
+            if not loader.load():
+                data["forensic_artifacts"] = ""
+                return data
 
-    def _is_encrypted(self, filepath):
+            data["type"] = loader.file_type.upper()
+            self._zip_modified(loader, data)
+            if self.triage_props:
+                if loader.file_type in ['docx', 'xlsx', 'pptx']: self._analyze_ooxml_core(loader, data)
+                elif loader.file_type in ['odt', 'ods', 'odp']: self._analyze_odt(loader, data)
+
+            self._check_member_names(loader, data)
+            emb_files = loader.list_files(prefix=('word/embeddings/', 'xl/embeddings/', 'ppt/embeddings/'))
+            if emb_files:
+                data["forensic_artifacts"].append(f"{len(emb_files)} Embedded Objects")
+        except ScanTimeout as e:
+            data["threats"].append("TIMEOUT")
+            data["forensic_artifacts"].append(str(e))
+        except Exception: pass
+        finally:
+            loader.close()
+
+        data["forensic_artifacts"] = " | ".join(data["forensic_artifacts"])
+        return data
+
+    def _new_row(self, source, digests=None, name=None):
+        """Empty row for `source`; digests (md5/sha1/sha256) stay "" for triage rows."""
+        name = name or source
+        data = {
+            "filename": os.path.basename(name),
+            "md5": "", "sha1": "", "sha256": "",
+            "title": "", "type": "ERR",
+            "size": f"{source_size(source)/1024:.1f} KB",
+            "verdict": "Unknown", "generator": "",
+            "fs_created": "", "fs_modified": "", "fs_accessed": "",
+            "zip_modified": "", "meta_created": "", "meta_modified": "",
+            "author": "", "last_mod_by": "", "printed": "", 
+            "status": "", "category": "", "template": "", 
+            "rev_count": "0", "edit_time": "0",
+            "pages": "0", "words": "0", "paragraphs": "0", "slides": "0", 
+            "rsid_count": "0", "platform": "Unknown", 
+            "threats": [], "media_count": "0", "exif": "No",
+            "leaked_user": "", "hidden_text": "",
+            "ppt_rev_dates": "",
+            "forensic_artifacts": [] 
+        }
+        if digests:
+            data.update({alg: digests[alg] for alg in ALGORITHMS})
+
+        # Filesystem times only exist for files on disk, not nested members
+        if not isinstance(source, str):
+            return data
         try:
-            with open(filepath, 'rb') as f: header = f.read(8)
+            stat = os.stat(source)
+            data["fs_created"] = self._fmt_fs(stat.st_ctime)
+            data["fs_modified"] = self._fmt_fs(stat.st_mtime)
+            data["fs_accessed"] = self._fmt_fs(stat.st_atime)
+        except Exception: pass
+        return data
+
+    def _zip_modified(self, loader, data):
+        try:
+            latest = max(loader.zip_ref.infolist(), key=lambda x: x.date_time)
+            dt = datetime.datetime(*latest.date_time)
+            data["zip_modified"] = dt.strftime("%d/%m/%Y %H:%M:%S")
+        except Exception: pass
+
+    def _is_encrypted(self, source, name):
+        try:
+            header = read_head(source, 8)
             if header == b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1':
-                ext = os.path.splitext(filepath)[1].lower()
+                ext = os.path.splitext(name)[1].lower()
                 if ext in ['.docx', '.docm', '.xlsx', '.xlsm', '.pptx', '.pptm']: return True
             return False
-        except: return False
+        except Exception: return False
 
     def _analyze_ooxml_core(self, loader, data):
         core = loader.get_xml_tree('docProps/core.xml')
@@ -116,29 +243,60 @@ class BatchAnalyzer:
             if m <= 1 and w > 500: 
                 data["threats"].append("HIGH VELOCITY")
                 data["forensic_artifacts"].append(f"High Velocity: {w} words in {m} min")
-        except: pass
-        settings = loader.get_xml_tree('word/settings.xml')
-        if settings:
-            rsids = settings.xpath('//w:rsid', namespaces=NS)
-            data["rsid_count"] = str(len(rsids))
-            if len(rsids) < 5: 
+        except Exception: pass
+        rsid_count = self._count_rsids(loader)
+        if rsid_count is not None:
+            data["rsid_count"] = str(rsid_count)
+            if rsid_count < 5: 
                 data["verdict"] = "SYNTHETIC"
-                data["forensic_artifacts"].append(f"Synthetic RSID Count: {len(rsids)}")
-            elif len(rsids) > 100: data["verdict"] = "ORGANIC"
+                data["forensic_artifacts"].append(f"Synthetic RSID Count: {rsid_count}")
+            elif rsid_count > 100: data["verdict"] = "ORGANIC"
             else: data["verdict"] = "MIXED"
-        doc = loader.get_xml_tree('word/document.xml')
-        if doc:
-            hidden_nodes = doc.xpath("//w:color[@w:val='FFFFFF']", namespaces=NS)
-            if hidden_nodes:
-                data["threats"].append("HIDDEN TEXT")
-                snippets = []
-                for node in hidden_nodes[:3]:
+        has_hidden, snippets = self._find_white_text(loader)
+        if has_hidden:
+            data["threats"].append("HIDDEN TEXT")
+            if snippets: data["forensic_artifacts"].append(f"Hidden: '{', '.join(snippets)}...'")
+
+    def _count_rsids(self, loader):
+        """Number of w:rsid entries in settings.xml, or None if the part is missing."""
+        if not loader.file_exists('word/settings.xml'): return None
+        if loader.is_large_part('word/settings.xml'):
+            return sum(1 for _ in loader.iter_elements('word/settings.xml', tags=f"{W}rsid"))
+        settings = loader.get_xml_tree('word/settings.xml')
+        if not settings: return None
+        return len(settings.xpath('//w:rsid', namespaces=NS))
+
+    def _find_white_text(self, loader):
+        """Detect FFFFFF-colored runs; returns (found, first three snippets)."""
+        found = False
+        snippets = []
+        if loader.is_large_part('word/document.xml'):
+            # Stream paragraphs so huge documents never build a full tree; same
+            # predicate as below (any w:color under the paragraph, snippet from
+            # its grandparent), first three matches
+            matches = 0
+            for para in loader.iter_elements('word/document.xml', tags=f"{W}p"):
+                for color in para.iter(f"{W}color"):
+                    if color.get(f"{W}val") != 'FFFFFF': continue
+                    found = True
                     try:
-                        parent_run = node.getparent().getparent()
-                        text = "".join(parent_run.xpath(".//w:t/text()", namespaces=NS))
+                        text = "".join(t.text or '' for t in color.getparent().getparent().iter(f"{W}t"))
                         if text: snippets.append(text[:20])
-                    except: pass
-                if snippets: data["forensic_artifacts"].append(f"Hidden: '{', '.join(snippets)}...'")
+                    except Exception: pass
+                    matches += 1
+                    if matches >= 3: return found, snippets
+            return found, snippets
+
+        doc = loader.get_xml_tree('word/document.xml')
+        if not doc: return False, []
+        hidden_nodes = doc.xpath("//w:color[@w:val='FFFFFF']", namespaces=NS)
+        for node in hidden_nodes[:3]:
+            try:
+                parent_run = node.getparent().getparent()
+                text = "".join(parent_run.xpath(".//w:t/text()", namespaces=NS))
+                if text: snippets.append(text[:20])
+            except Exception: pass
+        return bool(hidden_nodes), snippets
 
     def _analyze_ppt_deep(self, loader, data):
         app = loader.get_xml_tree('docProps/app.xml')
@@ -181,12 +339,19 @@ class BatchAnalyzer:
             data["author"] = self._val(meta, '//dc:creator', ns)
             data["generator"] = self._val(meta, '//meta:generator', ns)
 
-    def _check_universal(self, loader, data):
-        if any(f.endswith('vbaProject.bin') for f in loader.zip_ref.namelist()):
+    def _check_member_names(self, loader, data):
+        """Indicators that only need the member list (central directory)."""
+        if loader.list_files(suffix='vbaProject.bin'):
             data["threats"].append("MACROS")
             data["forensic_artifacts"].append("VBA Macros Detected")
-        if any('thumbnail' in f.lower() for f in loader.zip_ref.namelist()):
+        if loader.find_files('thumbnail'):
             data["threats"].append("THUMBNAIL")
+        media = loader.list_files(prefix=('word/media/', 'xl/media/', 'ppt/media/', 'Pictures/'))
+        data["media_count"] = str(len(media))
+        if media: data["exif"] = "Yes"
+
+    def _check_universal(self, loader, data):
+        self._check_member_names(loader, data)
         if loader.file_type == 'docx':
             rels = loader.get_xml_tree('word/_rels/document.xml.rels')
             if rels:
@@ -196,17 +361,15 @@ class BatchAnalyzer:
                         data["threats"].append("INJECTION")
                         data["forensic_artifacts"].append(f"Remote Template: {t.get('Target')}")
                         break
-        media = [f for f in loader.zip_ref.namelist() if f.startswith(('word/media/', 'xl/media/', 'ppt/media/', 'Pictures/'))]
-        data["media_count"] = str(len(media))
-        if media: data["exif"] = "Yes"
 
     def _scan_embeddings(self, loader, data):
-        emb_files = [f for f in loader.zip_ref.namelist() if f.startswith(('word/embeddings/', 'xl/embeddings/', 'ppt/embeddings/'))]
+        emb_files = loader.list_files(prefix=('word/embeddings/', 'xl/embeddings/', 'ppt/embeddings/'))
         if not emb_files: return
         user_pat = re.compile(rb'(?:Users|home)[\\/]([^\\/]+)[\\/]')
         for ef in emb_files:
             try:
-                content = loader.zip_ref.read(ef)
+                content = loader.get_bytes(ef)
+                if content is None: continue
                 match = user_pat.search(content)
                 if match:
                     user = match.group(1).decode('utf-8', errors='ignore')
@@ -216,17 +379,17 @@ class BatchAnalyzer:
                             data["threats"].append("USER LEAK")
                             data["forensic_artifacts"].append(f"Sys Path User: {user}")
                         return
-            except: pass
+            except Exception: pass
 
     def _val(self, tree, xpath, ns):
         try:
             el = tree.xpath(xpath, namespaces=ns)
             return el[0].text if el and el[0].text else ""
-        except: return ""
+        except Exception: return ""
 
     def _fmt_fs(self, ts):
         try: return datetime.datetime.fromtimestamp(ts).astimezone().strftime("%d/%m/%Y %H:%M:%S %z")
-        except: return ""
+        except Exception: return ""
 
     def _fmt_iso(self, iso):
         if not iso: return ""
@@ -237,4 +400,4 @@ class BatchAnalyzer:
             if "." in iso: iso = iso.split(".")[0] + iso[-6:] if "+" in iso[-6:] else iso.split(".")[0]
             dt = datetime.datetime.fromisoformat(iso)
             return dt.strftime("%d/%m/%Y %H:%M:%S %z") if dt.tzinfo else dt.strftime("%d/%m/%Y %H:%M:%S")
-        except: return iso.replace("T", " ")
\ No newline at end of file
+        except Exception: return iso.replace("T", " ")
\ No newline at end of file
@@ -14,10 +14,10 @@ class DeepScanAnalyzer:
 
     def _scan_deleted_text(self):
         """Generic: Flags ANY text marked as deleted (Track Changes)."""
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree: return
+        model = self.loader.get_document_model()
+        if not model: return
 
-        deleted_nodes = tree.xpath('//w:delText', namespaces=NS)
+        deleted_nodes = model.elements['delText']
         
         if deleted_nodes:
             log_warning(f"Found {len(deleted_nodes)} fragments of deleted text (Track Changes).")
@@ -55,7 +55,7 @@ class DeepScanAnalyzer:
     def _scan_custom_xml_namespaces(self):
         """Generic: Extracts specific Schema URLs from customXml to identify software."""
         # Find all customXml items in the ZIP
-        custom_files = [f for f in self.loader.zip_ref.namelist() if f.startswith('customXml/item')]
+        custom_files = self.loader.list_files(prefix='customXml/item')
         
         if not custom_files:
             return
@@ -64,7 +64,8 @@ class DeepScanAnalyzer:
 
         for cf in custom_files:
             try:
-                xml_content = self.loader.zip_ref.read(cf)
+                xml_content = self.loader.get_bytes(cf)
+                if xml_content is None: continue
                 root = etree.fromstring(xml_content)
                 
                 # Check all namespaces defined in this file
@@ -72,7 +73,7 @@ class DeepScanAnalyzer:
                     # Filter out the standard Office crap so we only see the interesting 3rd party stuff
                     if url and "schemas.openxmlformats.org" not in url and "schemas.microsoft.com" not in url:
                         found_schemas.add(url)
-            except:
+            except Exception:
                 continue
 
         if found_schemas:
@@ -16,14 +16,13 @@ class DeletedContentAnalyzer:
     def _find_orphaned_media(self):
         """Find media files in the archive that aren't referenced in any relationship file."""
         # Get all media files
-        media_files = [f for f in self.loader.zip_ref.namelist() 
-                      if f.startswith('word/media/') and not f.endswith('/')]
+        media_files = [f for f in self.loader.list_files(prefix='word/media/') if not f.endswith('/')]
         
         if not media_files:
             return
         
         # Get all relationship files
-        rel_files = [f for f in self.loader.zip_ref.namelist() if f.endswith('.rels')]
+        rel_files = self.loader.list_files(suffix='.rels')
         
         # Build set of referenced media
         referenced_media = set()
@@ -56,8 +55,7 @@ class DeletedContentAnalyzer:
     def _find_orphaned_xml(self):
         """Find XML parts that aren't properly linked."""
         # Get all XML files in word/
-        xml_files = [f for f in self.loader.zip_ref.namelist() 
-                    if f.startswith('word/') and f.endswith('.xml') and '/' not in f[5:-4]]
+        xml_files = [f for f in self.loader.list_files(prefix='word/', suffix='.xml') if '/' not in f[5:-4]]
         
         # Expected files
         expected = [
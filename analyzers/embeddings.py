@@ -14,7 +14,7 @@ class EmbeddingAnalyzer:
         """
         Scans binary OLE objects for leaked local paths and usernames.
         """
-        embedding_files = [f for f in self.loader.zip_ref.namelist() if f.startswith('word/embeddings/')]
+        embedding_files = self.loader.list_files(prefix='word/embeddings/')
         
         if not embedding_files:
             return
@@ -31,7 +31,8 @@ class EmbeddingAnalyzer:
 
         for ef in embedding_files:
             try:
-                binary_data = self.loader.zip_ref.read(ef)
+                binary_data = self.loader.get_bytes(ef)
+                if binary_data is None: continue
                 
                 # Find Paths
                 matches = path_pattern.findall(binary_data)
@@ -40,7 +41,7 @@ class EmbeddingAnalyzer:
                         path_str = m.decode('utf-8', errors='ignore')
                         if "Program Files" not in path_str and "System32" not in path_str:
                             leaked_paths.add(path_str)
-                    except: continue
+                    except Exception: continue
 
                 # Find Users specifically
                 user_matches = user_pattern.findall(binary_data)
@@ -49,9 +50,9 @@ class EmbeddingAnalyzer:
                         user_str = u.decode('utf-8', errors='ignore')
                         if user_str.lower() not in ['public', 'default', 'admin']:
                             leaked_users.add(user_str)
-                    except: continue
+                    except Exception: continue
 
-            except: continue
+            except Exception: continue
 
         if leaked_users:
             log_danger(f"Leaked System Usernames detected in binary blobs:")
@@ -68,7 +69,7 @@ class EmbeddingAnalyzer:
                 log_success("No leaked local paths found in embeddings.")
 
     def _scan_people_xml(self):
-        if 'word/people.xml' not in self.loader.zip_ref.namelist(): return
+        if not self.loader.file_exists('word/people.xml'): return
         tree = self.loader.get_xml_tree('word/people.xml')
         if not tree: return
         
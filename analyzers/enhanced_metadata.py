@@ -88,10 +88,10 @@ class EnhancedMetadataAnalyzer:
         languages = set()
         
         if self.loader.file_type == 'docx':
-            tree = self.loader.get_xml_tree('word/document.xml')
-            if tree:
+            model = self.loader.get_document_model()
+            if model:
                 # Check language attributes in runs
-                lang_elems = tree.xpath('//w:lang', namespaces=NS)
+                lang_elems = model.elements['lang']
                 for elem in lang_elems:
                     lang_val = elem.get(f"{{{NS['w']}}}val")
                     if lang_val:
@@ -237,29 +237,28 @@ class EnhancedMetadataAnalyzer:
         paths = set()
         
         # Check all XML files for embedded paths
-        for xml_file in self.loader.zip_ref.namelist():
-            if xml_file.endswith('.xml'):
-                tree = self.loader.get_xml_tree(xml_file)
-                if tree:
-                    # Convert to string to search for paths
-                    import xml.etree.ElementTree as ET
-                    # Handle both Element and ElementTree objects
-                    root = tree.getroot() if hasattr(tree, 'getroot') else tree
-                    xml_str = ET.tostring(root, encoding='unicode', method='text')
-                    
-                    # Find Windows paths with usernames
-                    # Pattern: C:\Users\username\...
-                    user_paths = re.findall(r'[Cc]:\\[Uu]sers\\([^\\]+)\\', xml_str)
-                    usernames.update(user_paths)
-                    
-                    # Find computer names from UNC paths
-                    # Pattern: \\computername\share
-                    comp_names = re.findall(r'\\\\([^\\]+)\\', xml_str)
-                    computer_names.update(comp_names)
-                    
-                    # Collect interesting paths
-                    all_paths = re.findall(r'[A-Z]:\\(?:[^\\<>"|\r\n]+\\)*[^\\<>"|\r\n]+', xml_str, re.IGNORECASE)
-                    paths.update(all_paths[:10])  # Limit to first 10 unique paths
+        for xml_file in self.loader.list_files(suffix='.xml'):
+            tree = self.loader.get_xml_tree(xml_file)
+            if tree:
+                # Convert to string to search for paths
+                import xml.etree.ElementTree as ET
+                # Handle both Element and ElementTree objects
+                root = tree.getroot() if hasattr(tree, 'getroot') else tree
+                xml_str = ET.tostring(root, encoding='unicode', method='text')
+                
+                # Find Windows paths with usernames
+                # Pattern: C:\Users\username\...
+                user_paths = re.findall(r'[Cc]:\\[Uu]sers\\([^\\]+)\\', xml_str)
+                usernames.update(user_paths)
+                
+                # Find computer names from UNC paths
+                # Pattern: \\computername\share
+                comp_names = re.findall(r'\\\\([^\\]+)\\', xml_str)
+                computer_names.update(comp_names)
+                
+                # Collect interesting paths
+                all_paths = re.findall(r'[A-Z]:\\(?:[^\\<>"|\r\n]+\\)*[^\\<>"|\r\n]+', xml_str, re.IGNORECASE)
+                paths.update(all_paths[:10])  # Limit to first 10 unique paths
         
         if usernames:
             log_warning(f"Found {len(usernames)} username(s) in file paths:")
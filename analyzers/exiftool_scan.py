@@ -2,10 +2,183 @@ import subprocess
 import os
 import sys
 import json
+import queue
+import atexit
+import threading
+import time
+from core.nested import source_bytes
+
+# Seconds before a hung exiftool process is killed
+EXIFTOOL_TIMEOUT = 60
+# Long-lived `exiftool -stay_open` processes; Perl start-up costs far more than a request
+EXIFTOOL_WORKERS = 2
+# Files per `-json` request in batch scans
+EXIFTOOL_BATCH = 64
+
+# Batch table columns filled from ExifTool tags (row key -> "Group:Tag")
+EXIF_COLUMNS = {
+    'exif_mime': "File:MIMEType",
+    'exif_app_version': "XML:AppVersion",
+    'exif_company': "XML:Company",
+    'exif_warning': "ExifTool:Warning",
+}
+
+# File group tags that describe the path rather than the content; they are
+# left out of the content report and printed per path by FileSystemAnalyzer
+PATH_TAGS = ('File:FileName', 'File:Directory', 'File:FileModifyDate', 'File:FileAccessDate',
+             'File:FileInodeChangeDate', 'File:FileCreateDate', 'File:FilePermissions',
+             'File:FileAttributes')
+
+
+def _startupinfo():
+    # Run hidden window to avoid popping up black boxes
+    if os.name != 'nt':
+        return None
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    return startupinfo
+
+
+def _pump(stream, lines):
+    """Reader thread: pipe lines into a queue (None at EOF), so waits can time out."""
+    for line in iter(stream.readline, b''):
+        lines.put(line)
+    lines.put(None)
+
+
+class ExifToolProcess:
+    """
+    One `exiftool -stay_open True -@ -` process. Arguments go in on stdin, one
+    per line; each request ends with -execute<n>, and its output on stdout and
+    stderr ends with a {ready<n>} line, so responses are matched by sequence number.
+    """
+    def __init__(self, exif_path):
+        self.proc = subprocess.Popen(
+            [exif_path, "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            startupinfo=_startupinfo()
+        )
+        self._seq = 0
+        self._stdout = queue.Queue()
+        self._stderr = queue.Queue()
+        for stream, lines in ((self.proc.stdout, self._stdout), (self.proc.stderr, self._stderr)):
+            threading.Thread(target=_pump, args=(stream, lines), daemon=True).start()
+
+    def execute(self, args, timeout=EXIFTOOL_TIMEOUT):
+        """(stdout, stderr) bytes of one request; raises TimeoutExpired if exiftool hangs."""
+        self._seq += 1
+        marker = f"{{ready{self._seq}}}".encode()
+        # -echo4 puts the same marker on stderr once the request is done
+        request = list(args) + ["-echo4", marker.decode(), f"-execute{self._seq}"]
+        self.proc.stdin.write(("\n".join(request) + "\n").encode('utf-8'))
+        self.proc.stdin.flush()
+        deadline = time.monotonic() + timeout
+        stdout = self._read_until(self._stdout, marker, deadline, args, timeout)
+        stderr = self._read_until(self._stderr, marker, deadline, args, timeout)
+        return stdout, stderr
+
+    def _read_until(self, lines, marker, deadline, args, timeout):
+        out = []
+        while True:
+            try:
+                line = lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                raise subprocess.TimeoutExpired(args, timeout)
+            if line is None:
+                raise OSError(f"exiftool exited (code {self.proc.poll()})")
+            if line.strip() == marker:
+                return b"".join(out)
+            out.append(line)
+
+    def close(self):
+        """Ask exiftool to exit; kill it if it does not."""
+        try:
+            self.proc.stdin.write(b"-stay_open\nFalse\n")
+            self.proc.stdin.flush()
+            self.proc.stdin.close()
+            self.proc.wait(timeout=5)
+        except Exception:
+            self.kill()
+
+    def kill(self):
+        try:
+            self.proc.kill()
+            self.proc.wait(timeout=5)
+        except Exception:
+            pass
+
+
+class ExifToolPool:
+    """
+    Up to `size` ExifToolProcess workers, started on first use and reused.
+    A worker that times out or dies is killed; the next request starts a fresh one.
+    """
+    def __init__(self, exif_path, size=EXIFTOOL_WORKERS):
+        self.exif_path = exif_path
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._version = None
+
+    def execute(self, args, timeout=EXIFTOOL_TIMEOUT):
+        with self._slots:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                worker = ExifToolProcess(self.exif_path)
+            try:
+                result = worker.execute(args, timeout)
+            except Exception:
+                worker.kill()
+                raise
+            self._idle.put(worker)
+            return result
+
+    def version(self, timeout=EXIFTOOL_TIMEOUT):
+        """ExifTool version, asked once per pool."""
+        if self._version is None:
+            stdout, _ = self.execute(["-ver"], timeout)
+            self._version = stdout.decode('utf-8', errors='ignore').strip()
+        return self._version
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_pool(exif_path):
+    """Process-wide ExifToolPool for the exiftool at `exif_path`."""
+    with _pools_lock:
+        pool = _pools.get(exif_path)
+        if pool is None:
+            pool = _pools[exif_path] = ExifToolPool(exif_path)
+        return pool
+
+@atexit.register
+def close_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+
 
 class ExifToolScanner:
-    def __init__(self, filepath):
-        self.filepath = filepath
+    def __init__(self, source, timeout=EXIFTOOL_TIMEOUT):
+        # A path, a list of paths (batch scans), or an in-memory document
+        # (nested member) piped in on stdin
+        if isinstance(source, (list, tuple)):
+            self.paths, self.data = list(source), None
+        elif isinstance(source, str):
+            self.paths, self.data = [source], None
+        else:
+            self.paths, self.data = [], source_bytes(source)
+        self.timeout = timeout
         self.exif_path = self._get_exiftool_path()
 
     def _get_exiftool_path(self):
@@ -23,63 +196,104 @@ class ExifToolScanner:
 
         # 2. Look for exiftool.exe in that base directory
         exif_exe = os.path.join(base_path, "exiftool.exe")
-        
+
         # 3. Fallback: If not found, check system PATH (just in case)
         if not os.path.exists(exif_exe):
             return "exiftool" # Hope it's in the Windows PATH variable
-            
+
         return exif_exe
 
     def run(self):
-        """Runs ExifTool and prints the output to stdout (captured by OfficeRecon)."""
-        if not os.path.exists(self.filepath):
+        """Runs ExifTool and prints the tags to stdout (captured by OfficeRecon)."""
+        self.paths = [p for p in self.paths if os.path.exists(p)]
+        if self.data is None and not self.paths:
             return
 
         try:
-            # -g: Group by tag family (File, EXIF, XMP)
-            # -json: Output as JSON (easier to parse if we wanted to, but we just dump text here)
-            # For human readable report in the GUI, we stick to standard text output, or -S -G
-            
-            cmd = [self.exif_path, "-G", "-S", self.filepath]
-            
-            # Run hidden window to avoid popping up black boxes
-            startupinfo = None
-            if os.name == 'nt':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
-            process = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                startupinfo=startupinfo,
-                text=True,
-                encoding='utf-8',
-                errors='ignore'
-            )
-            
-            # Check for ExifTool errors in stderr
-            if process.stderr and "Error: File format error" in process.stderr:
+            # Print conversions (as `-G -S` shows them) for the investigator
+            results = self.read_tags(numeric=False)
+            # Check for ExifTool errors
+            if any("File format error" in str(tags.get("ExifTool:Error", "")) for tags in results.values()):
                 return "CORRUPTED"  # Signal that file is corrupted
-            
-            if process.stdout:
+
+            if results:
                 print("\n--- ExifTool Raw Metadata Analysis ---")
                 print(f"ExifTool Version : {self._get_version()}")
-                print(process.stdout)
-                
+                for path, tags in results.items():
+                    if len(results) > 1: print(f"\n{path}")
+                    for tag, value in tags.items():
+                        if tag in PATH_TAGS: continue
+                        group, _, name = tag.rpartition(':')
+                        print(f"[{group}] {name}: {value}")
+
         except Exception as e:
             print(f"[!] ExifTool Error: {e}")
             print("    (Ensure exiftool.exe is in the same folder as OfficeRecon.exe)")
 
+    def path_tags(self):
+        """{"File:Tag": value} of the PATH_TAGS of a path source; {} for in-memory documents or on failure."""
+        if self.data is not None or len(self.paths) != 1:
+            return {}
+        try:
+            tags = next(iter(self.read_tags(numeric=False).values()), {})
+        except Exception:
+            return {}
+        return {tag: tags[tag] for tag in PATH_TAGS if tag in tags}
+
+    def read_tags(self, numeric=True):
+        """
+        {path: {"Group:Tag": value}}, from one `-json -G` call per
+        EXIFTOOL_BATCH paths; an in-memory document is keyed "-". Files
+        ExifTool could not read are missing from the result. numeric=True
+        (-n) gives raw values for table columns; False gives ExifTool's
+        print conversions ("Deflated" rather than 8) for reports.
+        """
+        # -G: group names in the keys, -n: numeric values instead of print conversions
+        args = ["-json", "-G"] + (["-n"] if numeric else [])
+        if self.data is not None:
+            stdout, _ = self._run_once(args + ["-"])
+            return self._parse(stdout, ["-"])
+        results = {}
+        pool = get_pool(self.exif_path)
+        for i in range(0, len(self.paths), EXIFTOOL_BATCH):
+            batch = self.paths[i:i + EXIFTOOL_BATCH]
+            # Files go to the shared -stay_open pool; stdin carries its arguments as UTF-8
+            stdout, _ = pool.execute(["-charset", "filename=utf8"] + args + batch, self.timeout)
+            results.update(self._parse(stdout, batch))
+        return results
+
+    @staticmethod
+    def _parse(stdout, paths):
+        """Map ExifTool's JSON back to the paths asked for (it reports them with forward slashes)."""
+        text = stdout.decode('utf-8', errors='ignore').strip()
+        if not text:
+            return {}
+        asked = {os.path.normcase(os.path.normpath(p)): p for p in paths}
+        results = {}
+        for tags in json.loads(text):
+            source = str(tags.pop("SourceFile", "-"))
+            results[asked.get(os.path.normcase(os.path.normpath(source)), source)] = tags
+        return results
+
+    def _run_once(self, args):
+        """One-off exiftool run for an in-memory document: "-" reads it from stdin, so no temp file."""
+        process = subprocess.run(
+            [self.exif_path] + args,
+            input=self.data,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            startupinfo=_startupinfo(),
+            timeout=self.timeout
+        )
+        return process.stdout, process.stderr
+
     def _get_version(self):
         try:
-            cmd = [self.exif_path, "-ver"]
-            startupinfo = None
-            if os.name == 'nt':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                
-            res = subprocess.run(cmd, stdout=subprocess.PIPE, text=True, startupinfo=startupinfo)
-            return res.stdout.strip()
-        except:
-            return "Unknown"
\ No newline at end of file
+            return get_pool(self.exif_path).version(self.timeout)
+        except Exception:
+            return "Unknown"
+
+
+def exif_columns(tags):
+    """Table columns of a row from its ExifTool tags (see EXIF_COLUMNS)."""
+    return {key: str(tags[tag]) if tag in tags else "" for key, tag in EXIF_COLUMNS.items()}
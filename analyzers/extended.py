@@ -16,9 +16,9 @@ class ExtendedAnalyzer:
         """
         # Standard location for the thumbnail
         thumb_path = 'docProps/thumbnail.jpeg'
-        if thumb_path not in self.loader.zip_ref.namelist():
+        if not self.loader.file_exists(thumb_path):
             # Sometimes it's an EMF or WMF file
-            thumb_path = next((f for f in self.loader.zip_ref.namelist() if f.startswith('docProps/thumbnail')), None)
+            thumb_path = next(iter(self.loader.list_files(prefix='docProps/thumbnail')), None)
 
         if thumb_path:
             size_kb = self.loader.zip_ref.getinfo(thumb_path).file_size / 1024
@@ -33,7 +33,7 @@ class ExtendedAnalyzer:
         Scans customXml files for SharePoint/OneDrive metadata (GUIDs, URLs).
         """
         # Find all custom xml items
-        custom_files = [f for f in self.loader.zip_ref.namelist() if f.startswith('customXml/item')]
+        custom_files = self.loader.list_files(prefix='customXml/item')
         
         found_corp_data = False
         
@@ -41,11 +41,11 @@ class FieldAnalyzer:
         Scans document.xml for Field Codes (w:instrText).
         These reveal dynamic data like old file paths, authors, or hyperlinks.
         """
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree: return
+        model = self.loader.get_document_model()
+        if not model: return
 
         # Find all instruction text nodes
-        instr_nodes = tree.xpath('//w:instrText', namespaces=NS)
+        instr_nodes = model.elements['instrText']
         
         found_fields = []
         for node in instr_nodes:
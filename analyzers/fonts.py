@@ -56,12 +56,12 @@ class FontAnalyzer:
 
     def _analyze_font_usage(self):
         """Analyze font usage throughout document."""
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree:
+        model = self.loader.get_document_model()
+        if not model:
             return
 
         # Get all font references
-        font_refs = tree.xpath('//w:rFonts', namespaces=NS)
+        font_refs = model.elements['rFonts']
         
         fonts_used = set()
         for ref in font_refs:
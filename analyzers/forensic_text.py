@@ -6,7 +6,8 @@ hidden text, and temporal anomalies.
 
 import re
 import datetime
-from utils.helpers import NS, log_info, log_warning, log_danger, log_success
+from utils.helpers import log_info, log_warning, log_danger, log_success
+from core.document_model import W, run_record
 from xml.etree import ElementTree as ET
 
 class ForensicTextAnalyzer:
@@ -48,18 +49,17 @@ class ForensicTextAnalyzer:
                 
             # Check headers/footers
             for part in ['header', 'footer']:
-                for xml_file in self.loader.zip_ref.namelist():
-                    if xml_file.startswith(f'word/{part}') and xml_file.endswith('.xml'):
-                        tree = self.loader.get_xml_tree(xml_file)
-                        if tree:
-                            text_content = extract_text_from_tree(tree)
-                            emails = re.findall(email_pattern, text_content)
-                            self.emails.update(emails)
+                for xml_file in self.loader.list_files(prefix=f'word/{part}', suffix='.xml'):
+                    tree = self.loader.get_xml_tree(xml_file)
+                    if tree:
+                        text_content = extract_text_from_tree(tree)
+                        emails = re.findall(email_pattern, text_content)
+                        self.emails.update(emails)
                             
         elif self.loader.file_type == 'xlsx':
             from openpyxl import load_workbook
             try:
-                wb = load_workbook(self.loader.filepath, read_only=True, data_only=True)
+                wb = load_workbook(self.loader.open_source(), read_only=True, data_only=True)
                 for sheet in wb.worksheets:
                     for row in sheet.iter_rows():
                         for cell in row:
@@ -116,7 +116,7 @@ class ForensicTextAnalyzer:
         elif self.loader.file_type == 'xlsx':
             from openpyxl import load_workbook
             try:
-                wb = load_workbook(self.loader.filepath, read_only=True, data_only=True)
+                wb = load_workbook(self.loader.open_source(), read_only=True, data_only=True)
                 for sheet in wb.worksheets:
                     for row in sheet.iter_rows():
                         for cell in row:
@@ -135,8 +135,8 @@ class ForensicTextAnalyzer:
                 self.unc_paths.update(paths)
         
         # Check relationships for external links
-        for rel_file in self.loader.zip_ref.namelist():
-            if '_rels' in rel_file and rel_file.endswith('.rels'):
+        for rel_file in self.loader.find_files('_rels'):
+            if rel_file.endswith('.rels'):
                 tree = self.loader.get_xml_tree(rel_file)
                 if tree:
                     rel_text = extract_text_from_tree(tree)
@@ -178,7 +178,7 @@ class ForensicTextAnalyzer:
         elif self.loader.file_type == 'xlsx':
             from openpyxl import load_workbook
             try:
-                wb = load_workbook(self.loader.filepath, read_only=True, data_only=True)
+                wb = load_workbook(self.loader.open_source(), read_only=True, data_only=True)
                 for sheet in wb.worksheets:
                     for row in sheet.iter_rows():
                         for cell in row:
@@ -214,55 +214,48 @@ class ForensicTextAnalyzer:
         if self.loader.file_type != 'docx':
             return
             
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree:
-            return
+        if self.loader.is_large_part('word/document.xml'):
+            # Pattern-match only: stream runs instead of building the tree
+            runs = (run_record(r) for r in self.loader.iter_elements('word/document.xml', tags=f"{W}r"))
+        else:
+            model = self.loader.get_document_model()
+            if not model:
+                return
+            runs = model.runs
         
         # Check for white text
         white_colors = ['FFFFFF', 'ffffff', 'white']
-        runs = tree.xpath('//w:r', namespaces=NS)
         
         for run in runs:
-            text_elem = run.find('.//w:t', NS)
-            if text_elem is not None and text_elem.text:
-                # Check text color
-                color_elem = run.find('.//w:color', NS)
-                if color_elem is not None:
-                    color = color_elem.get(f"{{{NS['w']}}}val", '')
-                    if color in white_colors:
-                        text = text_elem.text.strip()
-                        if text:
-                            self.hidden_text.append({
-                                'type': 'White text',
-                                'content': text[:50] + '...' if len(text) > 50 else text
-                            })
-                
-                # Check for vanish (hidden) property
-                vanish = run.find('.//w:vanish', NS)
-                if vanish is not None:
-                    val = vanish.get(f"{{{NS['w']}}}val", '1')
-                    if val in ['1', 'true']:
-                        text = text_elem.text.strip()
-                        if text:
-                            self.hidden_text.append({
-                                'type': 'Hidden (vanish)',
-                                'content': text[:50] + '...' if len(text) > 50 else text
-                            })
-                
-                # Check for very small text (< 1pt)
-                sz_elem = run.find('.//w:sz', NS)
-                if sz_elem is not None:
-                    size = sz_elem.get(f"{{{NS['w']}}}val", '')
-                    try:
-                        if int(size) < 2:  # Half-points (1pt = 2)
-                            text = text_elem.text.strip()
-                            if text:
-                                self.hidden_text.append({
-                                    'type': f'Tiny text ({int(size)/2}pt)',
-                                    'content': text[:50] + '...' if len(text) > 50 else text
-                                })
-                    except:
-                        pass
+            text = run['text'].strip()
+            if not text:
+                continue
+            preview = text[:50] + '...' if len(text) > 50 else text
+            
+            # Check text color
+            if run['color'] in white_colors:
+                self.hidden_text.append({
+                    'type': 'White text',
+                    'content': preview
+                })
+            
+            # Check for vanish (hidden) property
+            if run['vanish']:
+                self.hidden_text.append({
+                    'type': 'Hidden (vanish)',
+                    'content': preview
+                })
+            
+            # Check for very small text (< 1pt)
+            if run['sz']:
+                try:
+                    if int(run['sz']) < 2:  # Half-points (1pt = 2)
+                        self.hidden_text.append({
+                            'type': f"Tiny text ({int(run['sz'])/2}pt)",
+                            'content': preview
+                        })
+                except Exception:
+                    pass
         
         if self.hidden_text:
             log_danger(f"Found {len(self.hidden_text)} potentially hidden text element(s):")
@@ -295,7 +288,7 @@ class ForensicTextAnalyzer:
                                     'value': elems[0].text,
                                     'days_ahead': (timestamp - now).days
                                 })
-                        except:
+                        except Exception:
                             pass
                             
         elif self.loader.file_type in ['odt', 'ods', 'odp']:
@@ -315,7 +308,7 @@ class ForensicTextAnalyzer:
                                     'value': elems[0].text,
                                     'days_ahead': (timestamp - now).days
                                 })
-                        except:
+                        except Exception:
                             pass
         
         if self.future_timestamps:
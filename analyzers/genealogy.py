@@ -1,49 +1,180 @@
 import os
+import sys
+import time
 import zipfile
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from lxml import etree
 from utils.helpers import NS, log_info, log_success, log_warning
+from core.minhash import signature, lsh_candidates, jaccard, DisjointSet, NUM_HASHES
+from core.discovery import iter_candidates
+from core.rsid_index import RsidIndex
+from core.result_cache import DEFAULT_CACHE_PATH
+
+# RSIDs in more documents than this are template/boilerplate sessions, not
+# shared history; they are left out of the index (but still count in scores)
+COMMON_RSID_FRACTION = 0.05   # Share of the corpus
+COMMON_RSID_MIN_DOCS = 50     # Never prune below this many documents
+
+# Approximate mode: documents whose RSID sets have at least this Jaccard
+# similarity are linked, and linked documents form a family
+FAMILY_THRESHOLD = 0.5
+FAMILY_LIST_LIMIT = 50        # Members printed per family
+
+# RSID extraction: worker processes, used once there are enough documents to pay for them
+RSID_WORKERS = os.cpu_count() or 4
+RSID_CHUNK = 32
+RSID_POOL_MIN = 64
+
+W_RSIDS = f"{{{NS['w']}}}rsids"
+W_RSID = f"{{{NS['w']}}}rsid"
+W_VAL = f"{{{NS['w']}}}val"
+
+
+def extract_rsids(filepath):
+    """
+    Sorted RSIDs (as ints) of a DOCX, or None if it cannot be read. settings.xml
+    is parsed as a stream and abandoned at the end of its <w:rsids> block.
+    Top-level so it pickles for the worker pool.
+    """
+    try:
+        with zipfile.ZipFile(filepath, 'r') as z:
+            if 'word/settings.xml' not in z.namelist():
+                return []
+            rsids = set()
+            with z.open('word/settings.xml') as f:
+                for _, elem in etree.iterparse(f, events=('end',), tag=(W_RSID, W_RSIDS)):
+                    if elem.tag == W_RSIDS:
+                        break
+                    try:
+                        rsid = int(elem.get(W_VAL), 16)
+                        if rsid <= 0xFFFFFFFF: rsids.add(rsid)  # RSIDs are 32-bit
+                    except (TypeError, ValueError):
+                        pass
+                    elem.clear()
+            return sorted(rsids)
+    except Exception:
+        return None
+
 
 class GenealogyMapper:
-    def __init__(self, folder_path):
+    def __init__(self, folder_path, approximate=False, threshold=FAMILY_THRESHOLD, index_path=DEFAULT_CACHE_PATH):
         self.folder = folder_path
-        self.file_map = {} # {filename: set(rsids)}
+        self.file_map = {} # {filename: sorted array('I') of RSIDs}, 4 bytes per RSID
+        # Per-document RSIDs persist here between runs (None: always read everything)
+        self.index_path = index_path
+        # Approximate: MinHash/LSH document families, for corpora too large for pair lists
+        self.approximate = approximate
+        self.threshold = threshold
 
     def run(self):
         print(f"\n--- RSID Genealogy Mapping (Recursive: {self.folder}) ---")
         self._scan_folder_recursive()
-        self._analyze_and_report()
+        if self.approximate:
+            self._cluster_and_report()
+        else:
+            self._analyze_and_report()
 
     def _scan_folder_recursive(self):
-        """Scans folder AND subfolders for .docx files."""
-        docx_count = 0
-        
-        # os.walk allows us to traverse the directory tree
-        for root, dirs, files in os.walk(self.folder):
-            for f in files:
-                if f.lower().endswith('.docx') and not f.startswith('~$'):
-                    # We need the full path to open the file
-                    full_path = os.path.join(root, f)
-                    
-                    # Store it using the relative path or filename for readability
-                    # Using just filename might cause collisions if two folders have "report.docx"
-                    rel_path = os.path.relpath(full_path, self.folder)
-                    
-                    rsids = self._extract_rsids(full_path)
-                    self.file_map[rel_path] = set(rsids)
-                    docx_count += 1
-
-        log_info(f"Recursively scanned {docx_count} documents for DNA markers (RSIDs)...")
-
-    def _extract_rsids(self, filepath):
-        try:
-            with zipfile.ZipFile(filepath, 'r') as z:
-                if 'word/settings.xml' not in z.namelist():
-                    return []
-                xml = z.read('word/settings.xml')
-                root = etree.fromstring(xml)
-                return [elem.get(f"{{{NS['w']}}}val") for elem in root.xpath('//w:rsid', namespaces=NS)]
-        except:
+        """
+        Scans folder AND subfolders for .docx files. Documents unchanged since
+        the last run come from the RSID index; the rest are read in parallel.
+        """
+        index = RsidIndex(self.folder, self.index_path) if self.index_path else None
+        known = index.load() if index else {}
+        todo = []
+        for full_path, key in iter_candidates(os.path.abspath(self.folder), extensions=('.docx',)):
+            # Store it using the relative path or filename for readability
+            # Using just filename might cause collisions if two folders have "report.docx"
+            rel_path = os.path.relpath(full_path, self.folder)
+            indexed = known.pop(full_path, None)
+            if indexed and tuple(indexed[0]) == tuple(key):
+                self.file_map[rel_path] = indexed[1]
+            else:
+                todo.append((full_path, key, rel_path))
+
+        fresh = {}
+        for (full_path, key, rel_path), rsids in zip(todo, self._extract_all([t[0] for t in todo])):
+            self.file_map[rel_path] = array('I', rsids or ())
+            if rsids is not None: fresh[full_path] = (key, rsids)
+
+        if index:
+            index.store(fresh)
+            index.forget(known)  # Deleted since the last run
+            index.close()
+        log_info(f"Recursively scanned {len(self.file_map)} documents for DNA markers (RSIDs) "
+                 f"({len(todo)} read, {len(self.file_map) - len(todo)} from the index)...")
+
+    def _extract_all(self, paths):
+        """extract_rsids() of each path, in order; on worker processes for larger batches."""
+        if len(paths) < RSID_POOL_MIN:
+            return [extract_rsids(p) for p in paths]
+        with ProcessPoolExecutor(max_workers=RSID_WORKERS) as pool:
+            return list(pool.map(extract_rsids, paths, chunksize=RSID_CHUNK))
+
+    def query(self, docx_path, limit=25):
+        """
+        Relatives of `docx_path` among the folder's indexed documents (from a
+        previous run), without reopening the corpus. Returns [(path, shared, score)].
+        """
+        print(f"\n--- RSID Genealogy Query: {os.path.basename(docx_path)} vs {self.folder} ---")
+        target = set(extract_rsids(docx_path) or ())
+        if not target:
+            log_warning("No RSIDs found in the query document.")
             return []
+        index = RsidIndex(self.folder, self.index_path)
+        indexed = index.load()
+        index.close()
+        if not indexed:
+            log_warning("This folder has no RSID index yet; run the genealogy mapping first.")
+            return []
+
+        matches = []
+        for path, (_, rsids) in indexed.items():
+            shared_count = len(target.intersection(rsids))
+            if shared_count and os.path.normcase(path) != os.path.normcase(os.path.abspath(docx_path)):
+                score = (shared_count / min(len(target), len(rsids))) * 100
+                matches.append((os.path.relpath(path, self.folder), shared_count, score))
+        matches.sort(key=lambda m: (m[2], m[1]), reverse=True)
+
+        print(f"\n[RELATIVES ({len(matches)} documents share sessions; {len(indexed)} indexed)]")
+        print("-" * 75)
+        if matches:
+            for path, shared_count, score in matches[:limit]:
+                icon = "🔗" if score >= 90 else "⛓ "
+                print(f"   {icon} {score:.0f}% | {path} ({shared_count} shared sessions)")
+        else:
+            print("   (None)")
+        return matches
+
+    def _common_cutoff(self, total):
+        return max(COMMON_RSID_MIN_DOCS, int(total * COMMON_RSID_FRACTION))
+
+    def _candidate_pairs(self, files):
+        """
+        Index pairs (i, j), i < j, of `files` sharing at least one RSID, from an
+        RSID -> documents index. Work grows with the shared postings instead of
+        n^2; RSIDs above the document-frequency cutoff are skipped.
+        Returns (pairs, number of RSIDs pruned).
+        """
+        index = defaultdict(list)
+        for doc_id, f in enumerate(files):
+            for rsid in self.file_map[f]:
+                index[rsid].append(doc_id)
+
+        cutoff = self._common_cutoff(len(files))
+        pairs = set()
+        pruned = 0
+        for docs in index.values():
+            if len(docs) > cutoff:
+                pruned += 1
+                continue
+            # Postings are in document order, so every pair comes out as (low, high)
+            for k, a in enumerate(docs):
+                for b in docs[k + 1:]:
+                    pairs.add((a, b))
+        return pairs, pruned
 
     def _analyze_and_report(self):
         files = list(self.file_map.keys())
@@ -52,32 +183,30 @@ class GenealogyMapper:
         exact_matches = []   # > 90%
         partial_matches = [] # 1% - 90%
 
-        # Compare All Pairs
-        for i in range(len(files)):
-            for j in range(i + 1, len(files)):
-                f1 = files[i]
-                f2 = files[j]
-                
-                rsid1 = self.file_map[f1]
-                rsid2 = self.file_map[f2]
-                
-                shared = rsid1.intersection(rsid2)
-                shared_count = len(shared)
-                
-                if shared_count > 0:
-                    matched_files.add(f1)
-                    matched_files.add(f2)
-                    
-                    min_len = min(len(rsid1), len(rsid2))
-                    if min_len == 0: continue
-                    
-                    score = (shared_count / min_len) * 100
-                    match_data = (f1, f2, shared_count, score)
-                    
-                    if score >= 90:
-                        exact_matches.append(match_data)
-                    else:
-                        partial_matches.append(match_data)
+        # Compare only the pairs that share a session (inverted index), not all pairs
+        pairs, pruned = self._candidate_pairs(files)
+        if pruned:
+            log_info(f"Ignored {pruned} common template RSIDs (in more than {self._common_cutoff(len(files))} documents).")
+        for i, j in sorted(pairs):
+            f1 = files[i]
+            f2 = files[j]
+
+            rsid1 = self.file_map[f1]
+            rsid2 = self.file_map[f2]
+
+            shared_count = len(set(rsid1).intersection(rsid2))
+
+            matched_files.add(f1)
+            matched_files.add(f2)
+
+            min_len = min(len(rsid1), len(rsid2))
+            score = (shared_count / min_len) * 100
+            match_data = (f1, f2, shared_count, score)
+
+            if score >= 90:
+                exact_matches.append(match_data)
+            else:
+                partial_matches.append(match_data)
 
         # REPORTING
         print(f"\n[GROUP 1: HIGH CONFIDENCE LINKS (>90% Match)]")
@@ -112,4 +241,59 @@ class GenealogyMapper:
                 count = len(self.file_map[iso])
                 print(f"   • {iso} (Unique RSIDs: {count})")
         else:
-            print("   (None)")
\ No newline at end of file
+            print("   (None)")
+
+    def _cluster_and_report(self):
+        """
+        Approximate mode: MinHash signatures, LSH candidate pairs near the
+        Jaccard threshold, exact verification of each candidate, and the
+        verified links merged into connected document families.
+        """
+        started = time.monotonic()
+        files = [f for f, rsids in self.file_map.items() if rsids]
+        signatures = [signature(self.file_map[f]) for f in files]
+        signed = time.monotonic()
+
+        pairs, stats = lsh_candidates(signatures, self.threshold)
+        candidates = len(pairs)
+        bucketed = time.monotonic()
+
+        families = DisjointSet(len(files))
+        links = 0
+        for i, j in pairs:
+            if jaccard(self.file_map[files[i]], self.file_map[files[j]]) >= self.threshold:
+                families.union(i, j)
+                links += 1
+        del pairs
+        groups = sorted(families.groups(), key=len, reverse=True)
+        finished = time.monotonic()
+
+        print(f"\n[DOCUMENT FAMILIES (RSID Jaccard >= {self.threshold:.0%}, approximate)]")
+        print("   -> Each family is connected by verified links: copies, revisions and their descendants.")
+        print("-" * 75)
+        if groups:
+            for n, members in enumerate(groups, 1):
+                print(f"\n   👪 Family {n}: {len(members)} documents")
+                for doc_id in sorted(members, key=lambda d: files[d])[:FAMILY_LIST_LIMIT]:
+                    print(f"      • {files[doc_id]} ({len(self.file_map[files[doc_id]])} RSIDs)")
+                if len(members) > FAMILY_LIST_LIMIT:
+                    print(f"      ... and {len(members) - FAMILY_LIST_LIMIT} more")
+        else:
+            print("   (None)")
+
+        in_family = sum(len(g) for g in groups)
+        print(f"\n[ISOLATED] {len(self.file_map) - in_family} documents in no family "
+              f"({len(self.file_map) - len(files)} without RSIDs).")
+
+        # Memory: the RSID arrays kept for verification plus one signature per
+        # document; the candidate set is released after verification
+        rsid_count = sum(len(rsids) for rsids in self.file_map.values())
+        rsid_mb = sum(sys.getsizeof(rsids) for rsids in self.file_map.values()) / (1024 * 1024)
+        signature_mb = sum(sys.getsizeof(sig) for sig in signatures) / (1024 * 1024)
+        print(f"\n[RESOURCES]")
+        print(f"   RSID sets        : {len(self.file_map)} documents, {rsid_count} RSIDs ({rsid_mb:.1f} MB, packed uint32)")
+        print(f"   Signatures       : {len(files)} x {NUM_HASHES} hashes ({signature_mb:.1f} MB) in {signed - started:.1f}s")
+        print(f"   LSH              : {stats['bands']} bands x {stats['rows']} rows, {candidates} candidate pairs "
+              f"({stats['capped_buckets']} oversized buckets checked against a representative) in {bucketed - signed:.1f}s")
+        print(f"   Verification     : {links} links confirmed in {finished - bucketed:.1f}s")
+        log_success(f"Genealogy: {len(groups)} families from {len(files)} documents in {finished - started:.1f}s.")
@@ -31,8 +31,7 @@ class HyperlinkAnalyzer:
         
         # Check headers and footers
         for part in ['header', 'footer']:
-            rel_files = [f for f in self.loader.zip_ref.namelist() 
-                        if f.startswith(f'word/_rels/{part}') and f.endswith('.rels')]
+            rel_files = self.loader.list_files(prefix=f'word/_rels/{part}', suffix='.rels')
             for rel_file in rel_files:
                 tree = self.loader.get_xml_tree(rel_file)
                 if tree:
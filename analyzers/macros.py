@@ -1,4 +1,4 @@
-from utils.helpers import NS, log_danger, log_warning, log_success, log_info
+from utils.helpers import NS, log_danger, log_warning, log_success, log_info, emit_finding
 try:
     from oletools.olevba import VBA_Parser
     OLETOOLS_AVAILABLE = True
@@ -37,8 +37,9 @@ class MacroScanner:
             print("   [!] 'oletools' library not found. Skipping deep scan.")
             return
 
-        # OLETools can parse the zip file directly from disk
-        vbaparser = VBA_Parser(self.loader.filepath)
+        # Hand OLETools the bytes already in memory; it only goes to disk
+        # for large mmap'd files
+        vbaparser = VBA_Parser(self.loader.filepath, data=self.loader.raw_bytes())
         
         if vbaparser.detect_vba_macros():
             log_danger("VBA MACROS DETECTED! Scanning code for threats...")
@@ -50,7 +51,7 @@ class MacroScanner:
             for kw_type, keyword, description in results:
                 # Filter for interesting events
                 if kw_type in ('Suspicious', 'AutoExec'):
-                    print(f"   -> [THREAT] {keyword}: {description}")
+                    emit_finding('alert', f"[THREAT] {keyword}: {description}", category='macros')
                     suspicious_count += 1
             
             if suspicious_count > 0:
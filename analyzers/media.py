@@ -6,6 +6,9 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+# EXIF/XMP segments sit at the start of JPEG/TIFF files
+EXIF_PREFIX_BYTES = 256 * 1024
+
 class MediaAnalyzer:
     def __init__(self, loader):
         self.loader = loader
@@ -18,8 +21,7 @@ class MediaAnalyzer:
 
     def _scan_media_content(self):
         # DOCX uses 'word/media/', ODT uses 'Pictures/'
-        all_files = self.loader.zip_ref.namelist()
-        media_files = [f for f in all_files if f.startswith('word/media/') or f.startswith('Pictures/')]
+        media_files = self.loader.list_files(prefix=('word/media/', 'Pictures/'))
         
         if not media_files:
             print("   -> No embedded images found.")
@@ -43,7 +45,9 @@ class MediaAnalyzer:
 
     def _extract_exif(self, filename):
         try:
-            img_data = self.loader.zip_ref.read(filename)
+            # EXIF lives in the header segments; no need to inflate the whole image
+            img_data = self.loader.read_prefix(filename, EXIF_PREFIX_BYTES)
+            if not img_data: return False
             img = Image.open(io.BytesIO(img_data))
             exif = img._getexif()
             if not exif: return False
@@ -58,5 +62,5 @@ class MediaAnalyzer:
                 log_warning(f"Metadata in {filename.split('/')[-1]}:")
                 for t in tags_found: print(f"   -> {t}")
                 return True
-        except: pass
+        except Exception: pass
         return False
\ No newline at end of file
@@ -2,6 +2,55 @@ import os
 import datetime
 import stat
 from utils.helpers import log_info, log_warning, log_danger, log_success, NS
+from core.findings import FILESYSTEM
+from core.nested import source_size
+from analyzers.exiftool_scan import ExifToolScanner
+
+
+class FileSystemAnalyzer:
+    """
+    The document's disk entry: size, disk timestamps, attributes and
+    ExifTool's File group. Unlike the other analyzers this depends on the
+    path, not the content, so it runs for every copy and its section is
+    never cached. `source` is a path or an in-memory document (nested member).
+    """
+    def __init__(self, source):
+        self.source = source
+
+    def run(self):
+        print(f"\n--- {FILESYSTEM} ---")
+        try:
+            if not isinstance(self.source, str):
+                # Buffer source (e.g. a member of an outer archive): no disk entry
+                size_mb = source_size(self.source) / (1024 * 1024)
+                print(f"  {'File Size':<20}: {size_mb:.2f} MB (in-memory)")
+                return
+
+            file_stat = os.stat(self.source)
+            size_mb = file_stat.st_size / (1024 * 1024)
+            print(f"  {'File Size':<20}: {size_mb:.2f} MB")
+            
+            ts_mod = datetime.datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"  {'Disk Modified':<20}: {ts_mod}")
+            
+            # Attributes
+            attributes = []
+            if hasattr(file_stat, 'st_file_attributes'):
+                attrs = file_stat.st_file_attributes
+                if attrs & stat.FILE_ATTRIBUTE_HIDDEN: attributes.append("HIDDEN")
+                if attrs & stat.FILE_ATTRIBUTE_SYSTEM: attributes.append("SYSTEM")
+            
+            if attributes:
+                log_warning(f"Attributes: {', '.join(attributes)}")
+
+        except Exception as e:
+            print(f"  [Error: {e}]")
+            return
+
+        for tag, value in ExifToolScanner(self.source).path_tags().items():
+            group, _, name = tag.rpartition(':')
+            print(f"  [{group}] {name}: {value}")
+
 
 class MetadataAnalyzer:
     def __init__(self, loader):
@@ -10,7 +59,7 @@ class MetadataAnalyzer:
 
     def run(self):
         print("\n--- Deep Metadata Analysis ---")
-        self._analyze_file_system()  
+        # The file system section is per path: see FileSystemAnalyzer
         
         if self.loader.file_type == 'docx':
             self._parse_core_props()     
@@ -27,30 +76,6 @@ class MetadataAnalyzer:
         else:
             print("   [!] Unknown file type. Skipping internal metadata.")
 
-    def _analyze_file_system(self):
-        print(f"{'[File System Properties]':<25}")
-        try:
-            path = self.loader.filepath
-            file_stat = os.stat(path)
-            size_mb = file_stat.st_size / (1024 * 1024)
-            print(f"  {'File Size':<20}: {size_mb:.2f} MB")
-            
-            ts_mod = datetime.datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-            print(f"  {'Disk Modified':<20}: {ts_mod}")
-            
-            # Attributes
-            attributes = []
-            if hasattr(file_stat, 'st_file_attributes'):
-                attrs = file_stat.st_file_attributes
-                if attrs & stat.FILE_ATTRIBUTE_HIDDEN: attributes.append("HIDDEN")
-                if attrs & stat.FILE_ATTRIBUTE_SYSTEM: attributes.append("SYSTEM")
-            
-            if attributes:
-                log_warning(f"Attributes: {', '.join(attributes)}")
-
-        except Exception as e:
-            print(f"  [Error: {e}]")
-
     def _parse_odt_meta(self):
         """Parses OpenDocument meta.xml"""
         tree = self.loader.get_xml_tree('meta.xml')
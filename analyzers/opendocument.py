@@ -411,30 +411,37 @@ class OpenDocumentAnalyzer:
         """ODS-specific forensic analysis."""
         print(f"\n{'[ODS Specific Analysis]':<25}")
         
-        tree = self.loader.get_xml_tree('content.xml')
-        if not tree:
-            return
-        
         ns = self.OD_NS
         
-        # Count sheets and cells
-        sheets = tree.xpath('//table:table', namespaces=ns)
-        print(f"  Total Sheets: {len(sheets)}")
+        if self.loader.is_large_part('content.xml'):
+            sheet_rows, formula_count, formulas = self._stream_ods_counts()
+        else:
+            tree = self.loader.get_xml_tree('content.xml')
+            if not tree:
+                return
+            
+            # Count sheets and cells
+            sheet_rows = []
+            for sheet in tree.xpath('//table:table', namespaces=ns):
+                name = sheet.get(f"{{{ns['table']}}}name", 'unknown')
+                rows = sheet.xpath('.//table:table-row', namespaces=ns)
+                sheet_rows.append((name, len(rows)))
+            
+            formula_cells = tree.xpath('//table:table-cell[@table:formula]', namespaces=ns)
+            formula_count = len(formula_cells)
+            formulas = [cell.get(f"{{{ns['table']}}}formula", '') for cell in formula_cells[:100]]
         
-        for sheet in sheets[:5]:
-            name = sheet.get(f"{{{ns['table']}}}name", 'unknown')
-            rows = sheet.xpath('.//table:table-row', namespaces=ns)
-            print(f"    -> {name}: {len(rows)} rows")
+        print(f"  Total Sheets: {len(sheet_rows)}")
+        for name, row_count in sheet_rows[:5]:
+            print(f"    -> {name}: {row_count} rows")
         
         # Check for formulas
-        formulas = tree.xpath('//table:table-cell[@table:formula]', namespaces=ns)
-        if formulas:
-            log_info(f"Cells with formulas: {len(formulas)}")
+        if formula_count:
+            log_info(f"Cells with formulas: {formula_count}")
             
             # Check for suspicious formulas
             suspicious = []
-            for cell in formulas[:100]:
-                formula = cell.get(f"{{{ns['table']}}}formula", '')
+            for formula in formulas:
                 if any(keyword in formula.upper() for keyword in ['HYPERLINK', 'WEBSERVICE', 'INDIRECT']):
                     suspicious.append(formula[:80])
             
@@ -443,6 +450,29 @@ class OpenDocumentAnalyzer:
                 for f in suspicious[:3]:
                     print(f"    -> {f}")
 
+    def _stream_ods_counts(self):
+        """Count rows per sheet and formulas (keeping the first 100) from a huge content.xml."""
+        table_ns = f"{{{self.OD_NS['table']}}}"
+        tags = (f"{table_ns}table", f"{table_ns}table-row", f"{table_ns}table-cell")
+        
+        sheet_rows = []
+        formulas = []
+        formula_count = 0
+        row_count = 0
+        for elem in self.loader.iter_elements('content.xml', tags=tags):
+            if elem.tag == tags[2]:
+                formula = elem.get(f"{table_ns}formula")
+                if formula:
+                    formula_count += 1
+                    if len(formulas) < 100:
+                        formulas.append(formula)
+            elif elem.tag == tags[1]:
+                row_count += 1
+            else:
+                sheet_rows.append((elem.get(f"{table_ns}name", 'unknown'), row_count))
+                row_count = 0
+        return sheet_rows, formula_count, formulas
+
     def _analyze_odp_specific(self):
         """ODP-specific forensic analysis."""
         print(f"\n{'[ODP Specific Analysis]':<25}")
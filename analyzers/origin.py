@@ -26,11 +26,10 @@ class OriginAnalyzer:
 
     def _check_sequential_para_ids(self):
         """Checks for the strict 1, 2, 3... ID sequence (Direct Google Export)."""
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree: return False
+        model = self.loader.get_document_model()
+        if not model: return False
         
-        # Using wildcard namespace for robustness
-        para_ids = [p.get(f"{{{NS['w14']}}}paraId") for p in tree.xpath('//w:p', namespaces=NS)]
+        para_ids = [para['para_id'] for para in model.paragraphs]
         valid_ids = [int(pid, 16) for pid in para_ids if pid]
 
         if len(valid_ids) < 5: return False
@@ -42,20 +42,18 @@ class PlatformAnalyzer:
 
     def _check_zip_artifacts(self):
         """Scans the raw ZIP structure for hidden OS files."""
-        file_list = self.loader.zip_ref.namelist()
-        
         # Mac Artifacts
-        if "__MACOSX/" in str(file_list): # Folder check
+        if self.loader.find_files("__macosx/"): # Folder check
             self.mac_indicators.append("Found '__MACOSX' hidden resource folder (Zip artifact).")
         
-        ds_store = [f for f in file_list if ".DS_Store" in f]
+        ds_store = self.loader.find_files(".DS_Store")
         if ds_store:
             self.mac_indicators.append(f"Found {len(ds_store)} '.DS_Store' finder files.")
 
     def _check_file_paths(self):
         """Scans relationship files for absolute path structures."""
         # Look at all relationship files (document.xml.rels, etc.)
-        rel_files = [f for f in self.loader.zip_ref.namelist() if f.endswith('.rels')]
+        rel_files = self.loader.list_files(suffix='.rels')
         
         # Regex for Mac paths: starts with /Users/
         mac_path_regex = re.compile(r'file:///Users/[^"]+')
@@ -64,7 +62,9 @@ class PlatformAnalyzer:
 
         for rel_file in rel_files:
             try:
-                xml = self.loader.zip_ref.read(rel_file).decode('utf-8', errors='ignore')
+                raw = self.loader.get_bytes(rel_file)
+                if raw is None: continue
+                xml = raw.decode('utf-8', errors='ignore')
                 
                 if mac_path_regex.search(xml):
                     match = mac_path_regex.search(xml).group(0)
@@ -72,7 +72,7 @@ class PlatformAnalyzer:
                 
                 if win_path_regex.search(xml):
                     self.windows_indicators.append("Windows drive letter paths detected.")
-            except:
+            except Exception:
                 continue
 
     def _check_fonts(self):
@@ -1,5 +1,5 @@
 import re
-from utils.helpers import NS, log_info, log_warning, log_success, log_danger
+from utils.helpers import NS, log_info, log_warning, log_success, log_danger, emit_finding
 
 class PPTXDeepAnalyzer:
     def __init__(self, loader):
@@ -96,7 +96,7 @@ class PPTXDeepAnalyzer:
             if a_id: self.author_map[a_id] = f"{name} ({initials})"
 
     def _scan_comments_content(self):
-        comment_files = [f for f in self.loader.zip_ref.namelist() if f.startswith('ppt/comments/comment')]
+        comment_files = self.loader.list_files(prefix='ppt/comments/comment')
         if not comment_files: return
 
         log_info(f"Found {len(comment_files)} Comment Files. Extracting content...")
@@ -117,7 +117,7 @@ class PPTXDeepAnalyzer:
 
     def _scan_speaker_notes_content(self):
         """Extracts text from notes slides."""
-        notes_files = [f for f in self.loader.zip_ref.namelist() if f.startswith('ppt/notesSlides/notesSlide')]
+        notes_files = self.loader.list_files(prefix='ppt/notesSlides/notesSlide')
         if not notes_files: 
             log_success("No speaker notes found.")
             return
@@ -132,15 +132,15 @@ class PPTXDeepAnalyzer:
                 text_nodes = tree.xpath('//*[local-name()="t"]')
                 full_text = " ".join([t.text.strip() for t in text_nodes if t.text])
                 if full_text: found_notes.append(full_text)
-            except: pass
+            except Exception: pass
 
         if found_notes:
             log_info(f"Extracted {len(found_notes)} speaker notes (normal PowerPoint feature):")
-            # Tag for GUI parsing
-            print("[SPEAKER NOTES DATA]:")
+            previews = []
             for i, note in enumerate(found_notes, 1):
                 preview = note[:100] + "..." if len(note) > 100 else note
-                print(f" >> Slide {i}: {preview}")
+                previews.append(f"Slide {i}: {preview}")
+            emit_finding('info', "[SPEAKER NOTES DATA]:", previews, category='speaker_notes')
 
     def _scan_slide_masters(self):
         """Check for hidden content in slide masters and layouts."""
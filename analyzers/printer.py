@@ -32,11 +32,11 @@ class PrinterAnalyzer:
 
     def _analyze_page_setup(self):
         """Analyze page setup for unusual configurations."""
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree:
+        model = self.loader.get_document_model()
+        if not model:
             return
 
-        sections = tree.xpath('//w:sectPr', namespaces=NS)
+        sections = model.elements['sectPr']
         
         unusual_setups = []
         
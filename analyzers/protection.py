@@ -59,12 +59,12 @@ class ProtectionAnalyzer:
 
     def _check_section_protection(self):
         """Check for section-level protection."""
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree:
+        model = self.loader.get_document_model()
+        if not model:
             return
 
         # Check for protected sections
-        sections = tree.xpath('//w:sectPr', namespaces=NS)
+        sections = model.elements['sectPr']
         protected_sections = []
         
         for i, section in enumerate(sections):
@@ -1,4 +1,5 @@
 from utils.helpers import NS, log_info, log_warning
+from core.document_model import W
 
 class RSIDAnalyzer:
     def __init__(self, loader):
@@ -32,13 +33,15 @@ class RSIDAnalyzer:
                 self.ordered_rsids.append(val)
 
     def _map_paragraphs(self):
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree: return
+        if self.loader.is_large_part('word/document.xml'):
+            # Counting only: stream paragraphs instead of building the tree
+            rsids = (p.get(f"{W}rsidR") for p in self.loader.iter_elements('word/document.xml', tags=f"{W}p"))
+        else:
+            model = self.loader.get_document_model()
+            if not model: return
+            rsids = (para['rsid'] for para in model.paragraphs)
 
-        paragraphs = tree.xpath('//w:p', namespaces=NS)
-        
-        for p in paragraphs:
-            rsid = p.get(f"{{{NS['w']}}}rsidR")
+        for rsid in rsids:
             if rsid:
                 self.paragraph_counts[rsid] = self.paragraph_counts.get(rsid, 0) + 1
                 if rsid in self.rsid_map:
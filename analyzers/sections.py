@@ -12,12 +12,12 @@ class SectionAnalyzer:
 
     def _extract_sections(self):
         """Extract all section properties from document."""
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree:
+        model = self.loader.get_document_model()
+        if not model:
             return
 
         # Sections are defined by w:sectPr elements
-        sections = tree.xpath('//w:sectPr', namespaces=NS)
+        sections = model.elements['sectPr']
         
         for idx, section in enumerate(sections):
             section_info = {
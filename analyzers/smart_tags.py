@@ -14,12 +14,12 @@ class SmartTagAnalyzer:
 
     def _extract_smart_tags(self):
         """Extract smart tags which often contain corporate identifiers."""
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree:
+        model = self.loader.get_document_model()
+        if not model:
             return
 
         # Smart tags use w:smartTag element
-        smart_tags = tree.xpath('//w:smartTag', namespaces=NS)
+        smart_tags = model.elements['smartTag']
         
         for tag in smart_tags:
             uri = tag.get(f"{{{NS['w']}}}uri", '')
@@ -38,12 +38,12 @@ class SmartTagAnalyzer:
 
     def _extract_content_controls(self):
         """Extract content controls and their bindings."""
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree:
+        model = self.loader.get_document_model()
+        if not model:
             return
 
         # Content controls: w:sdt (Structured Document Tag)
-        controls = tree.xpath('//w:sdt', namespaces=NS)
+        controls = model.elements['sdt']
         
         for control in controls:
             # Get control properties
@@ -12,11 +12,11 @@ class TableAnalyzer:
 
     def _extract_tables(self):
         """Extract all tables and their properties."""
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree:
+        model = self.loader.get_document_model()
+        if not model:
             return
 
-        tables = tree.xpath('//w:tbl', namespaces=NS)
+        tables = model.elements['tbl']
         
         for table_idx, table in enumerate(tables):
             # Get table properties
@@ -1,4 +1,5 @@
-from utils.helpers import NS, log_danger, log_warning, log_success, log_info
+from utils.helpers import NS, log_danger, log_warning, log_success, log_info, emit_finding
+from core.document_model import W, is_local, local_attr
 
 class ThreatScanner:
     def __init__(self, loader):
@@ -33,66 +34,78 @@ class ThreatScanner:
 
     def _check_hidden_content(self):
         """Deep scan for White-on-White text."""
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree: return
-
-        # 1. Vanish Property
-        if tree.xpath('//w:vanish', namespaces=NS):
-            log_warning("Found text runs with 'Vanish' property.")
-
-        # 2. White Text (Robust Check using local-name to bypass namespace issues)
-        # Find all color elements where val is FFFFFF or white
-        color_nodes = tree.xpath("//*[local-name()='color'][@*[local-name()='val']='FFFFFF']")
-        
         hidden_samples = []
+        if self.loader.is_large_part('word/document.xml'):
+            # Huge part: stream paragraph by paragraph instead of building the
+            # DocumentModel (a paragraph's pPr, runs and open ancestors are intact)
+            vanish = False
+            for para in self.loader.iter_elements('word/document.xml', tags=f"{W}p"):
+                vanish = vanish or next(para.iter(f"{W}vanish"), None) is not None
+                for node in para.iter():
+                    if is_local(node, 'color') and local_attr(node, 'val') == 'FFFFFF':
+                        hidden_samples.extend(self._hidden_run_text(node))
+        else:
+            model = self.loader.get_document_model()
+            if not model: return
+            vanish = bool(model.elements['vanish'])
 
-        for color_node in color_nodes:
-            rPr = color_node.getparent()
-            if rPr is None: continue
-            is_visible = False
-            
-            # Check Run Highlight/Shading
-            if rPr.xpath(".//*[local-name()='highlight']"): is_visible = True
-            shd = rPr.xpath(".//*[local-name()='shd']")
-            if shd:
-                fill = shd[0].get(f"{{{NS['w']}}}fill") or shd[0].get("fill")
-                if fill and fill.lower() not in ['auto', 'ffffff']: is_visible = True
-
-            # Check Paragraph/Style
-            if not is_visible:
-                run = rPr.getparent()
-                para = run.getparent() if run is not None else None
-                if para is not None:
-                    pPr = para.xpath(".//*[local-name()='pPr']")
-                    if pPr:
-                        p_shd = pPr[0].xpath(".//*[local-name()='shd']")
-                        if p_shd:
-                            p_fill = p_shd[0].get(f"{{{NS['w']}}}fill") or p_shd[0].get("fill")
-                            if p_fill and p_fill.lower() not in ['auto', 'ffffff']: is_visible = True
-                        
-                        # Style check (Simple heuristic)
-                        if pPr[0].xpath(".//*[local-name()='pStyle']"): is_visible = True
-
-            # Check Table/Drawings
-            if not is_visible:
-                for ancestor in rPr.iterancestors():
-                    tag = ancestor.tag.split('}')[-1]
-                    if tag in ['tc', 'drawing', 'txbxContent']:
-                        is_visible = True
-                        break
+            # White Text (Robust Check using local-name to bypass namespace issues)
+            # Find all color elements where val is FFFFFF
+            for node in model.colors:
+                if local_attr(node, 'val') == 'FFFFFF':
+                    hidden_samples.extend(self._hidden_run_text(node))
 
-            # If still not visible, extract text
-            if not is_visible:
-                run = rPr.getparent()
-                text_nodes = run.xpath(".//*[local-name()='t']")
-                for t in text_nodes:
-                    if t.text and t.text.strip():
-                        hidden_samples.append(t.text.strip())
+        # Vanish Property
+        if vanish:
+            log_warning("Found text runs with 'Vanish' property.")
 
         if hidden_samples:
             log_danger(f"Found {len(hidden_samples)} text runs explicitly colored White on White.")
-            print(f"[HIDDEN DATA EXTRACTED]:") # GUI looks for this tag
-            for sample in set(hidden_samples): # Deduplicate
-                print(f" >> {sample}")
+            emit_finding('warn', "[HIDDEN DATA EXTRACTED]:", sorted(set(hidden_samples)), category='hidden')
         else:
-            log_success("No hidden white-on-white text anomalies found.")
\ No newline at end of file
+            log_success("No hidden white-on-white text anomalies found.")
+
+    def _hidden_run_text(self, color_node):
+        """
+        Text of the run a white color element belongs to, or [] when run or
+        paragraph shading, highlighting, a style, or a table/drawing makes it visible.
+        """
+        rPr = color_node.getparent()
+        if rPr is None: return []
+        is_visible = False
+        
+        # Check Run Highlight/Shading
+        if rPr.xpath(".//*[local-name()='highlight']"): is_visible = True
+        shd = rPr.xpath(".//*[local-name()='shd']")
+        if shd:
+            fill = shd[0].get(f"{{{NS['w']}}}fill") or shd[0].get("fill")
+            if fill and fill.lower() not in ['auto', 'ffffff']: is_visible = True
+
+        # Check Paragraph/Style
+        if not is_visible:
+            run = rPr.getparent()
+            para = run.getparent() if run is not None else None
+            if para is not None:
+                pPr = para.xpath(".//*[local-name()='pPr']")
+                if pPr:
+                    p_shd = pPr[0].xpath(".//*[local-name()='shd']")
+                    if p_shd:
+                        p_fill = p_shd[0].get(f"{{{NS['w']}}}fill") or p_shd[0].get("fill")
+                        if p_fill and p_fill.lower() not in ['auto', 'ffffff']: is_visible = True
+                    
+                    # Style check (Simple heuristic)
+                    if pPr[0].xpath(".//*[local-name()='pStyle']"): is_visible = True
+
+        # Check Table/Drawings
+        if not is_visible:
+            for ancestor in rPr.iterancestors():
+                tag = ancestor.tag.split('}')[-1]
+                if tag in ['tc', 'drawing', 'txbxContent']:
+                    is_visible = True
+                    break
+
+        # If still not visible, extract text
+        if is_visible: return []
+        run = rPr.getparent()
+        text_nodes = run.xpath(".//*[local-name()='t']")
+        return [t.text.strip() for t in text_nodes if t.text and t.text.strip()]
@@ -15,13 +15,13 @@ class TrackChangesAnalyzer:
 
     def _extract_changes(self):
         """Extract all tracked insertions, deletions, and moves."""
-        tree = self.loader.get_xml_tree('word/document.xml')
-        if not tree:
+        model = self.loader.get_document_model()
+        if not model:
             log_info("No document.xml found.")
             return
 
         # Extract insertions
-        insertions = tree.xpath('//w:ins', namespaces=NS)
+        insertions = model.elements['ins']
         for ins in insertions:
             author = ins.get(f"{{{NS['w']}}}author", 'Unknown')
             date = ins.get(f"{{{NS['w']}}}date", '')
@@ -40,7 +40,7 @@ class TrackChangesAnalyzer:
                 })
 
         # Extract deletions
-        deletions = tree.xpath('//w:del', namespaces=NS)
+        deletions = model.elements['del']
         for dele in deletions:
             author = dele.get(f"{{{NS['w']}}}author", 'Unknown')
             date = dele.get(f"{{{NS['w']}}}date", '')
@@ -59,8 +59,8 @@ class TrackChangesAnalyzer:
                 })
 
         # Extract moves
-        move_from = tree.xpath('//w:moveFrom', namespaces=NS)
-        move_to = tree.xpath('//w:moveTo', namespaces=NS)
+        move_from = model.elements['moveFrom']
+        move_to = model.elements['moveTo']
         
         for move in move_from:
             author = move.get(f"{{{NS['w']}}}author", 'Unknown')
@@ -25,7 +25,7 @@ class XLSXDeepAnalyzer:
         
         try:
             # Load workbook with data_only=False to preserve formulas
-            self.workbook = openpyxl.load_workbook(self.loader.filepath, data_only=False, keep_vba=True)
+            self.workbook = openpyxl.load_workbook(self.loader.open_source(), data_only=False, keep_vba=True)
             
             self._analyze_metadata()
             self._scan_sheets()
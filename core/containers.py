@@ -0,0 +1,155 @@
+"""
+Containers
+Recursive expansion of a file into the documents nested inside it: Office
+documents in ZIP archives (including ZIPs inside ZIPs), and documents
+embedded in other documents - word/embeddings/*.docx style packages and
+oleObject*.bin objects wrapping one in their "Package" stream.
+Each document is yielded with its provenance chain (member names from the
+outer file down), which core.nested opens directly, so nothing is extracted.
+Depth, inflated bytes and member count are budgeted per top-level file, so a
+hostile archive cannot exhaust memory or time.
+7z/RAR archives are not expanded (no standard-library reader).
+"""
+import os
+import zipfile
+from contextlib import ExitStack
+
+from core.nested import MEMBER_SEP, join_nested, split_nested, read_member, open_container, OLE_SIGNATURE, OLEFILE_AVAILABLE
+
+DOCUMENT_EXTENSIONS = ('.docx', '.xlsx', '.pptx', '.docm', '.xlsm', '.pptm', '.odt', '.ods', '.odp')
+ARCHIVE_EXTENSIONS = ('.zip',)
+EMBEDDING_PREFIXES = ('word/embeddings/', 'xl/embeddings/', 'ppt/embeddings/')
+OLE_PACKAGE_STREAM = 'Package'
+
+# Expansion budgets, per top-level file
+MAX_DEPTH = 4                               # Levels below the file on disk
+MAX_EXPANDED_BYTES = 1024 * 1024 * 1024     # Uncompressed bytes opened while expanding
+MAX_EXPANDED_MEMBERS = 10000                # Documents and containers visited
+MAX_NESTED_SIZE = 250 * 1024 * 1024         # Largest single member considered
+
+
+class ExpansionBudget:
+    """Running totals for one top-level file; `exhausted` names the first limit hit."""
+    def __init__(self, max_depth=MAX_DEPTH, max_bytes=MAX_EXPANDED_BYTES, max_members=MAX_EXPANDED_MEMBERS):
+        self.max_depth = max_depth
+        self.max_bytes = max_bytes
+        self.max_members = max_members
+        self.bytes = 0
+        self.members = 0
+        self.exhausted = None
+
+    def charge(self, size):
+        """Account for one member of `size` bytes; False once the budget is spent."""
+        self.members += 1
+        self.bytes += size
+        if self.members > self.max_members:
+            self.exhausted = f"more than {self.max_members} nested members"
+        elif self.bytes > self.max_bytes:
+            self.exhausted = f"more than {self.max_bytes // (1024 * 1024)} MB expanded"
+        return self.exhausted is None
+
+
+def is_document(name):
+    return name.lower().endswith(DOCUMENT_EXTENSIONS)
+
+
+def is_archive(name):
+    return name.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def expand(path, budget=None, on_skip=None):
+    """
+    Yield the provenance chain ([member, ...]) of every document nested in the
+    archive or document at `path`, outermost first. on_skip(reason, nested_path)
+    reports what the budgets or unreadable members kept out.
+    """
+    budget = budget or ExpansionBudget()
+    skip = on_skip or (lambda reason, where: None)
+    with zipfile.ZipFile(path, 'r') as z:
+        yield from _walk(z, path, [], is_document(path), budget, skip)
+
+
+def _walk(z, path, chain, in_document, budget, skip):
+    depth = len(chain) + 1
+    for info in z.infolist():
+        if budget.exhausted: return
+        name = info.filename
+        if in_document:
+            # Only the embeddings folder of an Office document holds nested documents
+            if not name.startswith(EMBEDDING_PREFIXES): continue
+            ole = name.lower().endswith('.bin') and OLEFILE_AVAILABLE
+            if not (is_document(name) or ole): continue
+        elif not (is_document(name) or is_archive(name)):
+            continue
+
+        where = join_nested(path, *chain, name)
+        if depth > budget.max_depth:
+            skip(f"Nested deeper than {budget.max_depth} levels", where)
+            continue
+        if info.file_size > MAX_NESTED_SIZE:
+            skip(f"Skipped huge nested file ({info.file_size // (1024 * 1024)} MB)", where)
+            continue
+        if not budget.charge(info.file_size):
+            skip(f"Expansion stopped: {budget.exhausted}", where)
+            return
+
+        if is_document(name):
+            yield chain + [name]
+            yield from _expand_member(z, path, chain, name, True, budget, skip)
+        elif is_archive(name):
+            yield from _expand_member(z, path, chain, name, False, budget, skip)
+        else:
+            yield from _expand_ole(z, path, chain, name, budget, skip)
+
+
+def _expand_member(z, path, chain, name, in_document, budget, skip):
+    if len(chain) + 1 >= budget.max_depth and in_document:
+        return  # Its embeddings would be too deep anyway
+    try:
+        with ExitStack() as inner:
+            nested = open_container(inner, read_member(inner, z, name))
+            if not isinstance(nested, zipfile.ZipFile): return
+            yield from _walk(nested, path, chain + [name], in_document, budget, skip)
+    except Exception as e:
+        skip(f"Unreadable nested {'document' if in_document else 'archive'} ({e})", join_nested(path, *chain, name))
+
+
+def _expand_ole(z, path, chain, name, budget, skip):
+    """oleObject*.bin: an embedded Office document sits in its "Package" stream."""
+    try:
+        with ExitStack() as inner:
+            data = read_member(inner, z, name)
+            if not isinstance(data, bytes) or data[:8] != OLE_SIGNATURE: return
+            ole = open_container(inner, data)
+            if not ole.exists(OLE_PACKAGE_STREAM): return
+            package = ole.openstream(OLE_PACKAGE_STREAM).read()
+            if not package.startswith(b'PK'): return
+            if not budget.charge(len(package)):
+                skip(f"Expansion stopped: {budget.exhausted}", join_nested(path, *chain, name))
+                return
+            yield chain + [name, OLE_PACKAGE_STREAM]
+            if len(chain) + 2 < budget.max_depth:
+                nested = open_container(inner, package)
+                yield from _walk(nested, path, chain + [name, OLE_PACKAGE_STREAM], True, budget, skip)
+    except Exception as e:
+        skip(f"Unreadable embedded object ({e})", join_nested(path, *chain, name))
+
+
+def member_label(member):
+    """Display name of a nested member chain ("inner.zip [>>] a.docx" -> "a.docx")."""
+    parts = member.split(MEMBER_SEP)
+    if parts[-1] == OLE_PACKAGE_STREAM and len(parts) > 1:
+        return f"{os.path.basename(parts[-2])} (OLE package)"
+    return parts[-1]
+
+
+def provenance(path):
+    """Readable chain of a nested path: "outer.zip > inner.zip > a.docx > oleObject1.bin (OLE package)"."""
+    outer, members = split_nested(path)
+    steps = [os.path.basename(outer)]
+    for part in members:
+        if part == OLE_PACKAGE_STREAM:
+            steps[-1] += " (OLE package)"
+        else:
+            steps.append(os.path.basename(part))
+    return " > ".join(steps)
@@ -0,0 +1,101 @@
+"""
+Discovery
+Parallel os.scandir walk of an evidence folder. Subdirectories are listed
+concurrently by a small thread pool and candidate documents are streamed to
+the caller as soon as they are found, so analysis starts while the rest of
+the tree is still being indexed. All filtering (symlinks, cloud placeholders,
+size) uses the stat data cached on each DirEntry - no per-file syscalls.
+"""
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+OFFICE_EXTENSIONS = ('.docx', '.odt', '.xlsx', '.pptx', '.zip', '.ods', '.odp')
+DISCOVERY_WORKERS = 8
+DISCOVERY_QUEUE_SIZE = 1000  # Candidates buffered ahead of the consumer
+
+# Windows attributes of cloud placeholders (OneDrive, Dropbox...): opening
+# such a file triggers a download
+FILE_ATTRIBUTE_OFFLINE = 0x00001000
+FILE_ATTRIBUTE_RECALL_ON_OPEN = 0x00040000
+FILE_ATTRIBUTE_RECALL_ON_DATA_ACCESS = 0x00400000
+PLACEHOLDER_ATTRIBUTES = FILE_ATTRIBUTE_OFFLINE | FILE_ATTRIBUTE_RECALL_ON_OPEN | FILE_ATTRIBUTE_RECALL_ON_DATA_ACCESS
+
+_DONE = object()
+
+
+def iter_candidates(root, on_skip=None, should_stop=None, workers=DISCOVERY_WORKERS, extensions=OFFICE_EXTENSIONS):
+    """
+    Yield (path, stat_key) for every candidate document under `root`, in
+    discovery order. stat_key is (size, mtime_ns, inode) as used by
+    core.manifest. on_skip(reason, path) is called for entries that are
+    passed over; should_stop() is polled to abandon the walk early.
+    """
+    out = queue.Queue(maxsize=DISCOVERY_QUEUE_SIZE)
+    stop = threading.Event()
+    lock = threading.Lock()
+    outstanding = [1]  # directories submitted but not yet listed
+
+    def skip(reason, path):
+        if on_skip: on_skip(reason, path)
+
+    def emit(item):
+        # Bounded queue: block while the consumer catches up, but give up on stop
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.2)
+                return
+            except queue.Full:
+                continue
+
+    def scan_dir(path):
+        try:
+            if stop.is_set(): return
+            with os.scandir(path) as it:
+                for entry in it:
+                    if stop.is_set(): return
+                    try:
+                        if entry.is_symlink():
+                            if entry.name.lower().endswith(extensions):
+                                skip("Skipped symbolic link", entry.path)
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            with lock:
+                                outstanding[0] += 1
+                            pool.submit(scan_dir, entry.path)
+                            continue
+                        name = entry.name
+                        if not name.lower().endswith(extensions) or name.startswith('~$'):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                        if getattr(st, 'st_file_attributes', 0) & PLACEHOLDER_ATTRIBUTES:
+                            skip("Skipped cloud placeholder", entry.path)
+                            continue
+                        emit((os.path.normpath(entry.path), (st.st_size, st.st_mtime_ns, entry.inode())))
+                    except OSError as e:
+                        skip(f"Cannot access ({e.strerror})", entry.path)
+        except OSError as e:
+            skip(f"Cannot list folder ({e.strerror})", path)
+        finally:
+            with lock:
+                outstanding[0] -= 1
+                finished = outstanding[0] == 0
+            if finished:
+                emit(_DONE)
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="discovery")
+    pool.submit(scan_dir, root)
+    try:
+        while True:
+            try:
+                item = out.get(timeout=0.2)
+            except queue.Empty:
+                if should_stop and should_stop(): return
+                continue
+            if item is _DONE: return
+            yield item
+            if should_stop and should_stop(): return
+    finally:
+        stop.set()
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,104 @@
+"""
+Document Model
+Pre-indexed view of word/document.xml built in a single walk of the tree.
+The Word analyzers read their paragraphs, runs, tracked changes, field codes,
+sections, tables and content controls from here instead of each running
+their own full-tree XPath.
+"""
+from utils.helpers import NS
+
+W = f"{{{NS['w']}}}"
+W14 = f"{{{NS['w14']}}}"
+
+class DocumentModel:
+    # WordprocessingML elements collected during the walk (by local name)
+    INDEXED_TAGS = (
+        'p', 'r', 'ins', 'del', 'delText', 'moveFrom', 'moveTo', 'instrText',
+        'sectPr', 'tbl', 'sdt', 'smartTag', 'rFonts', 'color', 'vanish', 'lang'
+    )
+
+    def __init__(self, tree):
+        self.elements = {tag: [] for tag in self.INDEXED_TAGS}
+        self.tracked_changes = []  # w:ins and w:del in document order
+        self.colors = []           # color elements in any namespace (white-text checks match by local name)
+        self.paragraphs = []
+        self._runs = None
+        self._walk(tree)
+
+    def _walk(self, tree):
+        root = tree.getroot() if hasattr(tree, 'getroot') else tree
+        prefix_len = len(W)
+
+        for el in root.iter():
+            tag = el.tag
+            # Comments and processing instructions have non-string tags
+            if not isinstance(tag, str):
+                continue
+            if not tag.startswith(W):
+                if is_local(el, 'color'): self.colors.append(el)
+                continue
+            name = tag[prefix_len:]
+            if name == 'color':
+                self.colors.append(el)
+            bucket = self.elements.get(name)
+            if bucket is None:
+                continue
+            bucket.append(el)
+            if name == 'ins' or name == 'del':
+                self.tracked_changes.append(el)
+
+        for p in self.elements['p']:
+            self.paragraphs.append({
+                'element': p,
+                'rsid': p.get(f"{W}rsidR"),
+                'para_id': p.get(f"{W14}paraId")
+            })
+
+    @property
+    def runs(self):
+        """Run records with their color/vanish/sz formatting flags (built on first use)."""
+        if self._runs is None:
+            self._runs = [run_record(r) for r in self.elements['r']]
+        return self._runs
+
+    def paragraph_text(self, p):
+        """Concatenated w:t text of a paragraph element."""
+        return ''.join(t.text or '' for t in p.iter(f"{W}t"))
+
+
+def is_local(el, name):
+    """True if `el` is an element with local name `name`, in any namespace."""
+    return isinstance(el.tag, str) and el.tag.rpartition('}')[2] == name
+
+
+def local_attr(el, name):
+    """Value of the attribute with local name `name`, in any namespace (or none)."""
+    for key, value in el.attrib.items():
+        if key.rpartition('}')[2] == name:
+            return value
+    return None
+
+
+def run_record(run):
+    """
+    Summarise a w:r element: its text plus the first color, vanish and sz
+    elements found anywhere below it (not only in its direct rPr, matching
+    the analyzers' original .//w:color lookups). Also used on streamed runs
+    from DocLoader.iter_elements().
+    """
+    record = {'element': run, 'color': None, 'vanish': False, 'sz': None}
+
+    color = run.find(f".//{W}color")
+    if color is not None:
+        record['color'] = color.get(f"{W}val", '')
+
+    vanish = run.find(f".//{W}vanish")
+    if vanish is not None:
+        record['vanish'] = vanish.get(f"{W}val", '1') in ['1', 'true']
+
+    sz = run.find(f".//{W}sz")
+    if sz is not None:
+        record['sz'] = sz.get(f"{W}val", '')
+
+    record['text'] = ''.join(t.text or '' for t in run.iter(f"{W}t"))
+    return record
@@ -0,0 +1,150 @@
+"""
+Findings
+Structured records for deep-scan output. Analyzers keep printing and calling
+the log_* helpers; inside a scan those calls land in a Report as Finding
+records (severity, category, message, evidence). Text is only rendered when a
+report is viewed or exported, and the GUI and exporter filter on the records
+instead of re-parsing strings.
+"""
+import re
+
+# Severities in increasing order of importance. 'text' is plain printed
+# output, 'section' an analyzer heading ("--- Title ---").
+SEVERITIES = ('text', 'section', 'info', 'pass', 'warn', 'alert')
+_RANK = {s: i for i, s in enumerate(SEVERITIES)}
+_PREFIX = {'info': '[INFO] ', 'pass': '[PASS] ', 'warn': '[WARN] ', 'alert': '[ALERT] '}
+
+_SECTION_RE = re.compile(r'^-{3} (.+?) -{3}$')
+
+# Category (and section heading) of findings about the file's disk entry -
+# name, size, timestamps, attributes - rather than its content. Copies of
+# one document differ only here, so cached and shared reports keep just the
+# content and every path gets its own section (see Report.content()).
+FILESYSTEM = 'File System Properties'
+
+
+class Finding:
+    __slots__ = ('severity', 'category', 'message', 'evidence')
+
+    def __init__(self, severity, category, message, evidence=None):
+        self.severity = severity
+        self.category = category
+        self.message = message
+        self.evidence = evidence  # None, a string or a list of strings
+
+    def render(self):
+        """Text form, as the analyzer would have printed it."""
+        if self.severity == 'section':
+            return f"\n--- {self.message} ---"
+        text = _PREFIX.get(self.severity, '') + self.message
+        if self.evidence:
+            items = self.evidence if isinstance(self.evidence, list) else [self.evidence]
+            text += ''.join(f"\n >> {item}" for item in items)
+        return text
+
+    def to_dict(self):
+        return {'severity': self.severity, 'category': self.category,
+                'message': self.message, 'evidence': self.evidence}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d['severity'], d['category'], d['message'], d.get('evidence'))
+
+    def __repr__(self):
+        return f"Finding({self.severity!r}, {self.category!r}, {self.message!r})"
+
+
+class Report:
+    """
+    Ordered findings of one scan. Also a write-only file object, so it can be
+    the target of print() / capture_output(): each printed line becomes a
+    'text' finding, and "--- Title ---" lines open a new category.
+    """
+    def __init__(self, findings=None):
+        self.findings = list(findings or [])
+        self.category = 'general'
+        self._partial = ''
+
+    # --- Recording ---
+    def add(self, severity, message, evidence=None, category=None):
+        self._flush_partial()
+        self.findings.append(Finding(severity, category or self.category, message, evidence))
+
+    def write(self, text):
+        lines = (self._partial + text).split('\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._add_line(line)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+    def _flush_partial(self):
+        if self._partial:
+            line, self._partial = self._partial, ''
+            self._add_line(line)
+
+    def _add_line(self, line):
+        stripped = line.strip()
+        if not stripped:
+            return  # Blank spacer lines are reproduced by render()
+        m = _SECTION_RE.match(stripped)
+        if m:
+            self.category = m.group(1)
+            self.findings.append(Finding('section', self.category, self.category))
+        else:
+            self.findings.append(Finding('text', self.category, line.rstrip()))
+
+    # --- Queries ---
+    def __len__(self):
+        self._flush_partial()
+        return len(self.findings)
+
+    def __iter__(self):
+        self._flush_partial()
+        return iter(self.findings)
+
+    def filter(self, min_severity=None, category=None):
+        """Findings at or above `min_severity`, optionally in one category."""
+        floor = _RANK[min_severity] if min_severity else 0
+        return [f for f in self if _RANK.get(f.severity, 0) >= floor
+                and (category is None or f.category == category)]
+
+    def content(self):
+        """Copy of the report without its FILESYSTEM findings."""
+        return Report(f for f in self if f.category != FILESYSTEM)
+
+    def counts(self):
+        """Number of findings per graded severity."""
+        counts = {s: 0 for s in ('info', 'pass', 'warn', 'alert')}
+        for f in self:
+            if f.severity in counts:
+                counts[f.severity] += 1
+        return counts
+
+    def summary(self):
+        """One-line status for table cells and export columns."""
+        c = self.counts()
+        parts = []
+        if c['alert']: parts.append(f"{c['alert']} alerts")
+        if c['warn']: parts.append(f"{c['warn']} warnings")
+        return ", ".join(parts) if parts else "No alerts"
+
+    # --- Rendering ---
+    def render(self, min_severity=None):
+        """Full text of the report (rendered on demand)."""
+        return "\n".join(f.render() for f in self.filter(min_severity))
+
+    def getvalue(self):
+        return self.render()
+
+    def to_list(self):
+        return [f.to_dict() for f in self]
+
+    @classmethod
+    def from_list(cls, items):
+        return cls(Finding.from_dict(d) for d in items)
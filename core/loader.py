@@ -1,9 +1,15 @@
 import zipfile
 import os
-import signal
+import io
 import sys
+import mmap
+import bisect
+from collections import OrderedDict
+from contextlib import contextmanager
 from lxml import etree
 from utils.helpers import log_danger
+from core.document_model import DocumentModel
+from core.watchdog import Deadline, ScanTimeout, run_with_timeout, FILE_TIMEOUT, OPEN_TIMEOUT
 import logging
 
 # Setup simple file logging for loader
@@ -13,21 +19,163 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-class TimeoutError(Exception):
+# Parsed-XML cache budget per loader, charged by the uncompressed part size.
+# Least recently used trees are evicted first; parts bigger than the whole
+# budget are parsed on demand and never cached.
+XML_CACHE_BUDGET = 256 * 1024 * 1024
+
+# Parts whose uncompressed size exceeds this are streamed with iter_elements()
+# by analyzers that only count or pattern-match, instead of building a tree.
+STREAMING_THRESHOLD = 64 * 1024 * 1024
+
+# Parts are fed to the parser in chunks so the deadline is checked while parsing
+PARSE_CHUNK_SIZE = 1024 * 1024
+
+# Files up to this size are read into memory in one go; larger files are mmap'd
+IN_MEMORY_LIMIT = 64 * 1024 * 1024
+# ...in chunks, checking the file's deadline in between
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Decompression limits (zip-bomb protection). Members above MAX_MEMBER_SIZE are
+# never inflated whole (get_bytes/get_xml_tree refuse them; iter_elements and
+# read_prefix still work), members compressing better than MAX_COMPRESSION_RATIO
+# are refused outright, and a document stops inflating after MAX_INFLATED_TOTAL.
+MAX_MEMBER_SIZE = 256 * 1024 * 1024
+MAX_COMPRESSION_RATIO = 500   # Deflate tops out near 1032:1; real XML stays far below
+RATIO_MIN_SIZE = 1024 * 1024      # Small parts compress absurdly well; ignore them
+MAX_INFLATED_TOTAL = 1024 * 1024 * 1024
+
+class DecompressionLimit(Exception):
+    """Raised when a member exceeds the loader's decompression limits."""
     pass
 
-def timeout_handler(signum, frame):
-    raise TimeoutError("Operation timed out")
+class BufferReader(io.RawIOBase):
+    """Seekable read-only file object over bytes, a memoryview or an mmap (no copy)."""
+    def __init__(self, buffer):
+        self._view = memoryview(buffer)
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = len(self._view) + offset
+        self._pos = max(0, self._pos)
+        return self._pos
+
+    def read(self, size=-1):
+        end = len(self._view) if size is None or size < 0 else min(len(self._view), self._pos + size)
+        data = self._view[self._pos:end].tobytes()
+        self._pos = max(self._pos, end)
+        return data
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        self._view.release()
+        super().close()
+
+class MeteredMember(io.RawIOBase):
+    """Reader over an opened ZIP member that charges inflated bytes to its loader."""
+    def __init__(self, loader, path, raw, limit=None):
+        self._loader = loader
+        self._path = path
+        self._raw = raw
+        self._left = limit
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if self._left is not None:
+            size = self._left if size is None or size < 0 else min(size, self._left)
+        self._loader.deadline.check()
+        data = self._raw.read(size)
+        if self._left is not None:
+            self._left -= len(data)
+        self._loader._charge(self._path, len(data))
+        return data
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        self._raw.close()
+        super().close()
 
 class DocLoader:
-    def __init__(self, filepath):
-        self.filepath = filepath
+    """
+    Opens an Office document for the analyzers.
+    `source` is a file path, the document itself as bytes / memoryview /
+    mmap (e.g. a member read straight out of an outer ZIP), or a seekable
+    binary stream (a large member streamed from its archive, see
+    core.nested); pass `name` to label non-path sources in reports. Path sources are read into memory once
+    (or mmap'd when large), so analyzer passes never re-seek the disk.
+    With buffered=False a path source is opened in place instead, so only the
+    central directory and the members actually requested are read (triage).
+    """
+    def __init__(self, source, cache_budget=XML_CACHE_BUDGET, deadline=None, name=None,
+                 max_member_size=MAX_MEMBER_SIZE, max_ratio=MAX_COMPRESSION_RATIO,
+                 max_inflated=MAX_INFLATED_TOTAL, buffered=True):
+        self._stream = None
+        if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            self.filepath = name or "<memory>"
+            self.is_file_backed = False
+            self._buffer = source
+        elif hasattr(source, 'read'):
+            self.filepath = name or "<stream>"
+            self.is_file_backed = False
+            self._buffer = None
+            self._stream = source
+        else:
+            self.filepath = source
+            self.is_file_backed = True
+            self._buffer = None
+        self._mmap = None
+        self.buffered = buffered
         self.zip_ref = None
         self.file_type = "unknown" 
-        self._validate()
+        # Per-file time budget; time_budget() narrows it per analyzer
+        self.deadline = deadline or Deadline(FILE_TIMEOUT, os.path.basename(str(self.filepath)))
+        self.cache_budget = cache_budget
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._xml_cache = OrderedDict()  # xml_path -> (tree, cost)
+        self._xml_cache_size = 0
+        self._document_model = None
+        # Decompression accounting
+        self.max_member_size = max_member_size
+        self.max_ratio = max_ratio
+        self.max_inflated = max_inflated
+        self.bytes_inflated = 0
+        self.refused_members = {}  # member -> reason
+        # Member name index, built once in load()
+        self._names = []
+        self._name_set = set()
+        self._sorted_names = []
+        self._lower_names = []
+        self._query_cache = {}
 
     def _is_cloud_placeholder(self):
         """Detect if file is a cloud placeholder (OneDrive, Dropbox, etc.)."""
+        if not self.is_file_backed:
+            return False
         try:
             # Skip check for temp files (from ZIP extraction)
             if '\\Temp\\' in self.filepath or '/tmp/' in self.filepath:
@@ -60,61 +208,116 @@ class DocLoader:
             logging.warning(f"Error checking cloud status for {self.filepath}: {e}")
         return False
 
-    def _validate(self):
-        # Check if it's a cloud placeholder BEFORE attempting to open
-        if self._is_cloud_placeholder():
-            # Silently skip cloud placeholders (no need to spam console)
-            return
-            
-        try:
-            # Use timeout for is_zipfile check on Windows
-            if sys.platform != 'win32':
-                # Unix-like systems support SIGALRM
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(3)  # 3 second timeout
-            
-            if not zipfile.is_zipfile(self.filepath):
-                if sys.platform != 'win32':
-                    signal.alarm(0)  # Cancel alarm
-                return
-                
-            if sys.platform != 'win32':
-                signal.alarm(0)  # Cancel alarm
-        except TimeoutError:
-            log_danger(f"Timeout checking if file is zip: {self.filepath}")
-            return
-        except:
-            return
-
     def load(self):
         try:
-            # Additional cloud check before opening
+            # Cloud check before opening (reading would trigger a download)
             if self._is_cloud_placeholder():
                 # Silently skip cloud placeholders (no need to spam console)
                 return False
             
-            # Try to open with timeout protection
-            if sys.platform != 'win32':
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(5)  # 5 second timeout
-            
-            self.zip_ref = zipfile.ZipFile(self.filepath, 'r')
+            # Open the archive with timeout protection (watchdog thread
+            # instead of SIGALRM, so this also works off the main thread).
+            # Only the central directory has to arrive within OPEN_TIMEOUT;
+            # a buffered source is then read under the file's own deadline.
+            # Non-ZIP sources fail here with BadZipFile.
+            if self._stream is not None:
+                self._stream.seek(0)
+                self.zip_ref = zipfile.ZipFile(self._stream, 'r')
+            elif self._buffer is None and not self.buffered:
+                self.zip_ref = run_with_timeout(zipfile.ZipFile, OPEN_TIMEOUT, "opening archive", self.filepath, 'r')
+            else:
+                if self._buffer is None:
+                    run_with_timeout(self._probe_archive, OPEN_TIMEOUT, "opening archive")
+                    self._read_source()
+                self.zip_ref = zipfile.ZipFile(BufferReader(self._buffer), 'r')
+            self._index_names()
             self._detect_type()
-            
-            if sys.platform != 'win32':
-                signal.alarm(0)  # Cancel alarm
             return True
-        except TimeoutError:
+        except ScanTimeout:
             log_danger(f"Timeout loading file: {self.filepath}")
             return False
         except Exception as e:
-            if sys.platform != 'win32':
-                signal.alarm(0)  # Cancel alarm
             return False
 
+    def _probe_archive(self):
+        """Read the central directory of a path source (this is where cloud files block)."""
+        zipfile.ZipFile(self.filepath, 'r').close()
+
+    def _read_source(self):
+        """Pull a path source into memory once, or mmap it if it is large."""
+        with open(self.filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= IN_MEMORY_LIMIT:
+                chunks = []
+                while True:
+                    chunk = f.read(READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                    self.deadline.check()
+                self._buffer = b''.join(chunks)
+            else:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._buffer = self._mmap
+
+    def raw_bytes(self):
+        """The whole document as bytes if it is held in memory (or streamed), else None (mmap'd path)."""
+        if self._stream is not None:
+            self._stream.seek(0)
+            data = self._stream.read()
+            self._stream.seek(0)
+            return data
+        if self._buffer is None or self._mmap is not None:
+            return None
+        return self._buffer if isinstance(self._buffer, bytes) else bytes(self._buffer)
+
+    def source_size(self):
+        """Size of the whole document in bytes."""
+        if self._buffer is not None:
+            return len(self._buffer)
+        if self._stream is not None:
+            return self._stream.seek(0, io.SEEK_END)
+        return os.path.getsize(self.filepath)
+
+    def open_source(self):
+        """A path or file object for libraries (openpyxl) that open the document themselves."""
+        if self.is_file_backed:
+            return self.filepath
+        if self._stream is not None:
+            self._stream.seek(0)
+            return self._stream
+        return BufferReader(self._buffer)
+
+    @contextmanager
+    def time_budget(self, seconds, label):
+        """Run a block (typically one analyzer) under a nested deadline."""
+        outer = self.deadline
+        self.deadline = outer.child(seconds, label)
+        try:
+            yield self.deadline
+        finally:
+            self.deadline = outer
+
+    def _index_names(self):
+        """
+        Build the member name index once per archive: a set for existence
+        checks, a sorted list for prefix queries (bisect), each name's archive
+        position (queries answer in archive order, like namelist()) and
+        lowercase names for case-insensitive substring queries. Query results
+        are memoized.
+        """
+        self._names = self.zip_ref.namelist()
+        self._name_set = set(self._names)
+        self._sorted_names = sorted(self._name_set)
+        self._position = {}
+        for i, name in enumerate(self._names):
+            self._position.setdefault(name, i)
+        self._lower_names = [(n.lower(), n) for n in sorted(self._name_set, key=self._position.get)]
+        self._query_cache = {}
+
     def _detect_type(self):
         """Enhanced format detection for DOCX, XLSX, PPTX, ODT, ODS, ODP."""
-        files = self.zip_ref.namelist()
+        files = self._name_set
         
         # OpenXML formats (Microsoft Office)
         if 'word/document.xml' in files: 
@@ -136,41 +339,237 @@ class DocLoader:
                     self.file_type = 'odp'
                 else:
                     self.file_type = 'odt'  # default to ODT
-            except:
+            except Exception:
                 self.file_type = 'odt'  # fallback
         else: 
             self.file_type = 'unknown'
 
     def get_xml_tree(self, xml_path):
-        """Parse an XML file from the archive."""
+        """
+        Parse an XML file from the archive.
+        Trees are cached per loader, so every analyzer shares one parse of each
+        part. The returned tree is shared: callers must treat it as read-only.
+        """
+        if xml_path in self._xml_cache:
+            self.cache_hits += 1
+            self._xml_cache.move_to_end(xml_path)
+            return self._xml_cache[xml_path][0]
+
+        self.cache_misses += 1
         try:
-            with self.zip_ref.open(xml_path) as f:
-                return etree.parse(f)
+            tree = self._parse_part(xml_path)
+        except ScanTimeout:
+            raise
+        except DecompressionLimit:
+            return None  # Not cached: the refusal is already recorded
         except: 
+            tree = None
+        self._cache_tree(xml_path, tree)
+        return tree
+
+    def _parse_part(self, xml_path):
+        """Feed the part to the parser chunk by chunk, checking the deadline in between."""
+        parser = etree.XMLParser()
+        with self._open_member(xml_path, whole=True) as f:
+            while True:
+                chunk = f.read(PARSE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                parser.feed(chunk)
+        return parser.close().getroottree()
+
+    def _cache_tree(self, xml_path, tree):
+        """Store a parsed tree (or a failed lookup) and evict LRU entries over budget."""
+        cost = 0
+        if tree is not None:
+            try:
+                cost = self.zip_ref.getinfo(xml_path).file_size
+            except KeyError:
+                cost = 0
+            if cost > self.cache_budget:
+                return
+
+        self._xml_cache[xml_path] = (tree, cost)
+        self._xml_cache_size += cost
+        while self._xml_cache_size > self.cache_budget and len(self._xml_cache) > 1:
+            _, (_, evicted_cost) = self._xml_cache.popitem(last=False)
+            self._xml_cache_size -= evicted_cost
+
+    def is_large_part(self, path, threshold=STREAMING_THRESHOLD):
+        """True if the part's uncompressed size is over the streaming threshold."""
+        try:
+            return self.zip_ref.getinfo(path).file_size > threshold
+        except Exception:
+            return False
+
+    def iter_elements(self, path, tags=None):
+        """
+        Stream elements of an XML part with lxml iterparse.
+        Each element is yielded on its end tag and cleared (along with its
+        already-processed siblings) as soon as the caller moves on, so memory
+        stays flat regardless of part size. Callers must not keep references.
+        """
+        try:
+            f = self._open_member(path)
+        except Exception:
+            return
+
+        with f:
+            try:
+                for count, (_, elem) in enumerate(etree.iterparse(f, events=('end',), tag=tags)):
+                    if count % 1000 == 0:
+                        self.deadline.check()
+                    yield elem
+                    elem.clear(keep_tail=True)
+                    parent = elem.getparent()
+                    if parent is not None:
+                        while elem.getprevious() is not None:
+                            del parent[0]
+            except etree.XMLSyntaxError as e:
+                logging.warning(f"Streaming parse of {path} stopped early: {e}")
+            except DecompressionLimit:
+                return
+
+    def get_document_model(self):
+        """
+        Return the shared DocumentModel for word/document.xml (DOCX only).
+        Built once per loader from the cached tree; None if the part is missing.
+        """
+        if self._document_model is None:
+            tree = self.get_xml_tree('word/document.xml')
+            if tree is None:
+                return None
+            self._document_model = DocumentModel(tree)
+        return self._document_model
+
+    def cache_stats(self):
+        """Return parsed-XML cache counters for diagnostics."""
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'entries': len(self._xml_cache),
+            'bytes': self._xml_cache_size,
+            'budget': self.cache_budget,
+            'inflated': self.bytes_inflated,
+            'refused': len(self.refused_members)
+        }
+
+    def _open_member(self, path, whole=False, limit=None):
+        """
+        Open a member through the decompression limits. `whole` means the caller
+        will hold the entire member in memory, so the per-member size cap applies.
+        """
+        info = self.zip_ref.getinfo(path)
+        if info.file_size > RATIO_MIN_SIZE and info.compress_size > 0:
+            ratio = info.file_size / info.compress_size
+            if ratio > self.max_ratio:
+                self._refuse(path, f"compression ratio {ratio:.0f}:1 exceeds {self.max_ratio}:1")
+        if whole and limit is None and info.file_size > self.max_member_size:
+            self._refuse(path, f"{info.file_size / 1048576:.0f} MB uncompressed exceeds "
+                               f"{self.max_member_size / 1048576:.0f} MB member limit")
+        needed = info.file_size if whole and limit is None else 1
+        if self.bytes_inflated + needed > self.max_inflated:
+            self._refuse(path, "document decompression budget exhausted")
+        return MeteredMember(self, path, self.zip_ref.open(info), limit)
+
+    def _charge(self, path, n):
+        """Account for inflated bytes; stop the read once the document budget is spent."""
+        self.bytes_inflated += n
+        if self.bytes_inflated > self.max_inflated:
+            self._refuse(path, f"document inflated past {self.max_inflated / 1048576:.0f} MB")
+
+    def _refuse(self, path, reason):
+        if path not in self.refused_members:
+            self.refused_members[path] = reason
+            log_danger(f"Refused to decompress {path}: {reason} (possible zip bomb)")
+            logging.warning(f"{self.filepath}: refused {path}: {reason}")
+        raise DecompressionLimit(f"{path}: {reason}")
+
+    def read_prefix(self, path, n):
+        """First `n` uncompressed bytes of a member (headers, magic numbers), or None."""
+        try:
+            with self._open_member(path, limit=n) as f:
+                chunks = []
+                while True:
+                    chunk = f.read(PARSE_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+            return b"".join(chunks)
+        except ScanTimeout:
+            raise
+        except:
             return None
 
     def get_bytes(self, path):
-        """Helper to extract raw bytes (for images/thumbnails)."""
+        """Helper to extract raw bytes (for images/thumbnails). None if refused."""
         try:
-            return self.zip_ref.read(path)
+            chunks = []
+            with self._open_member(path, whole=True) as f:
+                while True:
+                    chunk = f.read(PARSE_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+            return b"".join(chunks)
+        except ScanTimeout:
+            raise
         except: 
             return None
     
+    def namelist(self):
+        """All member names in archive order (cached; do not modify)."""
+        return self._names
+
     def file_exists(self, path):
         """Check if a file exists in the archive."""
-        return path in self.zip_ref.namelist()
+        return path in self._name_set
     
     def list_files(self, prefix='', suffix=''):
-        """List files in the archive with optional prefix/suffix filter."""
-        files = self.zip_ref.namelist()
-        if prefix and suffix:
-            return [f for f in files if f.startswith(prefix) and f.endswith(suffix)]
-        elif prefix:
-            return [f for f in files if f.startswith(prefix)]
-        elif suffix:
-            return [f for f in files if f.endswith(suffix)]
-        return files
+        """
+        List files in the archive with optional prefix/suffix filter, in
+        archive order. prefix may be a tuple of prefixes, like
+        str.startswith(); a name matching several is listed once.
+        """
+        if not prefix and not suffix:
+            return self._names
+
+        key = ('list', prefix, suffix)
+        if key not in self._query_cache:
+            prefixes = prefix if isinstance(prefix, tuple) else (prefix,)
+            files = set()
+            for p in prefixes:
+                files.update(self._prefix_range(p))
+            if suffix:
+                files = {f for f in files if f.endswith(suffix)}
+            self._query_cache[key] = sorted(files, key=self._position.get)
+        return self._query_cache[key]
+
+    def _prefix_range(self, prefix):
+        """Names starting with prefix, located by binary search in the sorted index."""
+        if not prefix:
+            return list(self._sorted_names)
+        start = bisect.bisect_left(self._sorted_names, prefix)
+        end = start
+        names = self._sorted_names
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return names[start:end]
+
+    def find_files(self, fragment):
+        """Case-insensitive substring search over member names (memoized per fragment)."""
+        fragment = fragment.lower()
+        key = ('find', fragment)
+        if key not in self._query_cache:
+            self._query_cache[key] = [name for lower, name in self._lower_names if fragment in lower]
+        return self._query_cache[key]
 
     def close(self):
+        self._document_model = None
+        self._xml_cache.clear()
+        self._xml_cache_size = 0
         if self.zip_ref:
-            self.zip_ref.close()
\ No newline at end of file
+            self.zip_ref.close()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
\ No newline at end of file
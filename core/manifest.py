@@ -0,0 +1,130 @@
+"""
+Folder Manifest
+Per-folder record of what was scanned last time: each file's stat identity
+(size, mtime, inode) and the rows it produced. A rescan stats the discovered
+files, compares them with the manifest and only re-analyzes what was added or
+modified; unchanged files get their previous rows back without being read.
+Rows are stamped with the analyzer fingerprint that produced them, and rows of
+another fingerprint count as modified, so an analyzer change rescans them.
+Stored alongside the result cache in the examiner's home directory.
+"""
+import os
+import json
+import sqlite3
+
+from core.result_cache import DEFAULT_CACHE_PATH, ANALYZER_FINGERPRINT
+
+# Never persisted: live objects and per-session flags
+_TRANSIENT_FIELDS = ('deep_report', 'is_duplicate')
+
+
+def stat_key(path, st=None):
+    """(size, mtime_ns, inode) identity of a file; None if it cannot be stat'ed."""
+    try:
+        st = st or os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+class ChangeSet:
+    """Result of comparing a discovery pass with the manifest."""
+    def __init__(self):
+        self.added = []
+        self.modified = []
+        self.unchanged = []
+        self.removed = []
+        self.keys = {}  # path -> stat key seen during this pass
+
+    def to_scan(self):
+        return self.added + self.modified
+
+    def summary(self):
+        return (f"{len(self.added)} added, {len(self.modified)} modified, "
+                f"{len(self.removed)} removed, {len(self.unchanged)} unchanged")
+
+
+class FolderManifest:
+    def __init__(self, root, db_path=DEFAULT_CACHE_PATH, version=ANALYZER_FINGERPRINT):
+        self.root = os.path.normcase(os.path.abspath(root))
+        self.version = version
+        self._known = {}
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        with self.conn:
+            self.conn.execute("""CREATE TABLE IF NOT EXISTS manifest (
+                                     root TEXT NOT NULL, path TEXT NOT NULL,
+                                     size INTEGER, mtime_ns INTEGER, inode INTEGER,
+                                     rows TEXT NOT NULL, version TEXT,
+                                     PRIMARY KEY (root, path))""")
+            # Manifests written before rows were stamped: their rows read as stale
+            columns = [c[1] for c in self.conn.execute("PRAGMA table_info(manifest)")]
+            if 'version' not in columns:
+                self.conn.execute("ALTER TABLE manifest ADD COLUMN version TEXT")
+
+    def _entries(self):
+        cur = self.conn.execute("SELECT path, size, mtime_ns, inode, version FROM manifest WHERE root = ?", (self.root,))
+        return {path: ((size, mtime, inode), version) for path, size, mtime, inode, version in cur}
+
+    def begin(self):
+        """Start a streaming comparison; feed paths to classify(), then call finish()."""
+        self._known = self._entries()
+        return ChangeSet()
+
+    def classify(self, changes, path, key=None):
+        """
+        File `path` was discovered; returns 'added', 'modified' or 'unchanged'.
+        Rows from another analyzer fingerprint are 'modified' even if the file is not.
+        """
+        key = key or stat_key(path)
+        changes.keys[path] = key
+        previous = self._known.pop(path, None)
+        if previous is None:
+            changes.added.append(path)
+            return 'added'
+        previous_key, version = previous
+        if key is None or tuple(previous_key) != tuple(key) or version != self.version:
+            changes.modified.append(path)
+            return 'modified'
+        changes.unchanged.append(path)
+        return 'unchanged'
+
+    def finish(self, changes):
+        """Whatever was not rediscovered has been removed."""
+        changes.removed = sorted(self._known)
+        self._known = {}
+        return changes
+
+    def diff(self, paths, keys=None):
+        """
+        Classify discovered `paths` against the last scan. `keys` may supply
+        stat keys already gathered during discovery (path -> key).
+        """
+        changes = self.begin()
+        for path in paths:
+            self.classify(changes, path, (keys or {}).get(path))
+        return self.finish(changes)
+
+    def rows(self, path):
+        """Rows recorded for `path` by the previous scan."""
+        cur = self.conn.execute("SELECT rows FROM manifest WHERE root = ? AND path = ?", (self.root, path))
+        hit = cur.fetchone()
+        return json.loads(hit[0]) if hit else []
+
+    def record(self, entries):
+        """Store {path: (stat key, [rows])} from a finished scan."""
+        data = []
+        for path, (key, rows) in entries.items():
+            if key is None: continue
+            clean = [{k: v for k, v in row.items() if k not in _TRANSIENT_FIELDS} for row in rows]
+            data.append((self.root, path, key[0], key[1], key[2], json.dumps(clean), self.version))
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO manifest (root, path, size, mtime_ns, inode, rows, version) "
+                                  "VALUES (?, ?, ?, ?, ?, ?, ?)", data)
+
+    def forget(self, paths):
+        with self.conn:
+            self.conn.executemany("DELETE FROM manifest WHERE root = ? AND path = ?",
+                                  [(self.root, p) for p in paths])
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,132 @@
+"""
+MinHash
+Approximate set similarity for very large corpora (RSID genealogy). Each set
+becomes a fixed-size MinHash signature built with one-permutation hashing:
+every element is hashed once and dropped into one of NUM_HASHES bins, and
+empty bins borrow from the next filled one (densification), so signing costs
+O(set size) instead of O(set size x hashes). LSH banding then buckets the
+signatures so that only sets likely to be above a Jaccard threshold meet.
+Memory is one array of NUM_HASHES 64-bit values per set plus one bucket
+entry per band, independent of how often elements are shared.
+"""
+import hashlib
+from array import array
+from collections import defaultdict, Counter
+
+NUM_HASHES = 64
+MAX_BUCKET = 200   # Larger LSH buckets are checked against one representative, not pairwise
+
+_MASK = (1 << 64) - 1
+_EMPTY = _MASK
+_GOLDEN = 0x9E3779B97F4A7C15  # Offset that keeps borrowed bins distinct
+
+
+def _element_hash(element):
+    return int.from_bytes(hashlib.blake2b(str(element).encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def signature(elements, num_hashes=NUM_HASHES):
+    """MinHash signature of a non-empty set, as array('Q') of `num_hashes` values."""
+    bins = array('Q', [_EMPTY]) * num_hashes
+    for element in elements:
+        h = _element_hash(element)
+        b = h % num_hashes
+        v = h // num_hashes
+        if v < bins[b]: bins[b] = v
+    # Densify: an empty bin takes the next filled bin's value, offset by the distance
+    # (one backwards sweep over two laps, so the search wraps around)
+    source = bins[:]
+    following = None
+    for b in range(2 * num_hashes - 1, -1, -1):
+        if source[b % num_hashes] != _EMPTY:
+            following = b
+        elif b < num_hashes and following is not None:
+            bins[b] = (source[following % num_hashes] + (following - b) * _GOLDEN) & _MASK
+    return bins
+
+
+def lsh_params(threshold, num_hashes=NUM_HASHES):
+    """(bands, rows) dividing num_hashes whose S-curve midpoint (1/b)^(1/r) is closest to `threshold`."""
+    best = None
+    for rows in range(1, num_hashes + 1):
+        if num_hashes % rows: continue
+        bands = num_hashes // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+def lsh_candidates(signatures, threshold, max_bucket=MAX_BUCKET):
+    """
+    Candidate pairs (i, j), i < j, of `signatures` (by list index) that land in
+    the same bucket of some LSH band. Buckets above max_bucket (heavily shared
+    templates) only pair each member with a representative (see
+    _representative), which keeps the pair count linear. Returns (pairs, stats dict).
+    """
+    num_hashes = len(signatures[0]) if signatures else NUM_HASHES
+    bands, rows = lsh_params(threshold, num_hashes)
+    pairs = set()
+    capped = 0
+    for band in range(bands):
+        buckets = defaultdict(list)
+        lo, hi = band * rows, (band + 1) * rows
+        for doc_id, sig in enumerate(signatures):
+            buckets[sig[lo:hi].tobytes()].append(doc_id)
+        for docs in buckets.values():
+            if len(docs) < 2: continue
+            if len(docs) > max_bucket:
+                capped += 1
+                rep = _representative(docs, signatures)
+                pairs.update((min(rep, d), max(rep, d)) for d in docs if d != rep)
+                continue
+            for k, a in enumerate(docs):
+                for b in docs[k + 1:]:
+                    pairs.add((a, b))
+    return pairs, {'bands': bands, 'rows': rows, 'capped_buckets': capped}
+
+
+def _representative(docs, signatures):
+    """
+    Member of an oversized bucket closest to its consensus signature (the
+    most common value at each position), i.e. the most typical member rather
+    than whichever came first; lowest index on ties, so runs are repeatable.
+    """
+    consensus = [Counter(signatures[d][k] for d in docs).most_common(1)[0][0]
+                 for k in range(len(signatures[docs[0]]))]
+    return max(docs, key=lambda d: (sum(a == b for a, b in zip(signatures[d], consensus)), -d))
+
+
+def jaccard(a, b):
+    """Jaccard similarity of two collections of distinct elements (sets or sorted arrays)."""
+    if not a or not b: return 0.0
+    shared = len(set(a).intersection(b))
+    return shared / (len(a) + len(b) - shared)
+
+
+class DisjointSet:
+    """Union-find over 0..n-1 (path halving, union by size)."""
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a == b: return
+        if self.size[a] < self.size[b]: a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+
+    def groups(self):
+        """Members of every set with more than one element."""
+        groups = defaultdict(list)
+        for x in range(len(self.parent)):
+            groups[self.find(x)].append(x)
+        return [g for g in groups.values() if len(g) > 1]
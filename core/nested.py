@@ -0,0 +1,141 @@
+"""
+Nested Sources
+Documents that live inside other archives are opened straight from the
+outer archive, never extracted to disk. A nested path is the outer file
+followed by the member names at each level, joined with " [>>] " (the
+table's full_path notation), so ZIP-in-ZIP works the same as one level.
+Members up to NESTED_IN_MEMORY_LIMIT are read into memory; larger ones are
+handed on as a seekable stream over the outer archive. A level may also be
+an OLE compound file (an embedded oleObject*.bin), whose next member is a
+stream name such as "Package" (needs olefile, installed with oletools).
+
+A "source" is whatever DocLoader accepts: a path, bytes, or a seekable
+binary stream. The helpers below treat all three alike.
+"""
+import io
+import os
+import zipfile
+from contextlib import contextmanager, ExitStack
+
+from core.loader import IN_MEMORY_LIMIT
+try:
+    import olefile
+    OLEFILE_AVAILABLE = True
+except ImportError:
+    OLEFILE_AVAILABLE = False
+
+MEMBER_SEP = " [>>] "
+NESTED_IN_MEMORY_LIMIT = IN_MEMORY_LIMIT
+OLE_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+
+def split_nested(path):
+    """(outer path, [member, ...]); the list is empty for a plain file."""
+    parts = path.split(MEMBER_SEP)
+    return parts[0], parts[1:]
+
+
+def join_nested(outer, *members):
+    return MEMBER_SEP.join((outer,) + tuple(m for m in members if m))
+
+
+def is_nested(path):
+    return MEMBER_SEP in path
+
+
+@contextmanager
+def open_nested(path, limit=NESTED_IN_MEMORY_LIMIT):
+    """Source for a (possibly nested) path, valid inside the with block."""
+    outer, members = split_nested(path)
+    if not members:
+        yield outer
+        return
+    with ExitStack() as stack:
+        z = stack.enter_context(zipfile.ZipFile(outer, 'r'))
+        yield _descend(stack, z, members, limit)
+
+
+@contextmanager
+def open_members(z, members, limit=NESTED_IN_MEMORY_LIMIT):
+    """Like open_nested(), starting from an already open outer archive."""
+    with ExitStack() as stack:
+        yield _descend(stack, z, members, limit)
+
+
+def _descend(stack, container, members, limit):
+    for depth, member in enumerate(members, 1):
+        source = read_member(stack, container, member, limit)
+        if depth == len(members):
+            return source
+        container = open_container(stack, source)
+
+
+def read_member(stack, container, member, limit=NESTED_IN_MEMORY_LIMIT):
+    """Member of an open ZIP (bytes, or a stream above `limit`) or stream of an OLE file (bytes)."""
+    if isinstance(container, zipfile.ZipFile):
+        if container.getinfo(member).file_size <= limit:
+            return container.read(member)
+        return stack.enter_context(container.open(member))
+    return container.openstream(member).read()
+
+
+def open_container(stack, source):
+    """Open a ZIP or OLE source for reading members; closed with `stack`."""
+    if read_head(source, 8) == OLE_SIGNATURE:
+        if not OLEFILE_AVAILABLE:
+            raise ValueError("olefile is not installed; cannot open OLE object")
+        return stack.enter_context(olefile.OleFileIO(source_bytes(source)))
+    if not is_stream(source):
+        source = io.BytesIO(source)
+    return stack.enter_context(zipfile.ZipFile(source, 'r'))
+
+
+def load_nested(path):
+    """Path of a plain file, or the whole nested document as bytes (single-document views)."""
+    with open_nested(path) as source:
+        return source if isinstance(source, str) else source_bytes(source)
+
+
+def source_name(path):
+    """Display name of a (possibly nested) path: its innermost component."""
+    outer, members = split_nested(path)
+    return os.path.basename(members[-1] if members else outer)
+
+
+def is_stream(source):
+    return hasattr(source, 'read')
+
+
+def source_size(source):
+    if isinstance(source, str):
+        return os.path.getsize(source)
+    if is_stream(source):
+        source.seek(0, io.SEEK_END)
+        return source.tell()
+    return len(source)
+
+
+def read_head(source, n):
+    """First `n` bytes of a source (signature checks)."""
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            return f.read(n)
+    if is_stream(source):
+        source.seek(0)
+        head = source.read(n)
+        source.seek(0)
+        return head
+    return bytes(source[:n])
+
+
+def source_bytes(source):
+    """The whole source as bytes."""
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            return f.read()
+    if is_stream(source):
+        source.seek(0)
+        data = source.read()
+        source.seek(0)
+        return data
+    return source if isinstance(source, bytes) else bytes(source)
@@ -0,0 +1,132 @@
+"""
+Pipeline
+Plumbing for the staged batch scan: discover -> hash -> analyze -> exiftool -> render.
+Stages run concurrently and hand work on through bounded Channels, so disk
+reads overlap with parsing, a slow stage holds back the ones feeding it
+(memory stays flat on huge folders), and each stage keeps a StageStats
+counter for the throughput shown in the status bar.
+"""
+import queue
+import threading
+import time
+
+CHANNEL_SIZE = 256   # Items buffered between two stages
+POLL_INTERVAL = 0.2  # Seconds between cancel checks while blocked
+
+
+class StageStats:
+    """Items (and bytes) a stage has completed; rates are since its first item."""
+    def __init__(self, name, show_bytes=False):
+        self.name = name
+        self.show_bytes = show_bytes
+        self.items = 0
+        self.bytes = 0
+        self.started = None
+        self._lock = threading.Lock()
+
+    def add(self, items=1, nbytes=0):
+        with self._lock:
+            if self.started is None: self.started = time.monotonic()
+            self.items += items
+            self.bytes += nbytes
+
+    def describe(self):
+        elapsed = time.monotonic() - self.started if self.started else 0
+        if elapsed < 0.5:
+            return f"{self.name} {self.items}"
+        if self.show_bytes:
+            return f"{self.name} {self.items} ({self.bytes / elapsed / (1024 * 1024):.1f} MB/s)"
+        return f"{self.name} {self.items} ({self.items / elapsed:.0f}/s)"
+
+
+class Channel:
+    """
+    Bounded queue between stages. put() blocks while the consumer is behind
+    and gives up once the pipeline is cancelled. Each producer calls close()
+    when done; consumers see CLOSED after the last one has.
+    """
+    EMPTY = object()
+    CLOSED = object()
+
+    def __init__(self, should_stop, maxsize=CHANNEL_SIZE, producers=1):
+        self._q = queue.Queue(maxsize=maxsize)
+        self._should_stop = should_stop
+        self._producers = producers
+        self._lock = threading.Lock()
+
+    def put(self, item):
+        """False if the pipeline was cancelled before the item could be queued."""
+        while not self._should_stop():
+            try:
+                self._q.put(item, timeout=POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def close(self):
+        with self._lock:
+            self._producers -= 1
+            last = self._producers == 0
+        if last:
+            self.put(Channel.CLOSED)
+
+    def get(self, timeout=POLL_INTERVAL):
+        """Next item, EMPTY if none arrived within `timeout`, or CLOSED."""
+        if self._should_stop():
+            return Channel.CLOSED
+        try:
+            item = self._q.get(timeout=timeout) if timeout else self._q.get_nowait()
+        except queue.Empty:
+            return Channel.EMPTY
+        if item is Channel.CLOSED:
+            self._q.put_nowait(item)  # Leave it for the other consumers
+        return item
+
+    def drain(self, limit):
+        """Up to `limit` items without blocking, and whether the channel is finished."""
+        items = []
+        while len(items) < limit:
+            item = self.get(timeout=0)
+            if item is Channel.EMPTY: break
+            if item is Channel.CLOSED: return items, True
+            items.append(item)
+        return items, False
+
+    def __iter__(self):
+        while True:
+            item = self.get()
+            if item is Channel.CLOSED: return
+            if item is not Channel.EMPTY: yield item
+
+    def __len__(self):
+        return self._q.qsize()
+
+
+class Pipeline:
+    """Stages, channels and worker threads of one scan."""
+    def __init__(self, should_stop):
+        self.should_stop = should_stop
+        self.stages = []
+        self._threads = []
+
+    def stage(self, name, show_bytes=False):
+        stats = StageStats(name, show_bytes)
+        self.stages.append(stats)
+        return stats
+
+    def channel(self, maxsize=CHANNEL_SIZE, producers=1):
+        return Channel(self.should_stop, maxsize, producers)
+
+    def spawn(self, target, *args, name=None):
+        t = threading.Thread(target=target, args=args, name=name, daemon=True)
+        self._threads.append(t)
+        t.start()
+        return t
+
+    def join(self):
+        for t in self._threads:
+            t.join()
+
+    def status(self):
+        return " | ".join(s.describe() for s in self.stages)
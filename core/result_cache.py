@@ -0,0 +1,147 @@
+"""
+Result Cache
+SQLite store of scan results keyed by content MD5 and analyzer fingerprint,
+so a re-scan of an unchanged file is a hash plus a lookup. Holds the batch row
+and the content findings of the deep scans (never the per-path file system
+section). The fingerprint hashes the analyzer code itself, so editing any
+analyzer retires its old entries without anyone bumping a version; entries
+of another fingerprint are never matched again and stay until prune() is
+called explicitly (another build may share the same database).
+The database lives in the examiner's home directory, never in the evidence
+folder, so scanning does not modify the case.
+"""
+import os
+import sys
+import glob
+import json
+import hashlib
+import sqlite3
+import threading
+
+# Release of the analyzers; part of ANALYZER_FINGERPRINT below
+ANALYZER_VERSION = "1.3.0-r2"
+
+# Sources whose code decides what a row or a report contains
+_FINGERPRINT_SOURCES = ('analyzers/*.py', 'core/*.py', 'utils/helpers.py')
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), 'OfficeRecon_cache.sqlite')
+
+# Row fields that belong to the path rather than the content; never cached
+PATH_FIELDS = ('filename', 'full_path', 'provenance', 'size', 'fs_created', 'fs_modified', 'fs_accessed', 'is_duplicate')
+
+
+def analyzer_fingerprint(version=ANALYZER_VERSION):
+    """
+    ANALYZER_VERSION plus a hash of the analyzer sources. A frozen build
+    ships no sources; there the executable's size and mtime stand in.
+    """
+    digest = hashlib.sha256()
+    if getattr(sys, 'frozen', False):
+        st = os.stat(sys.executable)
+        digest.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+    else:
+        base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for pattern in _FINGERPRINT_SOURCES:
+            for path in sorted(glob.glob(os.path.join(base, pattern))):
+                digest.update(os.path.relpath(path, base).replace(os.sep, '/').encode())
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+    return f"{version}+{digest.hexdigest()[:16]}"
+
+ANALYZER_FINGERPRINT = analyzer_fingerprint()
+
+
+class ResultCache:
+    """
+    Thread- and process-safe (one connection per thread, WAL journal).
+    kind names what is stored: 'batch' rows, 'deep' reports, and the
+    'dossier' / 'authors' reports of the double-click view.
+    """
+    def __init__(self, path=DEFAULT_CACHE_PATH, version=ANALYZER_FINGERPRINT):
+        self.path = path
+        self.version = version
+        self._local = threading.local()
+        conn = self._conn()
+        with conn:
+            conn.execute("""CREATE TABLE IF NOT EXISTS results (
+                                md5 TEXT NOT NULL, version TEXT NOT NULL, kind TEXT NOT NULL,
+                                payload TEXT NOT NULL,
+                                PRIMARY KEY (md5, version, kind))""")
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, md5, kind):
+        """Cached payload (decoded JSON) or None."""
+        if not md5 or md5 == "Error":
+            return None
+        try:
+            cur = self._conn().execute(
+                "SELECT payload FROM results WHERE md5 = ? AND version = ? AND kind = ?",
+                (md5, self.version, kind))
+            hit = cur.fetchone()
+            return json.loads(hit[0]) if hit else None
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def put(self, md5, kind, payload):
+        if not md5 or md5 == "Error":
+            return
+        try:
+            conn = self._conn()
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                             (md5, self.version, kind, json.dumps(payload)))
+        except sqlite3.Error:
+            pass  # A cache write failure must never fail the scan
+
+    def get_row(self, md5):
+        return self.get(md5, 'batch')
+
+    def put_row(self, md5, row):
+        self.put(md5, 'batch', {k: v for k, v in row.items() if k not in PATH_FIELDS})
+
+    def clear(self):
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM results")
+
+    def prune(self):
+        """Drop the entries of every other fingerprint; returns how many."""
+        conn = self._conn()
+        with conn:
+            return conn.execute("DELETE FROM results WHERE version != ?", (self.version,)).rowcount
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_open_caches = {}
+_open_lock = threading.Lock()
+
+def _reset_after_fork():
+    # A forked worker may inherit the lock held by a scan thread, and SQLite
+    # connections must not cross fork(): start the child with fresh state.
+    global _open_lock
+    _open_lock = threading.Lock()
+    _open_caches.clear()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+def get_cache(path=DEFAULT_CACHE_PATH):
+    """Process-wide ResultCache for `path` (workers each open their own)."""
+    with _open_lock:
+        cache = _open_caches.get(path)
+        if cache is None:
+            cache = _open_caches[path] = ResultCache(path)
+        return cache
@@ -0,0 +1,55 @@
+"""
+RSID Index
+Per-folder store of every DOCX's RSIDs for genealogy mapping. A rerun only
+reads documents that were added or modified since (by stat identity, as in
+the folder manifest), and a new document can be matched against the corpus
+without reopening it. RSIDs are 32-bit values, so each document's set is kept
+as a sorted uint32 array: 4 bytes per RSID in a BLOB next to the result cache.
+"""
+import os
+import sqlite3
+from array import array
+
+from core.result_cache import DEFAULT_CACHE_PATH
+
+
+def pack(rsids):
+    return array('I', sorted(rsids)).tobytes()
+
+
+def unpack(blob):
+    rsids = array('I')
+    rsids.frombytes(blob)
+    return rsids
+
+
+class RsidIndex:
+    def __init__(self, root, db_path=DEFAULT_CACHE_PATH):
+        self.root = os.path.normcase(os.path.abspath(root))
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        with self.conn:
+            self.conn.execute("""CREATE TABLE IF NOT EXISTS rsid_index (
+                                     root TEXT NOT NULL, path TEXT NOT NULL,
+                                     size INTEGER, mtime_ns INTEGER, inode INTEGER,
+                                     rsids BLOB NOT NULL,
+                                     PRIMARY KEY (root, path))""")
+
+    def load(self):
+        """{path: (stat key, sorted RSID array)} of the folder's indexed documents."""
+        cur = self.conn.execute("SELECT path, size, mtime_ns, inode, rsids FROM rsid_index WHERE root = ?", (self.root,))
+        return {path: ((size, mtime, inode), unpack(blob)) for path, size, mtime, inode, blob in cur}
+
+    def store(self, entries):
+        """Store {path: (stat key, RSIDs)}."""
+        data = [(self.root, path, key[0], key[1], key[2], pack(rsids))
+                for path, (key, rsids) in entries.items() if key is not None]
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO rsid_index VALUES (?, ?, ?, ?, ?, ?)", data)
+
+    def forget(self, paths):
+        with self.conn:
+            self.conn.executemany("DELETE FROM rsid_index WHERE root = ? AND path = ?",
+                                  [(self.root, p) for p in paths])
+
+    def close(self):
+        self.conn.close()
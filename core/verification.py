@@ -0,0 +1,164 @@
+"""
+Verification
+Re-hashes scanned rows to show the evidence is unchanged. Rows are grouped by
+the container archive they came from, so each outer ZIP is opened once and
+its members (at any nesting depth) are streamed straight into the hashers. Plain
+files and containers are verified in parallel on a thread pool: hashing and
+inflation both release the GIL. Progress is tracked in bytes for MB/s and ETA.
+"""
+import time
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from core.hashing import hash_file, hash_stream, hash_bytes, ALGORITHMS
+from core.nested import split_nested, open_nested, open_members
+
+VERIFY_WORKERS = 8
+
+# SKIP: triage rows, which were never hashed and so have nothing to verify
+PASS, FAIL, ERROR, SKIP = 'pass', 'fail', 'error', 'skip'
+
+
+def hash_row_source(path, progress=None):
+    """Digests of a row's file; nested members are streamed from their archive."""
+    # limit=0: stream every level instead of reading members into memory
+    with open_nested(path, limit=0) as source:
+        if isinstance(source, str):
+            return hash_file(source, progress=progress)
+        return _hash_member(source, progress)
+
+
+def _hash_member(source, progress=None):
+    # ZIP members stream; OLE streams (embedded packages) come back as bytes
+    if hasattr(source, 'read'):
+        return hash_stream(source, progress=progress)
+    if progress: progress(len(source))
+    return hash_bytes(source)
+
+
+def compare_digests(row, digests):
+    """[(algorithm, stored, current, match)] for every digest the row has on record."""
+    return [(alg, row[alg], digests[alg], row[alg].lower() == digests[alg].lower())
+            for alg in ALGORITHMS if row.get(alg) and row[alg] != "Error"]
+
+
+def _verdict(row, digests):
+    results = compare_digests(row, digests)
+    if not results:
+        return ERROR, "No stored hash"
+    failed = [alg.upper() for alg, *_, match in results if not match]
+    if failed:
+        return FAIL, f"{', '.join(failed)} mismatch"
+    return PASS, ""
+
+
+def _row_bytes(row):
+    """Size recorded at scan time ("12.3 KB"), for the progress estimate."""
+    try:
+        return int(float(str(row.get('size', '0')).split()[0]) * 1024)
+    except (ValueError, IndexError):
+        return 0
+
+
+class VerifyProgress:
+    """Thread-safe counters of a verification run; rates are since start."""
+    def __init__(self, total_files, total_bytes):
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.files = 0
+        self.bytes = 0
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add_bytes(self, n):
+        with self._lock:
+            self.bytes += n
+
+    def file_done(self):
+        with self._lock:
+            self.files += 1
+
+    def rate(self):
+        """Bytes per second so far."""
+        elapsed = time.monotonic() - self.started
+        return self.bytes / elapsed if elapsed > 0 else 0
+
+    def eta(self):
+        """Seconds left at the current rate, or None until there is one."""
+        rate = self.rate()
+        if not rate:
+            return None
+        return max(self.total_bytes - self.bytes, 0) / rate
+
+    def describe(self):
+        text = f"{self.files}/{self.total_files} files | {self.rate() / (1024 * 1024):.1f} MB/s"
+        eta = self.eta()
+        if eta is not None and self.files < self.total_files:
+            minutes, seconds = divmod(int(eta), 60)
+            text += f" | ETA {minutes}m {seconds:02d}s"
+        return text
+
+
+def verify_rows(rows, workers=VERIFY_WORKERS, progress=None, should_stop=None):
+    """
+    Yield (index, row, status, detail) for each of `rows` as it is verified
+    (completion order); status is PASS, FAIL, ERROR or SKIP. Pass a VerifyProgress
+    built with plan_progress() to follow the run; should_stop() abandons it.
+    """
+    stop = should_stop or (lambda: False)
+    on_bytes = progress.add_bytes if progress else None
+
+    def finish(idx, row, status, detail=""):
+        if progress: progress.file_done()
+        return (idx, row, status, detail)
+
+    def verify_file(idx, row):
+        try:
+            return [finish(idx, row, *_verdict(row, hash_file(row['full_path'], progress=on_bytes)))]
+        except Exception as e:
+            return [finish(idx, row, ERROR, str(e))]
+
+    def verify_container(container, members):
+        # One open of the outer archive serves all of its members
+        try:
+            z = zipfile.ZipFile(container, 'r')
+        except Exception as e:
+            return [finish(idx, row, ERROR, str(e)) for idx, row, _ in members]
+        results = []
+        with z:
+            for idx, row, chain in members:
+                if stop(): break
+                try:
+                    with open_members(z, chain, limit=0) as f:
+                        results.append(finish(idx, row, *_verdict(row, _hash_member(f, on_bytes))))
+                except Exception as e:
+                    results.append(finish(idx, row, ERROR, str(e)))
+        return results
+
+    containers = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="verify") as pool:
+        futures = []
+        for idx, row in enumerate(rows, 1):
+            if not row.get('md5'):
+                yield finish(idx, row, SKIP, "Not hashed (triage row)")
+                continue
+            container, chain = split_nested(row['full_path'])
+            if not chain:
+                futures.append(pool.submit(verify_file, idx, row))
+            else:
+                containers.setdefault(container, []).append((idx, row, chain))
+        for container, members in containers.items():
+            futures.append(pool.submit(verify_container, container, members))
+
+        try:
+            for future in as_completed(futures):
+                yield from future.result()
+                if stop(): break
+        finally:
+            for future in futures: future.cancel()
+
+
+def plan_progress(rows):
+    """VerifyProgress sized from the rows' recorded sizes (no extra stat calls)."""
+    return VerifyProgress(len(rows), sum(_row_bytes(r) for r in rows))
@@ -0,0 +1,89 @@
+"""
+Watchdog
+Thread-safe time budgets for file and analyzer scans.
+Replaces SIGALRM, which only works on the main thread and is shared by the
+whole process, so parallel scans clobbered each other's alarms.
+"""
+import threading
+import time
+
+# Default budgets (seconds)
+FILE_TIMEOUT = 300       # Whole deep scan of one document
+ANALYZER_TIMEOUT = 60    # A single analyzer's run()
+OPEN_TIMEOUT = 5         # Opening the archive (cloud files can block here)
+
+
+class ScanTimeout(BaseException):
+    """
+    Raised when a file or analyzer exceeds its time budget. A BaseException,
+    like KeyboardInterrupt, so an analyzer's `except Exception` cannot swallow
+    it; catch it by name where a timeout is handled.
+    """
+    def __init__(self, label, seconds):
+        super().__init__(f"{label} exceeded its {seconds:g}s time budget")
+        self.label = label
+        self.seconds = seconds
+
+
+class Deadline:
+    """
+    Cooperative time budget. Long-running loops (XML parsing, decompression,
+    streaming) call check(), which raises ScanTimeout once the budget - or the
+    budget of any parent - is spent. Safe to use from any thread or process.
+    """
+    def __init__(self, seconds, label='scan', parent=None):
+        self.seconds = seconds
+        self.label = label
+        self.parent = parent
+        self.expires = time.monotonic() + seconds
+        self._cancelled = threading.Event()
+
+    def child(self, seconds, label):
+        """A nested budget that also expires when this one does."""
+        return Deadline(seconds, label, parent=self)
+
+    def cancel(self):
+        """Force the budget to expire (e.g. the window was closed)."""
+        self._cancelled.set()
+
+    def remaining(self):
+        own = max(0.0, self.expires - time.monotonic())
+        if self._cancelled.is_set():
+            own = 0.0
+        if self.parent is not None:
+            return min(own, self.parent.remaining())
+        return own
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def check(self):
+        """Raise ScanTimeout naming the outermost budget that has run out."""
+        if self.parent is not None:
+            self.parent.check()
+        if self._cancelled.is_set() or time.monotonic() >= self.expires:
+            raise ScanTimeout(self.label, self.seconds)
+
+
+def run_with_timeout(func, seconds, label, *args):
+    """
+    Run a blocking call (e.g. opening a file on a slow share) on a helper
+    thread and stop waiting after `seconds`. Works from any thread.
+    The helper cannot be killed; it is a daemon and is simply abandoned.
+    """
+    result = {}
+
+    def target():
+        try:
+            result['value'] = func(*args)
+        except BaseException as e:
+            result['error'] = e
+
+    worker = threading.Thread(target=target, name=f"watchdog: {label}", daemon=True)
+    worker.start()
+    worker.join(seconds)
+    if worker.is_alive():
+        raise ScanTimeout(label, seconds)
+    if 'error' in result:
+        raise result['error']
+    return result.get('value')
@@ -180,10 +180,9 @@ class ForensicTable(ctk.CTkFrame):
                 # CLEAN DISPLAY LOGIC
                 if key == "deep_output":
                     # Show a neat placeholder instead of matrix code
-                    raw_val = row.get('deep_output_raw', '')
-                    if raw_val:
-                        line_count = len(raw_val.split('\n'))
-                        text_val = f"📄 Report Ready ({line_count} lines)"
+                    report = row.get('deep_report')
+                    if report is not None:
+                        text_val = f"📄 {report.summary()}"
                     else:
                         text_val = ""
                 elif key == "threats":
@@ -48,8 +48,8 @@ def export_to_excel(table_data, columns):
             row_values = []
             for c in columns:
                 key = c["key"]
-                # Use the FULL raw text for the export (not the "View Report" placeholder)
-                val = row.get('deep_output_raw', '') if key == 'deep_output' else row.get(key, "")
+                # Use the FULL report text for the export (not the table's summary)
+                val = _report_text(row) if key == 'deep_output' else row.get(key, "")
                 row_values.append(clean_text(str(val)))
             ws.append(row_values)
 
@@ -70,6 +70,8 @@ def export_to_excel(table_data, columns):
             # Cap width at 80 to prevent massive columns
             ws.column_dimensions[column_letter].width = min(max_len + 2, 80)
 
+        _write_findings_sheet(wb, table_data)
+
         wb.save(path)
 
         if messagebox.askyesno("Export Successful", "Data exported successfully!\n\nOpen containing folder?"):
@@ -78,6 +80,33 @@ def export_to_excel(table_data, columns):
     except Exception as e:
         messagebox.showerror("Export Error", f"Failed to save file:\n{str(e)}")
 
+def _report_text(row):
+    """Full deep scan report of a row, or its status text if it has none."""
+    report = row.get('deep_report')
+    return report.render() if report is not None else row.get('deep_output', "")
+
+def _write_findings_sheet(wb, table_data):
+    """
+    One row per finding from the deep scan reports, printed 'text' lines
+    included (metadata tables, RSID timelines and ExifTool dumps are still
+    printed by their analyzers). Section headings are left out: they are
+    the Category column.
+    """
+    ws = wb.create_sheet("Findings")
+    ws.append(["Filename", "Full Path", "Severity", "Category", "Message", "Evidence"])
+    for row in table_data:
+        report = row.get('deep_report')
+        if report is None: continue
+        for f in report:
+            if f.severity == 'section': continue
+            evidence = f.evidence
+            if isinstance(evidence, list): evidence = "\n".join(evidence)
+            ws.append([clean_text(str(v)) for v in (row.get('filename', ''), row.get('full_path', ''),
+                                                     f.severity.upper(), f.category, f.message, evidence or '')])
+    ws.freeze_panes = 'A2'
+    for letter, width in zip("ABCDEF", (30, 50, 10, 30, 80, 60)):
+        ws.column_dimensions[letter].width = width
+
 def _open_folder(path):
     try:
         if platform.system() == "Windows": os.startfile(path)
@@ -1,4 +1,7 @@
 import sys
+import threading
+from contextlib import contextmanager
+from core.findings import Report, Finding
 
 # Namespaces for OOXML parsing (Word, Excel, PowerPoint)
 NS = {
@@ -33,11 +36,79 @@ GREEN = "\033[32m"
 YELLOW = "\033[33m"
 BLUE = "\033[34m"
 
+# --- Per-scan report sinks ---
+# Each deep scan captures its analyzers' output into its own sink (normally a
+# core.findings.Report). The sink is thread-local, so concurrent scans never
+# see each other's output; bare print() calls reach it through StdoutRouter.
+_local = threading.local()
+
+class StdoutRouter:
+    """sys.stdout replacement that writes to the calling thread's sink, if any."""
+    def __init__(self, fallback):
+        self.fallback = fallback
+
+    def write(self, text):
+        return current_sink().write(text)
+
+    def flush(self):
+        current_sink().flush()
+
+    def isatty(self):
+        sink = getattr(_local, 'sink', None)
+        if sink is not None:
+            return False
+        return hasattr(self.fallback, 'isatty') and self.fallback.isatty()
+
+    def __getattr__(self, name):
+        return getattr(self.fallback, name)
+
+def install_stdout_router():
+    """Route sys.stdout through the per-thread sinks (idempotent)."""
+    if not isinstance(sys.stdout, StdoutRouter):
+        sys.stdout = StdoutRouter(sys.stdout)
+
+def current_sink():
+    """The calling thread's report sink, or the real stdout outside a capture."""
+    sink = getattr(_local, 'sink', None)
+    if sink is not None:
+        return sink
+    if isinstance(sys.stdout, StdoutRouter):
+        return sys.stdout.fallback
+    return sys.stdout
+
+@contextmanager
+def capture_output(sink=None):
+    """Send this thread's output to `sink` (a new Report by default); nests."""
+    sink = sink if sink is not None else Report()
+    previous = getattr(_local, 'sink', None)
+    _local.sink = sink
+    try:
+        yield sink
+    finally:
+        _local.sink = previous
+
+def emit_finding(severity, message, evidence=None, category=None):
+    """Record a structured finding; printed as text outside a Report capture."""
+    sink = current_sink()
+    if isinstance(sink, Report):
+        sink.add(severity, message, evidence, category)
+    else:
+        print(_strip_ansi(Finding(severity, category, message, evidence).render()), file=sink)
+
+def _emit(severity, color, msg):
+    sink = current_sink()
+    if isinstance(sink, Report):
+        sink.add(severity, msg)
+    else:
+        prefix = Finding(severity, None, '').render().strip()
+        print(_strip_ansi(f"{color}{prefix}{RESET} {msg}"), file=sink)
+
 def _strip_ansi(text):
     """Strip ANSI color codes when output is redirected (not a terminal)."""
     import re
-    # Check if stdout is a real terminal
-    if hasattr(sys.stdout, 'isatty') and callable(sys.stdout.isatty) and sys.stdout.isatty():
+    # Check if the destination is a real terminal
+    out = current_sink()
+    if hasattr(out, 'isatty') and callable(out.isatty) and out.isatty():
         return text  # Keep colors for terminal
     else:
         # Strip ANSI codes when redirected to GUI or file
@@ -45,16 +116,16 @@ def _strip_ansi(text):
 
 def log_info(msg):
     """Prints an info message in Blue."""
-    print(_strip_ansi(f"{BLUE}[INFO]{RESET} {msg}"))
+    _emit("info", BLUE, msg)
 
 def log_success(msg):
     """Prints a success message in Green."""
-    print(_strip_ansi(f"{GREEN}[PASS]{RESET} {msg}"))
+    _emit("pass", GREEN, msg)
 
 def log_warning(msg):
     """Prints a warning message in Yellow."""
-    print(_strip_ansi(f"{YELLOW}[WARN]{RESET} {msg}"))
+    _emit("warn", YELLOW, msg)
 
 def log_danger(msg):
     """Prints an alert message in Red."""
-    print(_strip_ansi(f"{RED}[ALERT]{RESET} {msg}"))
\ No newline at end of file
+    _emit("alert", RED, msg)
@@ -32,6 +32,8 @@ The main dashboard provides a high-level forensic overview. Here is what every c
 
 • MD5 HASH: The cryptographic fingerprint of the file.
 
+• SHA-256: Court-grade fingerprint of the same content (SHA-1 is also recorded). Computed in the same read as the MD5.
+
 [H2]B. IDENTITY & ORIGIN
 • File Name: The name of the file on disk.
 • Full Path: The absolute location of the file.